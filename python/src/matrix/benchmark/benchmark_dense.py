@@ -3,8 +3,10 @@ import time
 import csv
 import os
 import psutil
+from python.src.matrix.dense.autotune import get_tuner
 from python.src.matrix.dense.matrix import DenseMatrix
 from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+from python.src.matrix.dense.utils import relative_error
 
 
 def get_process_memory_mb():
@@ -12,7 +14,11 @@ def get_process_memory_mb():
     return process.memory_info().rss / (1024 * 1024)
 
 
-def run_benchmark(algorithm_name, multiply_func, generate_func, sizes, runs, writer):
+def reference_float64(A, B):
+    return A.data.astype('float64') @ B.data.astype('float64')
+
+
+def run_benchmark(algorithm_name, multiply_func, generate_func, sizes, runs, writer, dtype='float64', reference_func=None):
     print(f"\nBenchmarking: {algorithm_name}")
     
     for size in sizes:
@@ -20,6 +26,7 @@ def run_benchmark(algorithm_name, multiply_func, generate_func, sizes, runs, wri
         
         times = []
         memories = []
+        errors = []
         
         for run in range(1, runs + 1):
             A, B = generate_func(size)
@@ -38,18 +45,31 @@ def run_benchmark(algorithm_name, multiply_func, generate_func, sizes, runs, wri
             times.append(time_seconds)
             memories.append(memory_mb)
             
-            writer.writerow([algorithm_name, size, run, time_seconds, memory_mb])
+            error = ""
+            if reference_func is not None:
+                error = relative_error(result.data, reference_func(A, B))
+                errors.append(error)
+            
+            writer.writerow([algorithm_name, size, run, time_seconds, memory_mb, dtype, error])
         
         avg_time = sum(times) / len(times)
         avg_memory = sum(memories) / len(memories)
-        print(f"Avg: {avg_time:.4f}s, {avg_memory:.2f}MB")
+        error_text = f", rel. error {max(errors):.2e}" if errors else ""
+        print(f"Avg: {avg_time:.4f}s, {avg_memory:.2f}MB{error_text}")
+
+
 
+CSV_HEADER = ["Algorithm", "Size", "Run", "TimeSeconds", "MemoryMB", "DType", "RelativeError"]
 
 
-def run_all_benchmarks(sizes, runs, csv_path):    
+def run_all_benchmarks(sizes, runs, csv_path, numpy_dtypes=('float64', 'float32')):    
     with open(csv_path, 'w', newline='') as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerow(["Algorithm", "Size", "Run", "TimeSeconds", "MemoryMB"])
+        writer.writerow(CSV_HEADER)
+        
+        # Strassen and Winograd read tuned cutoffs; tune missing buckets here, outside the timed runs.
+        get_tuner().warm('DenseMatrix', sizes, ['cutoff', 'winograd_cutoff'])
+        get_tuner().warm('DenseMatrixNumPy', sizes, ['cutoff'])
         
         print("\nPYTHON PURE ALGORITHMS")
         
@@ -57,14 +77,117 @@ def run_all_benchmarks(sizes, runs, csv_path):
         run_benchmark("Row-Oriented", lambda A, B: A.multiply_row_oriented(B), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
         run_benchmark("Tiled-32", lambda A, B: A.multiply_tiled(B, 32), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
         run_benchmark("Tiled-64", lambda A, B: A.multiply_tiled(B, 64), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
+        run_benchmark("Tiled-32-Micro4x4", lambda A, B: A.multiply_tiled(B, 32, (4, 4)), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
+        run_benchmark("Tiled-64-Micro4x4", lambda A, B: A.multiply_tiled(B, 64, (4, 4)), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
+        run_benchmark("Recursive", lambda A, B: A.multiply_recursive(B), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
+        run_benchmark("Recursive-Morton", lambda A, B: A.multiply_recursive(B, morton=True), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
         run_benchmark("Strassen", lambda A, B: A.multiply_strassen(B), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
+        run_benchmark("Strassen-Winograd", lambda A, B: A.multiply_winograd(B), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
+        run_benchmark(f"Parallel-{os.cpu_count()}", lambda A, B: A.multiply_parallel(B), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), sizes, runs, writer)
         
         print("\nNUMPY ALGORITHMS")
 
-        run_benchmark("NumPy-builtin", lambda A, B: A.multiply_builtin(B), lambda n: (DenseMatrixNumPy.random(n), DenseMatrixNumPy.random(n)), sizes, runs, writer)
-        run_benchmark("NumPy-matmul", lambda A, B: A.multiply_matmul(B), lambda n: (DenseMatrixNumPy.random(n), DenseMatrixNumPy.random(n)), sizes, runs, writer)
+        for dtype in numpy_dtypes:
+            print(f"\n  dtype: {dtype}")
+            generate = lambda n, dtype=dtype: (DenseMatrixNumPy.random(n, dtype), DenseMatrixNumPy.random(n, dtype))
+            reference = None if dtype == 'float64' else reference_float64
+            
+            run_benchmark("NumPy-builtin", lambda A, B: A.multiply_builtin(B), generate, sizes, runs, writer, dtype, reference)
+            run_benchmark("NumPy-matmul", lambda A, B: A.multiply_matmul(B), generate, sizes, runs, writer, dtype, reference)
+            run_benchmark("NumPy-Tiled-64", lambda A, B: A.multiply_tiled(B, 64), generate, sizes, runs, writer, dtype, reference)
+            run_benchmark(f"NumPy-Tiled-64-Threads-{os.cpu_count()}", lambda A, B: A.multiply_tiled(B, 64, workers=os.cpu_count()), generate, sizes, runs, writer, dtype, reference)
+            run_benchmark("NumPy-Recursive", lambda A, B: A.multiply_recursive(B), generate, sizes, runs, writer, dtype, reference)
+            run_benchmark("NumPy-Recursive-Morton", lambda A, B: A.multiply_recursive(B, morton=True), generate, sizes, runs, writer, dtype, reference)
+            run_benchmark("NumPy-Strassen", lambda A, B: A.multiply_strassen(B), generate, sizes, runs, writer, dtype, reference)
+            run_benchmark(f"NumPy-Strassen-Threads-{min(7, os.cpu_count())}", lambda A, B: A.multiply_strassen(B, workers=min(7, os.cpu_count())), generate, sizes, runs, writer, dtype, reference)
+        
+        print("\nNUMPY MIXED PRECISION")
+        
+        generate = lambda n: (DenseMatrixNumPy.random(n), DenseMatrixNumPy.random(n))
+        run_benchmark("NumPy-Mixed-Accumulate", lambda A, B: A.multiply_mixed_precision(B, 'accumulate'), generate, sizes, runs, writer, 'mixed', reference_float64)
+        run_benchmark("NumPy-Mixed-Refine", lambda A, B: A.multiply_mixed_precision(B, 'refine'), generate, sizes, runs, writer, 'mixed', reference_float64)
+
+def cache_sizes_bytes():
+    sizes = {}
+    cache_dir = "/sys/devices/system/cpu/cpu0/cache"
+    try:
+        for entry in sorted(os.listdir(cache_dir)):
+            with open(os.path.join(cache_dir, entry, "level")) as f:
+                level = int(f.read())
+            with open(os.path.join(cache_dir, entry, "type")) as f:
+                if f.read().strip() == "Instruction":
+                    continue
+            with open(os.path.join(cache_dir, entry, "size")) as f:
+                text = f.read().strip()
+            multiplier = {'K': 1024, 'M': 1024 * 1024}.get(text[-1], 1)
+            sizes[f"L{level}"] = int(text.rstrip('KM')) * multiplier
+    except (OSError, ValueError):
+        pass
+    return sizes or {'L1': 32 * 1024, 'L2': 1024 * 1024, 'L3': 32 * 1024 * 1024}
+
+
+def cache_boundary_sizes(cache_bytes, element_bytes=8):
+    # Sizes just below and above the point where A, B and C together fill the cache.
+    boundaries = {}
+    for level, size in cache_bytes.items():
+        n = int((size / (3 * element_bytes)) ** 0.5)
+        boundaries[level] = [max(8, int(n * 0.7)), n, int(n * 1.4)]
+    return boundaries
+
+
+def run_cache_sweep(runs, csv_path, max_pure_size=512):
+    boundaries = cache_boundary_sizes(cache_sizes_bytes())
+    
+    with open(csv_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_HEADER)
+        
+        print("\nCACHE BOUNDARY SWEEP")
+        for level, level_sizes in boundaries.items():
+            print(f"  {level}: {level_sizes}")
+        
+        sizes = sorted({size for level_sizes in boundaries.values() for size in level_sizes})
+        pure_sizes = [size for size in sizes if size <= max_pure_size]
+        
+        run_benchmark("Tiled-32", lambda A, B: A.multiply_tiled(B, 32), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), pure_sizes, runs, writer)
+        run_benchmark("Tiled-64", lambda A, B: A.multiply_tiled(B, 64), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), pure_sizes, runs, writer)
+        run_benchmark("Recursive", lambda A, B: A.multiply_recursive(B), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), pure_sizes, runs, writer)
+        run_benchmark("Recursive-Morton", lambda A, B: A.multiply_recursive(B, morton=True), lambda n: (DenseMatrix.random(n), DenseMatrix.random(n)), pure_sizes, runs, writer)
+        
+        run_benchmark("NumPy-Tiled-32", lambda A, B: A.multiply_tiled(B, 32), lambda n: (DenseMatrixNumPy.random(n), DenseMatrixNumPy.random(n)), sizes, runs, writer)
         run_benchmark("NumPy-Tiled-64", lambda A, B: A.multiply_tiled(B, 64), lambda n: (DenseMatrixNumPy.random(n), DenseMatrixNumPy.random(n)), sizes, runs, writer)
-        run_benchmark("NumPy-Strassen", lambda A, B: A.multiply_strassen(B), lambda n: (DenseMatrixNumPy.random(n), DenseMatrixNumPy.random(n)), sizes, runs, writer)
+        run_benchmark("NumPy-Recursive", lambda A, B: A.multiply_recursive(B), lambda n: (DenseMatrixNumPy.random(n), DenseMatrixNumPy.random(n)), sizes, runs, writer)
+        run_benchmark("NumPy-Recursive-Morton", lambda A, B: A.multiply_recursive(B, morton=True), lambda n: (DenseMatrixNumPy.random(n), DenseMatrixNumPy.random(n)), sizes, runs, writer)
+
+
+def run_parallel_sweep(sizes, workers_list, runs, csv_path):
+    with open(csv_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Algorithm", "Size", "Workers", "TimeSeconds", "Speedup", "Efficiency"])
+        
+        print("\nPARALLEL WORKER SWEEP")
+        
+        for size in sizes:
+            A, B = DenseMatrix.random(size), DenseMatrix.random(size)
+            
+            # Speedup is against the serial kernel the workers run, as in the sparse sweep.
+            start = time.perf_counter()
+            A.multiply_row_oriented(B)
+            baseline = time.perf_counter() - start
+            
+            for workers in workers_list:
+                times = []
+                for run in range(runs):
+                    start = time.perf_counter()
+                    A.multiply_parallel(B, workers=workers)
+                    times.append(time.perf_counter() - start)
+                
+                avg_time = sum(times) / len(times)
+                speedup = baseline / avg_time
+                efficiency = speedup / workers
+                
+                writer.writerow(["Parallel", size, workers, round(avg_time, 6), round(speedup, 3), round(efficiency, 3)])
+                print(f"Size {size}×{size}, {workers} workers: {avg_time:.4f}s, speedup {speedup:.2f}x, efficiency {efficiency * 100:.0f}%")
 
 
 if __name__ == "__main__":
@@ -90,3 +213,16 @@ if __name__ == "__main__":
     run_all_benchmarks(sizes, runs, csv_path)
 
     print(f"Results saved at: {csv_path}")
+    
+    workers_list = [w for w in [1, 2, 4, 8, 16, 32] if w <= (os.cpu_count() or 1)]
+    parallel_csv_path = os.path.join(output_directory, "dense_parallel.csv")
+    
+    run_parallel_sweep([256, 512, 1024], workers_list, runs, parallel_csv_path)
+    
+    print(f"Parallel sweep saved at: {parallel_csv_path}")
+    
+    cache_csv_path = os.path.join(output_directory, "dense_cache_sweep.csv")
+    
+    run_cache_sweep(runs, cache_csv_path)
+    
+    print(f"Cache sweep saved at: {cache_csv_path}")
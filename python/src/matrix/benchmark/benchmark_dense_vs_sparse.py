@@ -1,5 +1,6 @@
 import sys
 import time
+import random
 import csv
 import os
 import psutil
@@ -7,6 +8,7 @@ from python.src.matrix.dense.matrix import DenseMatrix
 from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
 from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
 from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+from python.src.matrix.sparse.workloads import FIXED_DENSITY_STRUCTURES, STRUCTURES
 
 
 def get_process_memory_mb():
@@ -25,18 +27,20 @@ def benchmark_single(name, multiply_func, A, B):
     return (end - start, max(mem_before, mem_after))
 
 
-def run_benchmark(size, sparsity, runs, writer):    
-    print(f"Size {size}×{size}, Sparsity {sparsity*100:.0f}%")
+def run_benchmark(size, sparsity, runs, writer, dtype='float64', structure='uniform'):    
+    print(f"Size {size}×{size}, Sparsity {sparsity*100:.0f}%, {dtype}, {structure}")
     
     results = {'Dense-Python': [], 'Sparse-CSR': [], 'Dense-NumPy': [], 'Sparse-SciPy': []}
     nnz_list = []
     
     for run in range(runs):
-        A_sparse_csr = SparseMatrixCSR.random(size, sparsity)
-        B_sparse_csr = SparseMatrixCSR.random(size, sparsity)
+        seed_a, seed_b = random.randrange(2 ** 32), random.randrange(2 ** 32)
         
-        A_sparse_scipy = SparseMatrixSciPy.random(size, sparsity)
-        B_sparse_scipy = SparseMatrixSciPy.random(size, sparsity)
+        A_sparse_csr = SparseMatrixCSR.structured(structure, size, sparsity, dtype=dtype, seed=seed_a)
+        B_sparse_csr = SparseMatrixCSR.structured(structure, size, sparsity, dtype=dtype, seed=seed_b)
+        
+        A_sparse_scipy = SparseMatrixSciPy.from_csr(A_sparse_csr, dtype)
+        B_sparse_scipy = SparseMatrixSciPy.from_csr(B_sparse_csr, dtype)
         
         nnz_list.append(A_sparse_csr.numbers_non_zero())
 
@@ -65,7 +69,7 @@ def run_benchmark(size, sparsity, runs, writer):
         avg_time = sum(t for t, m in measurements) / len(measurements)
         avg_mem = sum(m for t, m in measurements) / len(measurements)
         
-        writer.writerow([size, sparsity, round(actual_sparsity, 4), int(avg_nnz), algo_name, round(avg_time, 6), round(avg_mem, 2)])
+        writer.writerow([size, sparsity, round(actual_sparsity, 4), int(avg_nnz), algo_name, round(avg_time, 6), round(avg_mem, 2), dtype, structure])
     
     avg_time_dp = sum(t for t, m in results['Dense-Python']) / runs
     avg_time_sc = sum(t for t, m in results['Sparse-CSR']) / runs
@@ -88,6 +92,8 @@ if __name__ == "__main__":
     sizes = [64, 128, 256, 512, 1024, 2048]
     sparsities = [0.5, 0.7, 0.9, 0.95, 0.99]
     runs = 3
+    dtypes = ['float64', 'float32']
+    structures = list(STRUCTURES)
     
     output_directory = sys.argv[1]
     os.makedirs(output_directory, exist_ok=True)
@@ -98,15 +104,20 @@ if __name__ == "__main__":
     print(f"Sizes: {sizes}")
     print(f"Sparsity levels: {[f'{s*100:.0f}%' for s in sparsities]}")
     print(f"Runs per config: {runs}")
+    print(f"Data types: {dtypes}")
+    print(f"Structures: {structures}")
     print(f"Output: {csv_path}\n")
     
     with open(csv_path, 'w', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow(["Size", "Sparsity", "ActualSparsity", "NonZeroElements", "Algorithm", "AvgTimeSeconds", "AvgMemoryMB"])
+        writer.writerow(["Size", "Sparsity", "ActualSparsity", "NonZeroElements", "Algorithm", "AvgTimeSeconds", "AvgMemoryMB", "DType", "Structure"])
         
-        for sparsity in sparsities:
-            print(f"Sparsity {sparsity*100:.0f}%:")
-            for size in sizes:
-                run_benchmark(size, sparsity, runs, writer)
+        for structure in structures:
+            structure_sparsities = sparsities[-1:] if structure in FIXED_DENSITY_STRUCTURES else sparsities
+            for dtype in dtypes:
+                for sparsity in structure_sparsities:
+                    print(f"Sparsity {sparsity*100:.0f}%:")
+                    for size in sizes:
+                        run_benchmark(size, sparsity, runs, writer, dtype, structure)
     
     print(f"Results saved: {csv_path}")
\ No newline at end of file
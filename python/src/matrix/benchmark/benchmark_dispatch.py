@@ -0,0 +1,131 @@
+import sys
+import time
+import random
+import csv
+import os
+import psutil
+from python.src.matrix.dispatch import (CONVERSION_CSV, KERNEL_CSV, REPRESENTATIONS, CostModel, convert, decide,
+                                        multiply, numbers_non_zero)
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+STRATEGIES = {
+    'Auto': lambda A, B, model: multiply(A, B, model),
+    'Always-Dense': lambda A, B, model: convert(A, 'Dense-NumPy').multiply_matmul(convert(B, 'Dense-NumPy')),
+    'Always-Sparse': lambda A, B, model: convert(A, 'Sparse-SciPy').multiply(convert(B, 'Sparse-SciPy')),
+}
+
+
+def get_process_memory_mb():
+    process = psutil.Process(os.getpid())
+    return process.memory_info().rss / (1024 * 1024)
+
+
+def make_operand(structure, size, sparsity, representation, seed):
+    if representation in ('Dense-Python', 'Sparse-CSR'):
+        matrix = SparseMatrixCSR.structured(structure, size, sparsity, seed=seed)
+    else:
+        matrix = SparseMatrixSciPy.structured(structure, size, sparsity, seed=seed)
+    return convert(matrix, representation)
+
+
+def run_conversion_benchmark(sizes, sparsities, runs, csv_path, pure_max_size=1024):
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Source", "Target", "Rows", "Cols", "NonZeroElements", "Run", "TimeSeconds"])
+
+        for size in sizes:
+            for sparsity in sparsities:
+                print(f"Conversions: Size {size}×{size}, Sparsity {sparsity*100:.1f}%")
+                for source in REPRESENTATIONS:
+                    for target in REPRESENTATIONS:
+                        pure = {source, target} & {'Dense-Python', 'Sparse-CSR'}
+                        if source == target or (pure and size > pure_max_size):
+                            continue
+
+                        for run in range(1, runs + 1):
+                            matrix = make_operand('uniform', size, sparsity, source, random.randrange(2 ** 32))
+
+                            start = time.perf_counter()
+                            convert(matrix, target)
+                            end = time.perf_counter()
+
+                            writer.writerow([source, target, size, size, numbers_non_zero(matrix), run, round(end - start, 6)])
+
+
+def run_benchmark(structure, size, sparsity, input_representation, runs, writer, model):
+    print(f"{structure}, Size {size}×{size}, Sparsity {sparsity*100:.1f}%, {input_representation} inputs...", end=' ')
+
+    averages = {}
+
+    for run in range(1, runs + 1):
+        A = make_operand(structure, size, sparsity, input_representation, random.randrange(2 ** 32))
+        B = make_operand(structure, size, sparsity, input_representation, random.randrange(2 ** 32))
+        chosen = decide(A, B, model).kernel
+
+        for strategy, multiply_func in STRATEGIES.items():
+            mem_before = get_process_memory_mb()
+
+            start = time.perf_counter()
+            multiply_func(A, B, model)
+            end = time.perf_counter()
+
+            mem_after = get_process_memory_mb()
+            kernel = {'Auto': chosen, 'Always-Dense': 'Dense-NumPy', 'Always-Sparse': 'Sparse-SciPy'}[strategy]
+
+            writer.writerow([structure, size, sparsity, input_representation, strategy, kernel, run,
+                             round(end - start, 6), round(max(mem_before, mem_after), 2), numbers_non_zero(A)])
+            averages.setdefault(strategy, []).append(end - start)
+
+    averages = {strategy: sum(times) / len(times) for strategy, times in averages.items()}
+    best = min(averages['Always-Dense'], averages['Always-Sparse'])
+    print(", ".join(f"{strategy}: {seconds:.4f}s" for strategy, seconds in averages.items()) +
+          f" | Auto ({chosen}) vs best fixed: {averages['Auto'] / best:.2f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_dispatch.py <output_directory>")
+        print("Example: python benchmark_dispatch.py results/")
+        sys.exit(1)
+
+    conversion_sizes = [128, 512, 2048]
+    conversion_sparsities = [0.5, 0.9, 0.99]
+    sizes = [256, 1024, 2048]
+    sparsities = [0.5, 0.9, 0.99, 0.999]
+    structures = ['uniform', 'banded', 'power-law']
+    input_representations = ['Dense-NumPy', 'Sparse-SciPy']
+    runs = 3
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+
+    conversion_csv_path = os.path.join(output_directory, CONVERSION_CSV)
+    csv_path = os.path.join(output_directory, "dispatch.csv")
+
+    print("DISPATCHER vs ALWAYS-DENSE vs ALWAYS-SPARSE")
+    print(f"\nConfiguration:")
+    print(f"  Sizes: {sizes}")
+    print(f"  Sparsity levels: {[f'{s*100:.1f}%' for s in sparsities]}")
+    print(f"  Structures: {structures}")
+    print(f"  Input representations: {input_representations}")
+    print(f"  Runs per configuration: {runs}")
+    print(f"  Output: {csv_path}\n")
+
+    run_conversion_benchmark(conversion_sizes, conversion_sparsities, runs, conversion_csv_path)
+    model = CostModel.from_csv(os.path.join(output_directory, KERNEL_CSV), conversion_csv_path)
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Structure", "Size", "Sparsity", "Input", "Strategy", "Kernel", "Run", "TimeSeconds", "MemoryMB",
+                         "NonZeroElements"])
+
+        for structure in structures:
+            for input_representation in input_representations:
+                for sparsity in sparsities:
+                    for size in sizes:
+                        run_benchmark(structure, size, sparsity, input_representation, runs, writer, model)
+
+    print(f"\nConversion costs saved at: {conversion_csv_path}")
+    print(f"Results saved at: {csv_path}")
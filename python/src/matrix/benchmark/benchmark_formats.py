@@ -0,0 +1,93 @@
+import sys
+import time
+import csv
+import os
+from python.src.matrix.sparse import formats
+from python.src.matrix.sparse.formulations import INNER, OUTER, ROW_WISE
+from python.src.matrix.sparse.generators import random_csr
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+
+
+# (name, rows, inner, cols, A sparsity, B sparsity, A format, B format, mask sparsity or None)
+CASES = [
+    ('Square', 1000, 1000, 1000, 0.995, 0.995, 'csr', 'csc', None),
+    ('Square COO', 1000, 1000, 1000, 0.995, 0.995, 'coo', 'coo', None),
+    ('Short-fat × tall-skinny', 16, 50000, 16, 0.7, 0.9, 'csr', 'csc', None),
+    ('Tall-skinny × short-fat', 2000, 8, 2000, 0.5, 0.9, 'csc', 'csr', None),
+    ('Few rows × wide inner', 10, 5000, 100, 0.99, 0.99, 'csc', 'csr', None),
+    ('Masked dot products', 2000, 8, 2000, 0.5, 0.9, 'csr', 'csc', 0.98),
+    ('Masked square', 1000, 1000, 1000, 0.99, 0.99, 'csr', 'csc', 0.99),
+]
+
+
+def random_matrix(n_rows, n_cols, sparsity, seed):
+    return SparseMatrixCSR(*random_csr(n_rows, n_cols, sparsity, seed=seed), (n_rows, n_cols))
+
+
+def csr_only(A, B, mask):
+    # The CSR-only path: convert whatever the operands are to CSR, then multiply row by row.
+    return formats.convert(A, 'csr').multiply(formats.convert(B, 'csr'), mask=mask)
+
+
+def methods(mask):
+    listed = {
+        'CSR-only': lambda A, B: csr_only(A, B, mask),
+        'Auto': lambda A, B: formats.multiply(A, B, mask),
+    }
+    for formulation in [ROW_WISE, INNER, OUTER]:
+        if formulation == OUTER and mask is not None:
+            continue
+        listed[formulation.capitalize()] = lambda A, B, formulation=formulation: formats.multiply(A, B, mask, formulation)
+    return listed
+
+
+def run_benchmark(case, runs, writer):
+    name, n_rows, n_inner, n_cols, a_sparsity, b_sparsity, a_format, b_format, mask_sparsity = case
+    A = formats.convert(random_matrix(n_rows, n_inner, a_sparsity, seed=1), a_format)
+    B = formats.convert(random_matrix(n_inner, n_cols, b_sparsity, seed=2), b_format)
+    mask = random_matrix(n_rows, n_cols, mask_sparsity, seed=3) if mask_sparsity is not None else None
+    decision = formats.choose_formulation(A, B, mask)
+
+    print(f"{name}: {n_rows}×{n_inner} ({a_format}) × {n_inner}×{n_cols} ({b_format}), "
+          f"{decision.profile.flops:,} flops, chosen: {decision.formulation}")
+
+    for method, multiply in methods(mask).items():
+        times = []
+        for run in range(1, runs + 1):
+            start = time.perf_counter()
+            result = multiply(A, B)
+            times.append(time.perf_counter() - start)
+            writer.writerow([name, n_rows, n_inner, n_cols, a_format, b_format, mask is not None, method,
+                             decision.formulation, run, round(times[-1], 6), result.numbers_non_zero(), decision.profile.flops])
+
+        print(f"  {method}: {min(times):.4f}s")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_formats.py <output_directory>")
+        print("Example: python benchmark_formats.py results/")
+        sys.exit(1)
+
+    runs = 3
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+
+    csv_path = os.path.join(output_directory, "formats.csv")
+
+    print("SPARSE FORMATS AND FORMULATIONS BENCHMARK (CSR, CSC, COO)")
+    print(f"\nConfiguration:")
+    print(f"  Cases: {[case[0] for case in CASES]}")
+    print(f"  Runs per configuration: {runs}")
+    print(f"  Output: {csv_path}\n")
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Case", "Rows", "Inner", "Cols", "AFormat", "BFormat", "Masked", "Method", "ChosenFormulation",
+                         "Run", "TimeSeconds", "ResultNonZeros", "Flops"])
+
+        for case in CASES:
+            run_benchmark(case, runs, writer)
+
+    print(f"\nResults saved at: {csv_path}")
@@ -0,0 +1,116 @@
+import sys
+import time
+import csv
+import os
+import tracemalloc
+import numpy as np
+from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+def transposed_csr(A):
+    # Explicit transpose as a second CSR operand, the way A × Aᵀ was computed before gram().
+    transposed = SparseMatrixSciPy.from_csr(A).matrix.T.tocsr()
+    return SparseMatrixCSR(transposed.data.tolist(), transposed.indices.tolist(), transposed.indptr.tolist(),
+                           transposed.shape)
+
+
+METHODS = {
+    'Sparse-CSR': {
+        'Explicit transpose': lambda A: A.multiply(transposed_csr(A)),
+        'multiply_transpose': lambda A: A.multiply_transpose(SparseMatrixCSR(A.values, A.col_index, A.row_ptr, A.shape)),
+        'gram': lambda A: A.gram(),
+        'gram (upper)': lambda A: A.gram(upper=True),
+    },
+    'Sparse-SciPy': {
+        'Explicit transpose': lambda A: A.multiply(SparseMatrixSciPy(A.matrix.T.tocsr())),
+        'gram': lambda A: A.gram(),
+        'gram (upper)': lambda A: A.gram(upper=True),
+    },
+    'Dense-NumPy': {
+        'Explicit transpose': lambda A: A.multiply_matmul(DenseMatrixNumPy(A.data.T)),
+        'gram': lambda A: A.gram(),
+        'gram (upper)': lambda A: A.gram(upper=True),
+    },
+}
+
+
+def stored_entries(result):
+    if isinstance(result, DenseMatrixNumPy):
+        return int(np.count_nonzero(result.data))
+    return result.numbers_non_zero()
+
+
+def measure(method, matrix):
+    start = time.perf_counter()
+    result = method(matrix)
+    end = time.perf_counter()
+
+    tracemalloc.start()
+    method(matrix)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, round(end - start, 6), round(peak / (1024 * 1024), 3)
+
+
+def run_benchmark(size, sparsity, runs, writer, pure_max_size, dense_max_size):
+    print(f"Size {size}×{size}, Sparsity {sparsity*100:.2f}%")
+
+    csr = SparseMatrixCSR.random(size, sparsity, seed=size)
+    matrices = {
+        'Sparse-CSR': csr,
+        'Sparse-SciPy': SparseMatrixSciPy.from_csr(csr, copy=True),
+        'Dense-NumPy': DenseMatrixNumPy(SparseMatrixSciPy.from_csr(csr).to_dense(), copy=False),
+    }
+    limits = {'Sparse-CSR': pure_max_size, 'Sparse-SciPy': size, 'Dense-NumPy': dense_max_size}
+
+    for representation, methods in METHODS.items():
+        if size > limits[representation]:
+            continue
+
+        for method, multiply in methods.items():
+            times = []
+            for run in range(1, runs + 1):
+                result, time_seconds, peak_mb = measure(multiply, matrices[representation])
+                writer.writerow([representation, method, size, sparsity, run, time_seconds, stored_entries(result), peak_mb])
+                times.append(time_seconds)
+
+            print(f"  {representation} {method}: {sum(times) / len(times):.6f}s, "
+                  f"{stored_entries(result):,} stored, peak {peak_mb:.2f}MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_gram.py <output_directory>")
+        print("Example: python benchmark_gram.py results/")
+        sys.exit(1)
+
+    sizes = [512, 1024, 2048, 4096]
+    sparsities = [0.95, 0.99]
+    pure_max_size = 2048
+    dense_max_size = 4096
+    runs = 3
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+
+    csv_path = os.path.join(output_directory, "gram.csv")
+
+    print("GRAM MATRIX (A × Aᵀ) BENCHMARK")
+    print(f"\nConfiguration:")
+    print(f"  Sizes: {sizes} (pure CSR up to {pure_max_size}, dense up to {dense_max_size})")
+    print(f"  Sparsity levels: {[f'{s*100:.2f}%' for s in sparsities]}")
+    print(f"  Runs per configuration: {runs}")
+    print(f"  Output: {csv_path}\n")
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Representation", "Method", "Size", "Sparsity", "Run", "TimeSeconds", "StoredNonZeros", "PeakAllocatedMB"])
+
+        for sparsity in sparsities:
+            for size in sizes:
+                run_benchmark(size, sparsity, runs, writer, pure_max_size, dense_max_size)
+
+    print(f"\nResults saved at: {csv_path}")
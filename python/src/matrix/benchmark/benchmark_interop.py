@@ -0,0 +1,95 @@
+import sys
+import time
+import csv
+import os
+import tracemalloc
+import numpy as np
+from python.src.matrix.sparse.interop import as_numpy
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+CONVERSIONS = {
+    'CSR-List -> SciPy (via dense)': ('list', lambda m: SparseMatrixSciPy.from_dense(np.array(m.to_dense()))),
+    'CSR-List -> SciPy': ('list', lambda m: SparseMatrixSciPy.from_csr(m)),
+    'CSR-Compact -> SciPy (copy)': ('compact', lambda m: SparseMatrixSciPy.from_csr(m, copy=True)),
+    'CSR-Compact -> SciPy (zero-copy)': ('compact', lambda m: SparseMatrixSciPy.from_csr(m)),
+    'SciPy -> CSR-List': ('scipy', lambda m: SparseMatrixCSR(m.matrix.data.tolist(), m.matrix.indices.tolist(),
+                                                              m.matrix.indptr.tolist(), m.shape)),
+    'SciPy -> CSR-Compact (copy)': ('scipy', lambda m: m.to_csr_pure(copy=True)),
+    'SciPy -> CSR-Compact (zero-copy)': ('scipy', lambda m: m.to_csr_pure()),
+}
+
+
+def values_array(matrix):
+    return matrix.matrix.data if isinstance(matrix, SparseMatrixSciPy) else as_numpy(matrix.values)
+
+
+def measure(convert, matrix):
+    start = time.perf_counter()
+    convert(matrix)
+    end = time.perf_counter()
+
+    # Allocation tracing slows Python-level allocations, so the peak comes from a second call.
+    tracemalloc.start()
+    converted = convert(matrix)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    shared = bool(np.shares_memory(values_array(matrix), values_array(converted)))
+    return round(end - start, 6), round(peak / (1024 * 1024), 3), shared
+
+
+def run_benchmark(size, sparsity, runs, writer, dense_max_size):
+    print(f"Size {size}×{size}, Sparsity {sparsity*100:.2f}%")
+
+    csr = SparseMatrixCSR.random(size, sparsity, seed=size)
+    sources = {'list': csr, 'compact': csr.to_compact(), 'scipy': SparseMatrixSciPy.from_csr(csr, copy=True)}
+
+    for conversion, (source, convert) in CONVERSIONS.items():
+        if 'via dense' in conversion and size > dense_max_size:
+            continue
+
+        times = []
+        for run in range(1, runs + 1):
+            time_seconds, peak_mb, shared = measure(convert, sources[source])
+            writer.writerow([conversion, size, sparsity, csr.numbers_non_zero(), run, time_seconds, peak_mb, shared])
+            times.append(time_seconds)
+
+        print(f"  {conversion}: {sum(times) / len(times):.6f}s, peak {peak_mb:.2f}MB{', shares memory' if shared else ''}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_interop.py <output_directory>")
+        print("Example: python benchmark_interop.py results/")
+        sys.exit(1)
+
+    sizes = [1024, 4096, 16384, 65536]
+    sparsities = [0.99, 0.999]
+    dense_max_size = 4096
+    runs = 3
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+
+    csv_path = os.path.join(output_directory, "sparse_interop.csv")
+
+    print("CSR <-> SCIPY CONVERSION BENCHMARK")
+    print(f"\nConfiguration:")
+    print(f"  Sizes: {sizes} (via dense up to {dense_max_size})")
+    print(f"  Sparsity levels: {[f'{s*100:.2f}%' for s in sparsities]}")
+    print(f"  Runs per configuration: {runs}")
+    print(f"  Output: {csv_path}\n")
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Conversion", "Size", "Sparsity", "NonZeroElements", "Run", "TimeSeconds", "PeakAllocatedMB", "SharesMemory"])
+
+        for sparsity in sparsities:
+            for size in sizes:
+                if size * size * (1 - sparsity) > 5e7:
+                    continue
+                run_benchmark(size, sparsity, runs, writer, dense_max_size)
+
+    print(f"\nResults saved at: {csv_path}")
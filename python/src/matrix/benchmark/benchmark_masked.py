@@ -0,0 +1,111 @@
+import sys
+import time
+import csv
+import os
+import tracemalloc
+import numpy as np
+from scipy.sparse import csr_matrix, tril
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+def lower_graph(n, degree, seed=None):
+    # Strictly lower triangle of a random symmetric graph: L × L masked by L counts triangles.
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, n, n * degree)
+    cols = rng.integers(0, n, n * degree)
+    graph = csr_matrix((np.ones(n * degree), (rows, cols)), shape=(n, n))
+    graph = ((graph + graph.T) > 0).astype(np.float64)
+    return SparseMatrixSciPy(tril(graph, k=-1, format='csr'))
+
+
+def post_filtered(L, top_k=None):
+    # Full product first, then the mask or the per-row top-k, as done before the filters existed.
+    C = L.matrix @ L.matrix
+    if top_k is None:
+        return SparseMatrixSciPy(C.multiply(L.matrix != 0).tocsr())
+    C.sort_indices()
+    rows = np.repeat(np.arange(C.shape[0]), np.diff(C.indptr))
+    order = np.lexsort((-np.abs(C.data), rows))
+    rank = np.arange(len(order)) - np.searchsorted(rows[order], rows[order], side='left')
+    kept = np.sort(order[rank < top_k])
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(rows[kept], minlength=C.shape[0]))))
+    return SparseMatrixSciPy(csr_matrix((C.data[kept], C.indices[kept], indptr), shape=C.shape))
+
+
+METHODS = {
+    'Full': lambda L: L.multiply(L),
+    'Full + post-mask': lambda L: post_filtered(L),
+    'Masked': lambda L: L.multiply(L, mask=L),
+    'Complement mask': lambda L: L.multiply(L, mask=L, complement=True),
+    'Full + post top-3': lambda L: post_filtered(L, top_k=3),
+    'Top-3': lambda L: L.multiply(L, top_k=3),
+    'Threshold 2': lambda L: L.multiply(L, threshold=2),
+}
+
+# Post-filtering is only benchmarked with SciPy; the pure CSR baseline is 'Full'.
+PURE_METHODS = ['Full', 'Masked', 'Complement mask', 'Top-3', 'Threshold 2']
+
+
+def measure(method, matrix):
+    start = time.perf_counter()
+    result = method(matrix)
+    end = time.perf_counter()
+
+    tracemalloc.start()
+    method(matrix)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, round(end - start, 6), round(peak / (1024 * 1024), 3)
+
+
+def run_benchmark(representation, matrix, methods, size, degree, runs, writer):
+    for method in methods:
+        times = []
+        for run in range(1, runs + 1):
+            result, time_seconds, peak_mb = measure(METHODS[method], matrix)
+            writer.writerow([representation, method, size, degree, run, time_seconds, result.numbers_non_zero(), peak_mb])
+            times.append(time_seconds)
+
+        print(f"  {representation} {method}: {sum(times) / len(times):.6f}s, "
+              f"{result.numbers_non_zero():,} stored, peak {peak_mb:.2f}MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_masked.py <output_directory>")
+        print("Example: python benchmark_masked.py results/")
+        sys.exit(1)
+
+    scipy_sizes = [50000, 100000, 200000]
+    pure_sizes = [1000, 3000]
+    degree = 10
+    runs = 3
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+
+    csv_path = os.path.join(output_directory, "masked.csv")
+
+    print("MASKED AND PRUNED SPGEMM BENCHMARK (L × L)")
+    print(f"\nConfiguration:")
+    print(f"  SciPy sizes: {scipy_sizes}, pure CSR sizes: {pure_sizes}")
+    print(f"  Graph degree: {degree}")
+    print(f"  Runs per configuration: {runs}")
+    print(f"  Output: {csv_path}\n")
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Representation", "Method", "Size", "Degree", "Run", "TimeSeconds", "StoredNonZeros", "PeakAllocatedMB"])
+
+        for size in pure_sizes:
+            print(f"Size {size}×{size}, degree {degree}")
+            L = lower_graph(size, degree, seed=size).to_csr_pure(copy=True)
+            run_benchmark('Sparse-CSR', L, PURE_METHODS, size, degree, runs, writer)
+
+        for size in scipy_sizes:
+            print(f"Size {size}×{size}, degree {degree}")
+            L = lower_graph(size, degree, seed=size)
+            run_benchmark('Sparse-SciPy', L, list(METHODS), size, degree, runs, writer)
+
+    print(f"\nResults saved at: {csv_path}")
@@ -0,0 +1,62 @@
+import sys
+import csv
+import os
+import tracemalloc
+from python.src.matrix.dense.matrix import DenseMatrix
+from python.src.matrix.dense.matrix_array import DenseMatrixArray
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+
+
+def measure_allocated_mb(generate_func):
+    tracemalloc.start()
+    matrix = generate_func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return matrix, current / (1024 * 1024), peak / (1024 * 1024)
+
+
+def run_benchmark(structure, layout, generate_func, sizes, sparsity, writer):
+    print(f"\nMeasuring: {structure} ({layout})")
+
+    for size in sizes:
+        matrix, current_mb, peak_mb = measure_allocated_mb(lambda: generate_func(size))
+        bytes_per_element = current_mb * 1024 * 1024 / (size * size)
+
+        writer.writerow([structure, layout, size, sparsity, round(current_mb, 4), round(peak_mb, 4), round(bytes_per_element, 2)])
+        print(f"  Size {size}×{size}: {current_mb:.2f}MB resident, {peak_mb:.2f}MB peak")
+
+
+def run_all_benchmarks(sizes, sparsity, csv_path):
+    with open(csv_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Structure", "Layout", "Size", "Sparsity", "MemoryMB", "PeakMemoryMB", "BytesPerElement"])
+
+        run_benchmark("Dense", "list", lambda n: DenseMatrix.random(n), sizes, 0.0, writer)
+        run_benchmark("Dense", "array", lambda n: DenseMatrixArray.random(n), sizes, 0.0, writer)
+        run_benchmark("CSR", "list", lambda n: SparseMatrixCSR.random(n, sparsity), sizes, sparsity, writer)
+        run_benchmark("CSR", "array", lambda n: SparseMatrixCSR.random(n, sparsity, compact=True), sizes, sparsity, writer)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_memory_layout.py <output_directory>")
+        print("Example: python benchmark_memory_layout.py results/")
+        sys.exit(1)
+
+    sizes = [64, 128, 256, 512, 1024]
+    sparsity = 0.9
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+
+    csv_path = os.path.join(output_directory, "memory_layout.csv")
+
+    print("MEMORY LAYOUT COMPARISON (list vs array storage)")
+    print(f"\nConfiguration:")
+    print(f"  Sizes: {sizes}")
+    print(f"  CSR sparsity: {sparsity*100:.0f}%")
+    print(f"  Output: {csv_path}")
+
+    run_all_benchmarks(sizes, sparsity, csv_path)
+
+    print(f"\nResults saved at: {csv_path}")
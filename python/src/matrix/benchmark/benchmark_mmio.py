@@ -0,0 +1,118 @@
+import sys
+import time
+import csv
+import os
+import shutil
+import tempfile
+import tracemalloc
+import numpy as np
+from scipy.io import mmread, mmwrite
+from scipy.sparse import coo_matrix, csr_matrix
+from python.src.matrix.sparse import mmio
+
+
+def load_mmread(path):
+    return csr_matrix(mmread(path))
+
+
+def load_in_memory(path):
+    return mmio.load_scipy(path, cache=False)
+
+
+def load_streaming(path):
+    return mmio.load_scipy(path, cache=False, in_memory_bytes=0)
+
+
+def load_cold_cache(path):
+    shutil.rmtree(mmio.cache_directory(path), ignore_errors=True)
+    return mmio.load_scipy(path)
+
+
+def load_warm_cache(path):
+    return mmio.load_scipy(path)
+
+
+LOADERS = {
+    'mmread + tocsr': load_mmread,
+    'In memory': load_in_memory,
+    'Streaming': load_streaming,
+    'Cache (cold)': load_cold_cache,
+    'Cache (warm)': load_warm_cache,
+}
+
+
+def write_synthetic(path, size, non_zeros, seed=0):
+    rng = np.random.default_rng(seed)
+    matrix = coo_matrix((rng.random(non_zeros), (rng.integers(0, size, non_zeros), rng.integers(0, size, non_zeros))),
+                        shape=(size, size))
+    matrix.sum_duplicates()
+    mmwrite(path, matrix)
+
+
+def measure(load, path):
+    start = time.perf_counter()
+    matrix = load(path)
+    end = time.perf_counter()
+
+    # NumPy buffers are traced too; the peak comes from a second call so tracing does not skew the time.
+    tracemalloc.start()
+    load(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return matrix, round(end - start, 6), round(peak / (1024 * 1024), 3)
+
+
+def run_benchmark(path, runs, writer):
+    header = mmio.read_header(path)
+    print(f"{os.path.basename(path)}: {header.shape[0]}×{header.shape[1]}, {header.nnz:,} entries, "
+          f"{os.path.getsize(path) / (1024 * 1024):.1f}MB")
+
+    reference = load_mmread(path)
+    for loader, load in LOADERS.items():
+        times = []
+        for run in range(1, runs + 1):
+            matrix, time_seconds, peak_mb = measure(load, path)
+            matrix = matrix if isinstance(matrix, csr_matrix) else matrix.matrix
+            matches = (matrix != reference).nnz == 0
+            writer.writerow([loader, header.shape[0], reference.nnz, run, time_seconds, peak_mb, matches])
+            times.append(time_seconds)
+
+        print(f"  {loader}: {sum(times) / len(times):.4f}s, peak {peak_mb:.2f}MB{'' if matches else ', MISMATCH'}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_mmio.py <output_directory> [mtx_path]")
+        print("Example: python benchmark_mmio.py results/ ../mc2depi/mc2depi.mtx")
+        sys.exit(1)
+
+    size = 525825
+    non_zeros = 2100225
+    runs = 3
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+
+    if len(sys.argv) > 2:
+        mtx_path = sys.argv[2]
+    else:
+        mtx_path = os.path.join(tempfile.mkdtemp(prefix="matrix_mmio_"), "synthetic.mtx")
+        print(f"Writing synthetic {size}×{size} matrix with {non_zeros:,} entries to {mtx_path}...")
+        write_synthetic(mtx_path, size, non_zeros)
+
+    csv_path = os.path.join(output_directory, "sparse_mmio.csv")
+
+    print("MATRIX MARKET LOADING BENCHMARK")
+    print(f"\nConfiguration:")
+    print(f"  Input: {mtx_path}")
+    print(f"  Chunk size: {mmio.CHUNK_BYTES // (1024 * 1024)}MB")
+    print(f"  Runs per loader: {runs}")
+    print(f"  Output: {csv_path}\n")
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Loader", "Size", "NonZeroElements", "Run", "TimeSeconds", "PeakAllocatedMB", "MatchesMmread"])
+        run_benchmark(mtx_path, runs, writer)
+
+    print(f"\nResults saved at: {csv_path}")
@@ -0,0 +1,77 @@
+import sys
+import csv
+import os
+import tempfile
+import psutil
+from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+from python.src.matrix.dense.out_of_core import create_random_memmap, multiply_out_of_core
+
+
+def get_process_memory_mb():
+    process = psutil.Process(os.getpid())
+    return process.memory_info().rss / (1024 * 1024)
+
+
+def run_benchmark(size, budget_mb, runs, scratch_directory, writer):
+    print(f"Size {size}×{size}, budget {budget_mb}MB...", end=' ')
+
+    a_path = os.path.join(scratch_directory, f"A_{size}.bin")
+    b_path = os.path.join(scratch_directory, f"B_{size}.bin")
+    c_path = os.path.join(scratch_directory, f"C_{size}.bin")
+
+    if not os.path.exists(a_path):
+        create_random_memmap(a_path, size)
+    if not os.path.exists(b_path):
+        create_random_memmap(b_path, size)
+
+    A = DenseMatrixNumPy.open(a_path, (size, size), mode='r')
+    B = DenseMatrixNumPy.open(b_path, (size, size), mode='r')
+
+    for run in range(1, runs + 1):
+        C = DenseMatrixNumPy.open(c_path, (size, size), mode='w+')
+
+        mem_before = get_process_memory_mb()
+        stats = multiply_out_of_core(A.data, B.data, C.data, budget_mb)
+        mem_after = get_process_memory_mb()
+
+        writer.writerow([size, budget_mb, run, stats['tile'], round(stats['seconds'], 6), round(stats['gflops'], 3),
+                         round(stats['io_gbps'], 3), round(stats['read_seconds'], 6), round(stats['write_seconds'], 6),
+                         round(stats['buffer_mb'], 2), round(max(mem_before, mem_after), 2)])
+
+    print(f"{stats['seconds']:.2f}s, {stats['gflops']:.2f} GFLOP/s, {stats['io_gbps']:.2f} GB/s I/O, tile {stats['tile']}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_out_of_core.py <output_directory> [scratch_directory]")
+        print("Example: python benchmark_out_of_core.py results/ /mnt/scratch")
+        sys.exit(1)
+
+    sizes = [2048, 4096, 8192]
+    budgets_mb = [64, 256, 1024]
+    runs = 1
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+    scratch_directory = sys.argv[2] if len(sys.argv) > 2 else tempfile.mkdtemp(prefix="matrix_ooc_")
+    os.makedirs(scratch_directory, exist_ok=True)
+
+    csv_path = os.path.join(output_directory, "out_of_core.csv")
+
+    print("OUT-OF-CORE DENSE MULTIPLICATION BENCHMARK")
+    print(f"\nConfiguration:")
+    print(f"  Sizes: {sizes}")
+    print(f"  Memory budgets: {budgets_mb} MB")
+    print(f"  Scratch: {scratch_directory}")
+    print(f"  Output: {csv_path}\n")
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Size", "BudgetMB", "Run", "Tile", "TimeSeconds", "GFLOPS", "IOGBps",
+                         "ReadSeconds", "WriteSeconds", "BufferMB", "MemoryMB"])
+
+        for size in sizes:
+            for budget_mb in budgets_mb:
+                run_benchmark(size, budget_mb, runs, scratch_directory, writer)
+
+    print(f"\nResults saved at: {csv_path}")
@@ -1,10 +1,17 @@
 import sys
 import time
+import random
 import csv
 import os
 import psutil
+from python.src.matrix.sparse import workloads
+from python.src.matrix.sparse.matrix_bsr import SparseMatrixBSR
+from python.src.matrix.sparse.matrix_bsr_numpy import SparseMatrixBSRNumPy
+from python.src.matrix.sparse.matrix_bsr_scipy import SparseMatrixBSRSciPy
 from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
 from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+from python.src.matrix.sparse.spgemm import PlanCache
+from python.src.matrix.sparse.workloads import FIXED_DENSITY_STRUCTURES, STRUCTURES
 
 
 def get_process_memory_mb():
@@ -12,8 +19,20 @@ def get_process_memory_mb():
     return process.memory_info().rss / (1024 * 1024)
 
 
-def run_benchmark(algorithm_name, multiply_func, generate_func, sizes, sparsities, runs, writer):
-    print(f"\nBenchmarking: {algorithm_name}")
+# Rows counted exactly by the estimator to refine its upper bound on the product's non-zeros.
+ESTIMATE_SAMPLES = 64
+
+
+def product_estimate(A, B):
+    # Multiply-adds and estimated non-zeros of A × B; SciPy operands are viewed as pure CSR without copying.
+    if isinstance(A, SparseMatrixSciPy):
+        A, B = A.to_csr_pure(), B.to_csr_pure()
+    estimate = A.estimate_multiply(B, samples=ESTIMATE_SAMPLES, seed=0)
+    return sum(estimate.flops), sum(estimate.nnz_upper), sum(estimate.nnz)
+
+
+def run_benchmark(algorithm_name, multiply_func, generate_func, sizes, sparsities, runs, writer, dtype='float64', structure='uniform'):
+    print(f"\nBenchmarking: {algorithm_name} ({structure})")
     
     for sparsity in sparsities:
         print(f"  Sparsity {sparsity*100:.0f}%:")
@@ -24,9 +43,11 @@ def run_benchmark(algorithm_name, multiply_func, generate_func, sizes, sparsitie
             times = []
             memories = []
             nnz_list = []
+            gflops_list = []
             
             for run in range(1, runs + 1):
                 A, B = generate_func(size, sparsity)
+                flops, estimated_upper, estimated_nnz = product_estimate(A, B)
                 
                 mem_before = get_process_memory_mb()
                 
@@ -40,30 +61,211 @@ def run_benchmark(algorithm_name, multiply_func, generate_func, sizes, sparsitie
                 memory_mb = round(max(mem_before, mem_after), 2)
                 nnz = A.numbers_non_zero()
                 actual_sparsity = A.get_sparsity()
+                result_nnz = result.numbers_non_zero()
+                gflops = 2 * flops / (end - start) / 1e9 if end > start else 0.0
                 
                 times.append(time_seconds)
                 memories.append(memory_mb)
                 nnz_list.append(nnz)
+                gflops_list.append(gflops)
                 
-                writer.writerow([algorithm_name, size, sparsity, run, time_seconds, memory_mb, nnz, actual_sparsity])
+                writer.writerow([algorithm_name, size, sparsity, run, time_seconds, memory_mb, nnz, actual_sparsity, dtype, structure,
+                                 flops, estimated_upper, estimated_nnz, result_nnz, round(gflops, 6)])
             
             avg_time = sum(times) / len(times)
             avg_memory = sum(memories) / len(memories)
             avg_nnz = sum(nnz_list) / len(nnz_list)
-            print(f"Avg: {avg_time:.4f}s, {avg_memory:.2f}MB, NNZ: {avg_nnz:.0f}")
+            avg_gflops = sum(gflops_list) / len(gflops_list)
+            print(f"Avg: {avg_time:.4f}s, {avg_memory:.2f}MB, NNZ: {avg_nnz:.0f}, "
+                  f"C NNZ: {result_nnz} (estimated {estimated_nnz}, bound {estimated_upper}), {avg_gflops:.4f} GFLOP/s")
 
 
-def run_all_benchmarks(sizes, sparsities, runs, csv_path):    
+def run_all_benchmarks(sizes, sparsities, runs, csv_path, dtypes=('float64', 'float32'), large_sizes=(), structures=('uniform',)):    
     with open(csv_path, 'w', newline='') as csvfile:
         writer = csv.writer(csvfile)
-        writer.writerow(["Algorithm", "Size", "Sparsity", "Run", "TimeSeconds", "MemoryMB", "NonZeroElements", "ActualSparsity"])
+        writer.writerow(["Algorithm", "Size", "Sparsity", "Run", "TimeSeconds", "MemoryMB", "NonZeroElements", "ActualSparsity", "DType", "Structure",
+                         "Flops", "EstimatedResultNonZerosUpper", "EstimatedResultNonZeros", "ResultNonZeros", "GFLOPS"])
         
         print("\nPYTHON PURE SPARSE ALGORITHMS")
     
         run_benchmark("CSR-Pure", lambda A, B: A.multiply(B), lambda n, s: (SparseMatrixCSR.random(n, s), SparseMatrixCSR.random(n, s)), sizes, sparsities, runs, writer)
+        for dtype in dtypes:
+            generate = lambda n, s, dtype=dtype: (SparseMatrixCSR.random(n, s, True, dtype), SparseMatrixCSR.random(n, s, True, dtype))
+            run_benchmark("CSR-Pure-Compact", lambda A, B: A.multiply(B), generate, sizes, sparsities, runs, writer, dtype)
         
         print("\nSCIPY SPARSE ALGORITHMS")
-        run_benchmark("CSR-SciPy", lambda A, B: A.multiply(B), lambda n, s: (SparseMatrixSciPy.random(n, s), SparseMatrixSciPy.random(n, s)), sizes, sparsities, runs, writer)
+        for dtype in dtypes:
+            generate = lambda n, s, dtype=dtype: (SparseMatrixSciPy.random(n, s, dtype), SparseMatrixSciPy.random(n, s, dtype))
+            run_benchmark("CSR-SciPy", lambda A, B: A.multiply(B), generate, sizes, sparsities, runs, writer, dtype)
+            
+            large_sparsities = [s for s in sparsities if s >= 0.99]
+            if large_sizes and large_sparsities:
+                run_benchmark("CSR-SciPy", lambda A, B: A.multiply(B), generate, large_sizes, large_sparsities, runs, writer, dtype)
+        
+        structured = [s for s in structures if s != 'uniform']
+        if structured:
+            print("\nSTRUCTURED WORKLOADS")
+        for structure in structured:
+            structure_sparsities = sparsities[-1:] if structure in FIXED_DENSITY_STRUCTURES else sparsities
+            
+            generate = lambda n, s, structure=structure: (SparseMatrixCSR.structured(structure, n, s), SparseMatrixCSR.structured(structure, n, s))
+            run_benchmark("CSR-Pure", lambda A, B: A.multiply(B), generate, sizes, structure_sparsities, runs, writer, structure=structure)
+            
+            generate = lambda n, s, structure=structure: (SparseMatrixSciPy.structured(structure, n, s), SparseMatrixSciPy.structured(structure, n, s))
+            run_benchmark("CSR-SciPy", lambda A, B: A.multiply(B), generate, sizes, structure_sparsities, runs, writer, structure=structure)
+
+
+
+def with_new_values(matrix):
+    return SparseMatrixCSR([random.random() for _ in matrix.values], matrix.col_index, matrix.row_ptr, matrix.shape)
+
+
+def run_repeated_pattern_benchmark(sizes, sparsities, repeats, csv_path):
+    with open(csv_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Algorithm", "Size", "Sparsity", "Repeats", "TotalSeconds", "PerMultiplySeconds", "PlanHits", "PlanMisses"])
+        
+        print(f"\nREPEATED SPARSITY PATTERN ({repeats} multiplies with new values)")
+        
+        for sparsity in sparsities:
+            for size in sizes:
+                A = SparseMatrixCSR.random(size, sparsity)
+                B = SparseMatrixCSR.random(size, sparsity)
+                operands = [(with_new_values(A), with_new_values(B)) for _ in range(repeats)]
+                
+                start = time.perf_counter()
+                for A_values, B_values in operands:
+                    A_values.multiply(B_values)
+                one_pass = time.perf_counter() - start
+                
+                cache = PlanCache()
+                start = time.perf_counter()
+                for A_values, B_values in operands:
+                    A_values.multiply_planned(B_values, cache)
+                planned = time.perf_counter() - start
+                
+                writer.writerow(["CSR-Pure", size, sparsity, repeats, round(one_pass, 6), round(one_pass / repeats, 6), 0, 0])
+                writer.writerow(["CSR-Pure-Planned", size, sparsity, repeats, round(planned, 6), round(planned / repeats, 6), cache.hits, cache.misses])
+                
+                speedup = one_pass / planned if planned > 0 else 0
+                print(f"  Size {size}×{size}, Sparsity {sparsity*100:.0f}%: {one_pass:.4f}s vs planned {planned:.4f}s ({speedup:.2f}x)")
+
+
+
+def run_parallel_sweep(sizes, sparsity, structures, workers_list, runs, csv_path):
+    with open(csv_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Algorithm", "Structure", "Size", "Sparsity", "Workers", "TimeSeconds", "Speedup", "Efficiency"])
+        
+        print("\nPARALLEL WORKER SWEEP")
+        
+        for structure in structures:
+            for size in sizes:
+                A = SparseMatrixCSR.structured(structure, size, sparsity)
+                B = SparseMatrixCSR.structured(structure, size, sparsity)
+                
+                start = time.perf_counter()
+                A.multiply(B)
+                baseline = time.perf_counter() - start
+                
+                for workers in workers_list:
+                    times = []
+                    for run in range(runs):
+                        start = time.perf_counter()
+                        A.multiply_parallel(B, workers=workers)
+                        times.append(time.perf_counter() - start)
+                    
+                    avg_time = sum(times) / len(times)
+                    speedup = baseline / avg_time
+                    efficiency = speedup / workers
+                    
+                    writer.writerow(["CSR-Pure-Parallel", structure, size, sparsity, workers, round(avg_time, 6), round(speedup, 3), round(efficiency, 3)])
+                    print(f"{structure}, Size {size}×{size}, {workers} workers: {avg_time:.4f}s, speedup {speedup:.2f}x, efficiency {efficiency * 100:.0f}%")
+
+
+
+def run_scipy_parallel_sweep(sizes, sparsity, workers_list, chunk_rows_list, runs, csv_path):
+    with open(csv_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Algorithm", "Size", "Sparsity", "Workers", "ChunkRows", "TimeSeconds", "Speedup", "Efficiency"])
+        
+        print("\nSCIPY PARALLEL SWEEP")
+        
+        for size in sizes:
+            A = SparseMatrixSciPy.random(size, sparsity)
+            B = SparseMatrixSciPy.random(size, sparsity)
+            
+            times = []
+            for run in range(runs):
+                start = time.perf_counter()
+                A.multiply(B)
+                times.append(time.perf_counter() - start)
+            baseline = sum(times) / len(times)
+            writer.writerow(["CSR-SciPy", size, sparsity, 1, "", round(baseline, 6), 1.0, 1.0])
+            print(f"Size {size}×{size}, plain @: {baseline:.4f}s")
+            
+            for workers in workers_list:
+                for chunk_rows in chunk_rows_list:
+                    times = []
+                    for run in range(runs):
+                        start = time.perf_counter()
+                        A.multiply_parallel(B, workers=workers, chunk_rows=chunk_rows)
+                        times.append(time.perf_counter() - start)
+                    
+                    avg_time = sum(times) / len(times)
+                    speedup = baseline / avg_time
+                    efficiency = speedup / workers
+                    
+                    chunk_label = chunk_rows or "balanced"
+                    writer.writerow(["CSR-SciPy-Parallel", size, sparsity, workers, chunk_label, round(avg_time, 6), round(speedup, 3), round(efficiency, 3)])
+                    print(f"Size {size}×{size}, {workers} workers, chunk {chunk_label}: {avg_time:.4f}s, speedup {speedup:.2f}x, efficiency {efficiency * 100:.0f}%")
+
+
+def average_time(multiply_func, A, B, runs):
+    times = []
+    for run in range(runs):
+        start = time.perf_counter()
+        multiply_func(A, B)
+        times.append(time.perf_counter() - start)
+    return sum(times) / len(times)
+
+
+def run_block_size_sweep(sizes, sparsity, structure_block_sizes, block_sizes, runs, csv_path, pure_max_size=1024):
+    with open(csv_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Algorithm", "Size", "Sparsity", "StructureBlockSize", "BlockSize", "TimeSeconds", "MemoryMB",
+                         "StoredElements", "IndexElements"])
+        
+        print("\nBSR BLOCK SIZE SWEEP")
+        
+        for structure_block_size in structure_block_sizes:
+            for size in sizes:
+                arrays = [workloads.block_sparse(size, structure_block_size, sparsity, seed=seed) for seed in (1, 2)]
+                A_scipy, B_scipy = [SparseMatrixSciPy._from_arrays(*a, (size, size)) for a in arrays]
+                A_csr, B_csr = [SparseMatrixCSR(*a, (size, size)) for a in arrays]
+                
+                cases = [("CSR-SciPy", "", A_scipy, B_scipy, A_scipy.numbers_non_zero() + size + 1)]
+                if size <= pure_max_size:
+                    cases.append(("CSR-Pure", "", A_csr, B_csr, A_csr.numbers_non_zero() + size + 1))
+                
+                for block_size in block_sizes:
+                    if size % block_size:
+                        continue
+                    bsr_cases = [("BSR-NumPy", SparseMatrixBSRNumPy, A_scipy, B_scipy), ("BSR-SciPy", SparseMatrixBSRSciPy, A_scipy, B_scipy)]
+                    if size <= pure_max_size:
+                        bsr_cases.append(("BSR-Pure", SparseMatrixBSR, A_csr, B_csr))
+                    for algorithm_name, cls, A, B in bsr_cases:
+                        A_bsr, B_bsr = cls.from_csr(A, block_size), cls.from_csr(B, block_size)
+                        cases.append((algorithm_name, block_size, A_bsr, B_bsr, A_bsr.numbers_blocks() + size // block_size + 1))
+                
+                for algorithm_name, block_size, A, B, index_elements in cases:
+                    mem_before = get_process_memory_mb()
+                    avg_time = average_time(lambda A, B: A.multiply(B), A, B, runs)
+                    mem_after = get_process_memory_mb()
+                    
+                    writer.writerow([algorithm_name, size, sparsity, structure_block_size, block_size, round(avg_time, 6),
+                                     round(max(mem_before, mem_after), 2), A.numbers_non_zero(), index_elements])
+                    print(f"{structure_block_size}×{structure_block_size} blocks, Size {size}×{size}, {algorithm_name}{f' ({block_size}×{block_size})' if block_size else ''}: {avg_time:.4f}s")
 
 
 if __name__ == "__main__":
@@ -73,6 +275,7 @@ if __name__ == "__main__":
         sys.exit(1)
     
     sizes = [64, 128, 256, 512, 1024, 2048]
+    scipy_large_sizes = [4096, 8192, 16384]
     sparsities = [0.5, 0.7, 0.9, 0.95, 0.99]
     runs = 3
     
@@ -80,14 +283,25 @@ if __name__ == "__main__":
     os.makedirs(output_directory, exist_ok=True)
     
     csv_path = os.path.join(output_directory, "sparse_algorithms.csv")
+    repeated_csv_path = os.path.join(output_directory, "sparse_repeated_pattern.csv")
+    parallel_csv_path = os.path.join(output_directory, "sparse_parallel.csv")
+    scipy_parallel_csv_path = os.path.join(output_directory, "sparse_scipy_parallel.csv")
+    bsr_csv_path = os.path.join(output_directory, "sparse_bsr.csv")
     
     print("SPARSE MATRIX MULTIPLICATION BENCHMARK")
     print(f"\nConfiguration:")
-    print(f"  Sizes: {sizes}")
+    print(f"  Sizes: {sizes} (SciPy also {scipy_large_sizes} at ≥99% sparsity)")
     print(f"  Sparsity levels: {[f'{s*100:.0f}%' for s in sparsities]}")
+    print(f"  Structures: {list(STRUCTURES)}")
     print(f"  Runs per configuration: {runs}")
     print(f"  Output: {csv_path}")
 
-    run_all_benchmarks(sizes, sparsities, runs, csv_path)
+    run_all_benchmarks(sizes, sparsities, runs, csv_path, large_sizes=scipy_large_sizes, structures=STRUCTURES)
+    run_repeated_pattern_benchmark([256, 512, 1024], [0.9, 0.99], 10, repeated_csv_path)
+    
+    workers_list = [w for w in [1, 2, 4, 8, 16, 32] if w <= (os.cpu_count() or 1)]
+    run_parallel_sweep([1024, 2048], 0.95, ['uniform', 'power-law'], workers_list, runs, parallel_csv_path)
+    run_scipy_parallel_sweep([65536, 131072], 0.9999, workers_list, [None, 1024, 8192], runs, scipy_parallel_csv_path)
+    run_block_size_sweep([512, 1024, 4096], 0.95, [2, 4, 8], [1, 2, 4, 8, 16], runs, bsr_csv_path)
 
-    print(f"\nResults saved at: {csv_path}")
+    print(f"\nResults saved at: {csv_path}, {repeated_csv_path}, {parallel_csv_path}, {scipy_parallel_csv_path}, {bsr_csv_path}")
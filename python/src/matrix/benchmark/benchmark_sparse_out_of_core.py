@@ -0,0 +1,110 @@
+import sys
+import time
+import csv
+import os
+import shutil
+import tempfile
+import threading
+import numpy as np
+import psutil
+from scipy.sparse import csr_matrix
+from python.src.matrix.sparse.out_of_core import multiply_out_of_core
+
+
+def get_process_memory_mb():
+    process = psutil.Process(os.getpid())
+    return process.memory_info().rss / (1024 * 1024)
+
+
+def peak_memory_during(function, interval=0.01):
+    # Before/after RSS misses transient panels, so a thread samples RSS while function runs.
+    peak = [get_process_memory_mb()]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(interval):
+            peak[0] = max(peak[0], get_process_memory_mb())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = function()
+    finally:
+        done.set()
+        sampler.join()
+
+    return result, max(peak[0], get_process_memory_mb())
+
+
+def random_rows(n, non_zeros_per_row, seed=None):
+    rng = np.random.default_rng(seed)
+    rows = np.repeat(np.arange(n), non_zeros_per_row)
+    cols = rng.integers(0, n, n * non_zeros_per_row)
+    return csr_matrix((rng.random(n * non_zeros_per_row), (rows, cols)), shape=(n, n))
+
+
+def run_benchmark(size, non_zeros_per_row, budgets_mb, runs, scratch_directory, writer):
+    A = random_rows(size, non_zeros_per_row, seed=size)
+    B = A.T.tocsr()
+    baseline_mb = get_process_memory_mb()
+    print(f"Size {size}×{size}, {non_zeros_per_row} non-zeros per row (A × Aᵀ), baseline {baseline_mb:.0f}MB")
+
+    for run in range(1, runs + 1):
+        start = time.perf_counter()
+        C, peak_mb = peak_memory_during(lambda: A @ B)
+        elapsed = time.perf_counter() - start
+        writer.writerow(["In-memory", size, non_zeros_per_row, '', run, 1, C.nnz, round(elapsed, 6), 0.0,
+                         round(baseline_mb, 2), round(peak_mb, 2)])
+        del C
+    print(f"  In-memory: {elapsed:.2f}s, peak {peak_mb - baseline_mb:+.0f}MB over baseline")
+
+    directory = os.path.join(scratch_directory, f"C_{size}_{non_zeros_per_row}")
+    for budget_mb in budgets_mb:
+        for run in range(1, runs + 1):
+            stats, peak_mb = peak_memory_during(lambda: multiply_out_of_core(A, B, directory, budget_mb))
+            writer.writerow(["Out-of-core", size, non_zeros_per_row, budget_mb, run, stats['panels'], stats['nnz'],
+                             round(stats['seconds'], 6), round(stats['write_seconds'], 6),
+                             round(baseline_mb, 2), round(peak_mb, 2)])
+
+        print(f"  Budget {budget_mb}MB: {stats['seconds']:.2f}s, {stats['panels']} panels, "
+              f"{stats['bytes_written'] / (1024 * 1024):.0f}MB written, peak {peak_mb - baseline_mb:+.0f}MB over baseline")
+
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_sparse_out_of_core.py <output_directory> [scratch_directory]")
+        print("Example: python benchmark_sparse_out_of_core.py results/ /mnt/scratch")
+        sys.exit(1)
+
+    sizes = [100000, 200000]
+    non_zeros_per_row = [5, 10]
+    budgets_mb = [16, 64, 256]
+    runs = 1
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+    scratch_directory = sys.argv[2] if len(sys.argv) > 2 else tempfile.mkdtemp(prefix="matrix_sparse_ooc_")
+    os.makedirs(scratch_directory, exist_ok=True)
+
+    csv_path = os.path.join(output_directory, "sparse_out_of_core.csv")
+
+    print("OUT-OF-CORE SPARSE MULTIPLICATION BENCHMARK")
+    print(f"\nConfiguration:")
+    print(f"  Sizes: {sizes}")
+    print(f"  Non-zeros per row: {non_zeros_per_row}")
+    print(f"  Memory budgets: {budgets_mb} MB")
+    print(f"  Scratch: {scratch_directory}")
+    print(f"  Output: {csv_path}\n")
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Method", "Size", "NonZerosPerRow", "BudgetMB", "Run", "Panels", "ResultNonZeros",
+                         "TimeSeconds", "WriteSeconds", "BaselineMemoryMB", "PeakMemoryMB"])
+
+        for size in sizes:
+            for per_row in non_zeros_per_row:
+                run_benchmark(size, per_row, budgets_mb, runs, scratch_directory, writer)
+
+    print(f"\nResults saved at: {csv_path}")
@@ -0,0 +1,97 @@
+import sys
+import time
+import csv
+import os
+import random
+import psutil
+from python.src.matrix.dense.matrix import DenseMatrix
+from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+from python.src.matrix.dense.utils import random_numpy
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+def get_process_memory_mb():
+    process = psutil.Process(os.getpid())
+    return process.memory_info().rss / (1024 * 1024)
+
+
+def measure(multiply_func, A, B):
+    mem_before = get_process_memory_mb()
+
+    start = time.perf_counter()
+    multiply_func(A, B)
+    end = time.perf_counter()
+
+    mem_after = get_process_memory_mb()
+    return round(end - start, 6), round(max(mem_before, mem_after), 2)
+
+
+def run_benchmark(size, sparsity, columns, runs, writer, include_pure=True, include_dense=True):
+    print(f"Size {size}×{size}, Sparsity {sparsity*100:.1f}%, {columns} column(s)...", end=' ')
+
+    averages = {}
+
+    for run in range(1, runs + 1):
+        seed = random.randrange(2 ** 32)
+        A_scipy = SparseMatrixSciPy.random(size, sparsity, seed=seed)
+
+        B_numpy = random_numpy((size, columns), 'float64')
+        cases = [("CSR-SciPy", lambda A, B: A.multiply_dense(B), A_scipy, DenseMatrixNumPy(B_numpy, copy=False))]
+        if include_dense:
+            A_dense = DenseMatrixNumPy(A_scipy.to_dense(), copy=False)
+            cases.append(("Dense-NumPy", lambda A, B: A.multiply_matmul(B), A_dense, DenseMatrixNumPy(B_numpy, copy=False)))
+        if columns == 1:
+            cases.append(("CSR-SciPy-SpMV", lambda A, x: A.matvec(x), A_scipy, B_numpy[:, 0]))
+        if include_pure:
+            A_csr = SparseMatrixCSR.random(size, sparsity, seed=seed)
+            cases.append(("CSR-Pure", lambda A, B: A.multiply_dense(B), A_csr, DenseMatrix(B_numpy.tolist())))
+            if columns == 1:
+                cases.append(("CSR-Pure-SpMV", lambda A, x: A.matvec(x), A_csr, B_numpy[:, 0].tolist()))
+
+        for algorithm_name, multiply_func, A, B in cases:
+            time_seconds, memory_mb = measure(multiply_func, A, B)
+            writer.writerow([algorithm_name, size, sparsity, columns, run, time_seconds, memory_mb, A_scipy.numbers_non_zero()])
+            averages.setdefault(algorithm_name, []).append(time_seconds)
+
+    print(", ".join(f"{name}: {sum(times) / len(times):.4f}s" for name, times in averages.items()))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python benchmark_spmm.py <output_directory>")
+        print("Example: python benchmark_spmm.py results/")
+        sys.exit(1)
+
+    sizes = [1024, 4096, 16384]
+    sparsities = [0.9, 0.99, 0.999]
+    column_counts = [1, 4, 16, 64, 256]
+    pure_max_size = 4096
+    dense_max_size = 4096
+    runs = 3
+
+    output_directory = sys.argv[1]
+    os.makedirs(output_directory, exist_ok=True)
+
+    csv_path = os.path.join(output_directory, "sparse_dense_multiply.csv")
+
+    print("SPARSE × DENSE (SpMM) AND SPARSE × VECTOR (SpMV) BENCHMARK")
+    print(f"\nConfiguration:")
+    print(f"  Sizes: {sizes} (pure Python up to {pure_max_size}, dense NumPy up to {dense_max_size})")
+    print(f"  Sparsity levels: {[f'{s*100:.1f}%' for s in sparsities]}")
+    print(f"  Right-hand-side columns: {column_counts}")
+    print(f"  Runs per configuration: {runs}")
+    print(f"  Output: {csv_path}\n")
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Algorithm", "Size", "Sparsity", "Columns", "Run", "TimeSeconds", "MemoryMB", "NonZeroElements"])
+
+        for sparsity in sparsities:
+            for size in sizes:
+                for columns in column_counts:
+                    if size * size * (1 - sparsity) > 5e7:
+                        continue
+                    run_benchmark(size, sparsity, columns, runs, writer, size <= pure_max_size, size <= dense_max_size)
+
+    print(f"\nResults saved at: {csv_path}")
@@ -0,0 +1,198 @@
+import argparse
+import json
+import os
+import platform
+import time
+
+
+CACHE_ENV = "MATRIX_AUTOTUNE_CACHE"
+ENABLE_ENV = "MATRIX_AUTOTUNE"
+
+MIN_TUNED_SIZE = 64
+
+DEFAULTS = {'block_size': 32, 'cutoff': 64, 'winograd_cutoff': 64}
+
+SEARCH_SPACE = {
+    'block_size': [16, 32, 64, 128, 256],
+    'cutoff': [16, 32, 64, 128, 256],
+    'winograd_cutoff': [16, 32, 64, 128, 256],
+}
+
+METHODS = {'block_size': 'multiply_tiled', 'cutoff': 'multiply_strassen', 'winograd_cutoff': 'multiply_winograd'}
+
+# Parameters each kernel exposes; the NumPy kernel has no Winograd variant.
+KERNEL_PARAMS = {
+    'DenseMatrix': ['block_size', 'cutoff', 'winograd_cutoff'],
+    'DenseMatrixArray': ['block_size', 'cutoff', 'winograd_cutoff'],
+    'DenseMatrixNumPy': ['block_size', 'cutoff'],
+}
+
+PROBE_LIMITS = {'DenseMatrix': 256, 'DenseMatrixArray': 256, 'DenseMatrixNumPy': 2048}
+
+
+def default_cache_path():
+    if os.environ.get(CACHE_ENV):
+        return os.environ[CACHE_ENV]
+    return os.path.join(os.path.expanduser("~"), ".cache", "matrix_benchmark", "autotune.json")
+
+
+def host_key():
+    return f"{platform.node()}-{platform.machine()}"
+
+
+def size_bucket(n):
+    bucket = 1
+    while bucket < n:
+        bucket *= 2
+    return bucket
+
+
+def _kernel_class(kernel):
+    if kernel == 'DenseMatrix':
+        from python.src.matrix.dense.matrix import DenseMatrix
+        return DenseMatrix
+    if kernel == 'DenseMatrixArray':
+        from python.src.matrix.dense.matrix_array import DenseMatrixArray
+        return DenseMatrixArray
+    if kernel == 'DenseMatrixNumPy':
+        from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+        return DenseMatrixNumPy
+    raise ValueError(f"Unknown kernel: {kernel}")
+
+
+def time_candidate(kernel, param, n, value, runs=1):
+    cls = _kernel_class(kernel)
+    A, B = cls.random(n), cls.random(n)
+    method = getattr(A, METHODS[param])
+
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        method(B, value)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class Autotuner:
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path or default_cache_path()
+        self.cache = self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+    def _entries(self, kernel, param):
+        return self.cache.get(host_key(), {}).get(kernel, {}).get(param, {})
+
+    def lookup(self, kernel, param, n):
+        return self._entries(kernel, param).get(str(size_bucket(n)))
+
+    def store(self, kernel, param, n, value):
+        entries = self.cache.setdefault(host_key(), {}).setdefault(kernel, {}).setdefault(param, {})
+        entries[str(size_bucket(n))] = value
+        self.save()
+
+    def clear(self, kernel=None):
+        host = self.cache.get(host_key(), {})
+        if kernel is None:
+            host.clear()
+        else:
+            host.pop(kernel, None)
+        self.save()
+
+    def short_candidates(self, kernel, param, n):
+        entries = self._entries(kernel, param)
+        if not entries:
+            return SEARCH_SPACE[param]
+
+        bucket = size_bucket(n)
+        nearest = min(entries, key=lambda b: abs(int(b).bit_length() - bucket.bit_length()))
+        value = entries[nearest]
+        return [c for c in SEARCH_SPACE[param] if value // 2 <= c <= value * 2]
+
+    def tune(self, kernel, param, n, candidates=None, probe_size=None, runs=1):
+        # The winner is stored under the bucket it was measured at, probe_size.
+        candidates = candidates or SEARCH_SPACE[param]
+        probe_size = probe_size or n
+
+        useful = [c for c in candidates if c < probe_size] or [min(candidates)]
+        timings = {c: time_candidate(kernel, param, probe_size, c, runs) for c in useful}
+        best = min(timings, key=timings.get)
+
+        self.store(kernel, param, probe_size, best)
+        return best
+
+    def get(self, kernel, param, n, tune=None):
+        # Sizes above PROBE_LIMITS read the bucket of the largest probe, the closest size
+        # actually measured. A missing bucket falls back to the default unless tuning is
+        # asked for, here or with MATRIX_AUTOTUNE=1, so a plain multiply never starts a
+        # search or writes the cache.
+        mode = os.environ.get(ENABLE_ENV, "")
+        if n < MIN_TUNED_SIZE or mode == "0":
+            return DEFAULTS[param]
+
+        probe_size = min(n, PROBE_LIMITS[kernel])
+        value = self.lookup(kernel, param, probe_size)
+        if value is None:
+            if not (mode == "1" if tune is None else tune):
+                return DEFAULTS[param]
+            value = self.tune(kernel, param, probe_size, self.short_candidates(kernel, param, probe_size))
+        return value
+
+    def warm(self, kernel, sizes, params=None):
+        # Tunes every missing bucket up front, e.g. before timing loops.
+        for param in params or KERNEL_PARAMS[kernel]:
+            for n in sizes:
+                self.get(kernel, param, n, tune=True)
+
+
+_tuner = None
+
+
+def get_tuner():
+    global _tuner
+    if _tuner is None or _tuner.cache_path != default_cache_path():
+        _tuner = Autotuner()
+    return _tuner
+
+
+def tuned_value(kernel, param, n, tune=None):
+    return get_tuner().get(kernel, param, n, tune)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tune tile sizes and Strassen cutoffs for this host")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 128, 256, 512])
+    parser.add_argument("--kernels", nargs="+", default=list(PROBE_LIMITS))
+    parser.add_argument("--params", nargs="+", default=list(SEARCH_SPACE))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--cache", default=None)
+    parser.add_argument("--reset", action="store_true", help="discard this host's cached settings first")
+    args = parser.parse_args()
+
+    tuner = Autotuner(args.cache)
+    if args.reset:
+        tuner.clear()
+
+    print("AUTOTUNING")
+    print(f"  Host: {host_key()}")
+    print(f"  Cache: {tuner.cache_path}")
+
+    for kernel in args.kernels:
+        for param in [param for param in args.params if param in KERNEL_PARAMS[kernel]]:
+            for size in args.sizes:
+                probe_size = min(size, PROBE_LIMITS[kernel])
+                best = tuner.tune(kernel, param, size, probe_size=probe_size, runs=args.runs)
+                print(f"  {kernel} {param} @ {size_bucket(probe_size)}: {best}")
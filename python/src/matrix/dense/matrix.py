@@ -1,15 +1,26 @@
-import random
+from python.src.matrix.dense.autotune import tuned_value
+from python.src.matrix.dense.microkernel import multiply_tiled_micro
+from python.src.matrix.dense.morton import multiply_recursive, multiply_recursive_morton
+from python.src.matrix.dense.parallel import multiply_parallel
+from python.src.matrix.dense.strassen import strassen_multiply
+from python.src.matrix.dtypes import dtype_name, random_value_func
 
 
 class DenseMatrix:
     
+    __slots__ = ('data', 'shape')
+    
     def __init__(self, data):
         self.data = data
         self.shape = (len(data), len(data[0]) if data else 0)
     
     @classmethod
-    def random(cls, n):
-        data = [[random.random() for _ in range(n)] for _ in range(n)]
+    def random(cls, n, dtype='float64'):
+        # Lists hold Python floats (float64) and ints; float32 needs DenseMatrixArray or NumPy.
+        if dtype_name(dtype) == 'float32':
+            raise ValueError("DenseMatrix stores float64 or int values; use DenseMatrixArray or DenseMatrixNumPy for float32")
+        value = random_value_func(dtype)
+        data = [[value() for _ in range(n)] for _ in range(n)]
         return cls(data)
     
     def multiply_standard(self, other):
@@ -35,8 +46,13 @@ class DenseMatrix:
         
         return DenseMatrix(C)
     
-    def multiply_tiled(self, other, block_size=32):
+    def multiply_tiled(self, other, block_size=None, register_block=None):
         n = self.shape[0]
+        if block_size is None:
+            block_size = tuned_value('DenseMatrix', 'block_size', n)
+        
+        if register_block is not None:
+            return DenseMatrix(multiply_tiled_micro(self.data, other.data, n, block_size, register_block))
         C = [[0] * n for _ in range(n)]
         
         for i_block in range(0, n, block_size):
@@ -55,75 +71,21 @@ class DenseMatrix:
         
         return DenseMatrix(C)
     
-    def multiply_strassen(self, other):
-        def strassen_recursive(A, B):
-            n = len(A)
-            
-            if n <= 64:
-                C = [[0] * n for _ in range(n)]
-                for i in range(n):
-                    for j in range(n):
-                        for k in range(n):
-                            C[i][j] += A[i][k] * B[k][j]
-                return C
-            
-            next_pow2 = 1
-            while next_pow2 < n:
-                next_pow2 *= 2
-            
-            if next_pow2 != n:
-                A_padded = [[0] * next_pow2 for _ in range(next_pow2)]
-                B_padded = [[0] * next_pow2 for _ in range(next_pow2)]
-                
-                for i in range(n):
-                    for j in range(n):
-                        A_padded[i][j] = A[i][j]
-                        B_padded[i][j] = B[i][j]
-                
-                C_padded = strassen_recursive(A_padded, B_padded)
-                return [[C_padded[i][j] for j in range(n)] for i in range(n)]
-            
-            mid = n // 2
-            
-            A11 = [[A[i][j] for j in range(mid)] for i in range(mid)]
-            A12 = [[A[i][j] for j in range(mid, n)] for i in range(mid)]
-            A21 = [[A[i][j] for j in range(mid)] for i in range(mid, n)]
-            A22 = [[A[i][j] for j in range(mid, n)] for i in range(mid, n)]
-            
-            B11 = [[B[i][j] for j in range(mid)] for i in range(mid)]
-            B12 = [[B[i][j] for j in range(mid, n)] for i in range(mid)]
-            B21 = [[B[i][j] for j in range(mid)] for i in range(mid, n)]
-            B22 = [[B[i][j] for j in range(mid, n)] for i in range(mid, n)]
-            
-            def add_matrices(X, Y):
-                n = len(X)
-                return [[X[i][j] + Y[i][j] for j in range(n)] for i in range(n)]
-            
-            def sub_matrices(X, Y):
-                n = len(X)
-                return [[X[i][j] - Y[i][j] for j in range(n)] for i in range(n)]
-            
-            M1 = strassen_recursive(add_matrices(A11, A22), add_matrices(B11, B22))
-            M2 = strassen_recursive(add_matrices(A21, A22), B11)
-            M3 = strassen_recursive(A11, sub_matrices(B12, B22))
-            M4 = strassen_recursive(A22, sub_matrices(B21, B11))
-            M5 = strassen_recursive(add_matrices(A11, A12), B22)
-            M6 = strassen_recursive(sub_matrices(A21, A11), add_matrices(B11, B12))
-            M7 = strassen_recursive(sub_matrices(A12, A22), add_matrices(B21, B22))
-            
-            C11 = add_matrices(sub_matrices(add_matrices(M1, M4), M5), M7)
-            C12 = add_matrices(M3, M5)
-            C21 = add_matrices(M2, M4)
-            C22 = add_matrices(sub_matrices(add_matrices(M1, M3), M2), M6)
-            
-            C = [[0] * n for _ in range(n)]
-            for i in range(mid):
-                for j in range(mid):
-                    C[i][j] = C11[i][j]
-                    C[i][j + mid] = C12[i][j]
-                    C[i + mid][j] = C21[i][j]
-                    C[i + mid][j + mid] = C22[i][j]
-            
-            return C
-        
-        return DenseMatrix(strassen_recursive(self.data, other.data))
\ No newline at end of file
+    def multiply_recursive(self, other, leaf=32, morton=False):
+        n = self.shape[0]
+        if morton:
+            return DenseMatrix(multiply_recursive_morton(self.data, other.data, n, leaf))
+        return DenseMatrix(multiply_recursive(self.data, other.data, n, leaf))
+    
+    def multiply_parallel(self, other, workers=None, block_rows=None):
+        n = self.shape[0]
+        return DenseMatrix(multiply_parallel(self.data, other.data, n, workers, block_rows))
+    
+    def multiply_strassen(self, other, cutoff=None, winograd=False):
+        n = self.shape[0]
+        if cutoff is None:
+            cutoff = tuned_value('DenseMatrix', 'winograd_cutoff' if winograd else 'cutoff', n)
+        return DenseMatrix(strassen_multiply(self.data, other.data, n, cutoff, winograd))
+    
+    def multiply_winograd(self, other, cutoff=None):
+        return self.multiply_strassen(other, cutoff, winograd=True)
\ No newline at end of file
@@ -0,0 +1,112 @@
+from array import array
+from python.src.matrix.dense.autotune import tuned_value
+from python.src.matrix.dense.strassen import strassen_multiply_flat
+from python.src.matrix.dtypes import ARRAY_TYPECODES, checked_product, dtype_name, random_value_func
+
+
+def _zeros_like(data, length):
+    return array(data.typecode, bytes(data.itemsize * length))
+
+
+class DenseMatrixArray:
+
+    __slots__ = ('data', 'shape')
+
+    def __init__(self, data, shape):
+        self.data = data
+        self.shape = shape
+
+    @classmethod
+    def from_dense(cls, dense_matrix, dtype='float64'):
+        n_rows = len(dense_matrix)
+        n_cols = len(dense_matrix[0]) if dense_matrix else 0
+
+        data = array(ARRAY_TYPECODES[dtype_name(dtype)])
+        for row in dense_matrix:
+            data.extend(row)
+
+        return cls(data, (n_rows, n_cols))
+
+    @classmethod
+    def random(cls, n, dtype='float64'):
+        value = random_value_func(dtype)
+        data = array(ARRAY_TYPECODES[dtype_name(dtype)], (value() for _ in range(n * n)))
+        return cls(data, (n, n))
+
+    @property
+    def dtype(self):
+        return next(name for name, code in ARRAY_TYPECODES.items() if code == self.data.typecode)
+
+    def to_dense(self):
+        n_rows, n_cols = self.shape
+        return [self.data[i * n_cols:(i + 1) * n_cols].tolist() for i in range(n_rows)]
+
+    @checked_product
+    def multiply_standard(self, other):
+        n = self.shape[0]
+        A = self.data
+        B = other.data
+        C = _zeros_like(A, n * n)
+
+        for i in range(n):
+            row = i * n
+            for j in range(n):
+                for k in range(n):
+                    C[row + j] += A[row + k] * B[k * n + j]
+
+        return DenseMatrixArray(C, (n, n))
+
+    @checked_product
+    def multiply_row_oriented(self, other):
+        n = self.shape[0]
+        A = self.data
+        B = other.data
+        C = _zeros_like(A, n * n)
+
+        for i in range(n):
+            row = i * n
+            for k in range(n):
+                aik = A[row + k]
+                b_row = k * n
+                for j in range(n):
+                    C[row + j] += aik * B[b_row + j]
+
+        return DenseMatrixArray(C, (n, n))
+
+    @checked_product
+    def multiply_tiled(self, other, block_size=None):
+        n = self.shape[0]
+        if block_size is None:
+            block_size = tuned_value('DenseMatrixArray', 'block_size', n)
+        A = self.data
+        B = other.data
+        C = _zeros_like(A, n * n)
+
+        for i_block in range(0, n, block_size):
+            for j_block in range(0, n, block_size):
+                for k_block in range(0, n, block_size):
+
+                    i_limit = min(i_block + block_size, n)
+                    j_limit = min(j_block + block_size, n)
+                    k_limit = min(k_block + block_size, n)
+
+                    for i in range(i_block, i_limit):
+                        row = i * n
+                        for k in range(k_block, k_limit):
+                            aik = A[row + k]
+                            b_row = k * n
+                            for j in range(j_block, j_limit):
+                                C[row + j] += aik * B[b_row + j]
+
+        return DenseMatrixArray(C, (n, n))
+
+    @checked_product
+    def multiply_strassen(self, other, cutoff=None, winograd=False):
+        n = self.shape[0]
+        if cutoff is None:
+            cutoff = tuned_value('DenseMatrixArray', 'winograd_cutoff' if winograd else 'cutoff', n)
+        C = strassen_multiply_flat(self.data.tolist(), other.data.tolist(), n, cutoff, winograd)
+        return DenseMatrixArray(array(self.data.typecode, C), (n, n))
+
+    def multiply_winograd(self, other, cutoff=None):
+        return self.multiply_strassen(other, cutoff, winograd=True)
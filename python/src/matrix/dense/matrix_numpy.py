@@ -1,15 +1,33 @@
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from scipy.linalg.blas import get_blas_funcs
+from python.src.matrix.dense.autotune import tuned_value
+from python.src.matrix.dense.utils import random_numpy
+from python.src.matrix.dense.out_of_core import multiply_out_of_core
+from python.src.matrix.dense.morton_numpy import multiply_recursive_numpy, multiply_recursive_morton_numpy
+from python.src.matrix.dense.strassen_numpy import strassen_numpy
 
 
 class DenseMatrixNumPy:
     
-    def __init__(self, data):
-        self.data = np.array(data)
+    def __init__(self, data, copy=True, dtype=None):
+        self.data = np.array(data, dtype=dtype) if copy else np.asanyarray(data, dtype=dtype)
         self.shape = self.data.shape
     
     @classmethod
-    def random(cls, n):
-        return cls(np.random.rand(n, n))
+    def random(cls, n, dtype=np.float64):
+        return cls(random_numpy((n, n), dtype), copy=False)
+    
+    @property
+    def dtype(self):
+        return self.data.dtype
+    
+    @classmethod
+    def open(cls, path, shape, dtype=np.float64, mode='r+'):
+        return cls(np.memmap(path, dtype=dtype, mode=mode, shape=shape), copy=False)
+    
+    def is_memmap(self):
+        return isinstance(self.data, np.memmap)
     
     def multiply_builtin(self, other):
         result = np.dot(self.data, other.data)
@@ -19,73 +37,116 @@ class DenseMatrixNumPy:
         result = self.data @ other.data
         return DenseMatrixNumPy(result)
     
-    def multiply_tiled(self, other, block_size=32):
-        n = self.data.shape[0]
-        C = np.zeros((n, n))
+    def multiply_transpose(self, other):
+        if self.shape[1] != other.shape[1]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}ᵀ")
+        if other is self:
+            return self.gram()
+        # other.data.T is a view; BLAS reads it with the transpose flag instead of a copy.
+        return DenseMatrixNumPy(self.data @ other.data.T, copy=False)
+    
+    def gram(self, upper=False):
+        # NumPy routes A @ A.T to BLAS syrk (one triangle, then mirrored). upper=True calls
+        # syrk directly: row-major A is column-major A.T, so no copy is made, and the lower
+        # triangle of the column-major result is the upper triangle of its row-major view.
+        if not upper:
+            return DenseMatrixNumPy(self.data @ self.data.T, copy=False)
+        if self.data.dtype in (np.float32, np.float64):
+            syrk = get_blas_funcs('syrk', (self.data,))
+            return DenseMatrixNumPy(syrk(1.0, self.data.T, trans=1, lower=1).T, copy=False)
+        return DenseMatrixNumPy(np.triu(self.data @ self.data.T), copy=False)
+    
+    def multiply_mixed_precision(self, other, mode='accumulate', block_size=256):
+        if mode not in ('accumulate', 'refine'):
+            raise ValueError(f"Unknown mixed-precision mode: {mode}")
         
-        for i_block in range(0, n, block_size):
-            for j_block in range(0, n, block_size):
-                for k_block in range(0, n, block_size):
-                    
-                    i_end = min(i_block + block_size, n)
-                    j_end = min(j_block + block_size, n)
-                    k_end = min(k_block + block_size, n)
-                    
-                    C[i_block:i_end, j_block:j_end] += np.dot(
-                        self.data[i_block:i_end, k_block:k_end],
-                        other.data[k_block:k_end, j_block:j_end]
-                    )
+        A = np.asarray(self.data, dtype=np.float64)
+        B = np.asarray(other.data, dtype=np.float64)
+        A32 = A.astype(np.float32)
+        B32 = B.astype(np.float32)
         
-        return DenseMatrixNumPy(C)
-    
-    def multiply_strassen(self, other):
-        def strassen_recursive(A, B):
-            n = A.shape[0]
+        if mode == 'refine':
+            A_low = (A - A32).astype(np.float32)
+            B_low = (B - B32).astype(np.float32)
+        
+        n_inner = A.shape[1]
+        C = np.zeros((A.shape[0], B.shape[1]), dtype=np.float64)
+        partial = np.empty((A.shape[0], B.shape[1]), dtype=np.float32)
+        
+        for k_block in range(0, n_inner, block_size):
+            k_end = min(k_block + block_size, n_inner)
+            A_panel = A32[:, k_block:k_end]
+            B_panel = B32[k_block:k_end, :]
             
-            if n <= 64:
-                return np.dot(A, B)
+            np.matmul(A_panel, B_panel, out=partial)
+            C += partial
             
-            next_pow2 = 1
-            while next_pow2 < n:
-                next_pow2 *= 2
+            if mode == 'refine':
+                np.matmul(A_low[:, k_block:k_end], B_panel, out=partial)
+                C += partial
+                np.matmul(A_panel, B_low[k_block:k_end, :], out=partial)
+                C += partial
+        
+        return DenseMatrixNumPy(C, copy=False)
+    
+    def multiply_tiled(self, other, block_size=None, workers=1):
+        # matmul already runs on BLAS threads, so tile threads are opt-in: the benchmark
+        # compares workers=os.cpu_count() against the serial path and plain matmul.
+        n = self.data.shape[0]
+        if block_size is None:
+            block_size = tuned_value('DenseMatrixNumPy', 'block_size', n)
+        
+        A = self.data
+        B = other.data
+        C = np.empty((n, n), dtype=np.result_type(A, B))
+        
+        blocks = range(0, n, block_size)
+        tiles = [(i_block, j_block) for i_block in blocks for j_block in blocks]
+        
+        def compute(tile_group):
+            buffer = np.empty((block_size, block_size), dtype=C.dtype)
             
-            if next_pow2 != n:
-                A_padded = np.zeros((next_pow2, next_pow2))
-                B_padded = np.zeros((next_pow2, next_pow2))
+            for i_block, j_block in tile_group:
+                i_end = min(i_block + block_size, n)
+                j_end = min(j_block + block_size, n)
                 
-                A_padded[:n, :n] = A
-                B_padded[:n, :n] = B
+                C_tile = C[i_block:i_end, j_block:j_end]
+                partial = buffer[:i_end - i_block, :j_end - j_block]
                 
-                C_padded = strassen_recursive(A_padded, B_padded)
-                return C_padded[:n, :n]
-            
-            mid = n // 2
-            
-            A11 = A[:mid, :mid]
-            A12 = A[:mid, mid:]
-            A21 = A[mid:, :mid]
-            A22 = A[mid:, mid:]
-            
-            B11 = B[:mid, :mid]
-            B12 = B[:mid, mid:]
-            B21 = B[mid:, :mid]
-            B22 = B[mid:, mid:]
-            
-            M1 = strassen_recursive(A11 + A22, B11 + B22)
-            M2 = strassen_recursive(A21 + A22, B11)
-            M3 = strassen_recursive(A11, B12 - B22)
-            M4 = strassen_recursive(A22, B21 - B11)
-            M5 = strassen_recursive(A11 + A12, B22)
-            M6 = strassen_recursive(A21 - A11, B11 + B12)
-            M7 = strassen_recursive(A12 - A22, B21 + B22)
-            
-            C11 = M1 + M4 - M5 + M7
-            C12 = M3 + M5
-            C21 = M2 + M4
-            C22 = M1 + M3 - M2 + M6
-            
-            C = np.vstack([np.hstack([C11, C12]), np.hstack([C21, C22])])
-            return C
+                for k_block in blocks:
+                    k_end = min(k_block + block_size, n)
+                    
+                    if k_block == 0:
+                        np.matmul(A[i_block:i_end, k_block:k_end], B[k_block:k_end, j_block:j_end], out=C_tile)
+                    else:
+                        np.matmul(A[i_block:i_end, k_block:k_end], B[k_block:k_end, j_block:j_end], out=partial)
+                        np.add(C_tile, partial, out=C_tile)
+        
+        if workers > 1 and len(tiles) > 1:
+            groups = [tiles[w::workers] for w in range(min(workers, len(tiles)))]
+            with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+                list(pool.map(compute, groups))
+        else:
+            compute(tiles)
+        
+        return DenseMatrixNumPy(C, copy=False)
+    
+    def multiply_out_of_core(self, other, path, memory_budget_mb=256, tile=None):
+        shape = (self.shape[0], other.shape[1])
+        result = DenseMatrixNumPy.open(path, shape, np.result_type(self.data, other.data), mode='w+')
+        # (result, stats): GFLOP/s, bytes moved and I/O time of the streamed multiply.
+        stats = multiply_out_of_core(self.data, other.data, result.data, memory_budget_mb, tile)
+        return result, stats
+    
+    def multiply_recursive(self, other, leaf=64, morton=False):
+        if morton:
+            return DenseMatrixNumPy(multiply_recursive_morton_numpy(self.data, other.data, leaf))
+        return DenseMatrixNumPy(multiply_recursive_numpy(self.data, other.data, leaf))
+    
+    def multiply_strassen(self, other, cutoff=None, workers=1):
+        # workers > 1 runs the seven top-level products on threads (opt-in, as for tiling).
+        if cutoff is None:
+            cutoff = tuned_value('DenseMatrixNumPy', 'cutoff', self.shape[0])
         
-        result = strassen_recursive(self.data, other.data)
-        return DenseMatrixNumPy(result)
\ No newline at end of file
+        result = strassen_numpy(self.data, other.data, cutoff, workers)
+        return DenseMatrixNumPy(result, copy=False)
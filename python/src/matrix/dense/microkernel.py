@@ -0,0 +1,62 @@
+_KERNELS = {}
+
+
+def generate_kernel_source(mr, nr):
+    rows = range(mr)
+    cols = range(nr)
+
+    lines = [f"def kernel_{mr}x{nr}(A, B, C, i, j, k_start, k_end):"]
+    for r in rows:
+        lines.append(f"    a{r} = A[i + {r}]")
+        lines.append(f"    c_row{r} = C[i + {r}]")
+    for c in cols:
+        lines.append(f"    j{c} = j + {c}")
+    for r in rows:
+        for c in cols:
+            lines.append(f"    c{r}_{c} = c_row{r}[j{c}]")
+
+    lines.append("    for k in range(k_start, k_end):")
+    lines.append("        b = B[k]")
+    for c in cols:
+        lines.append(f"        b{c} = b[j{c}]")
+    for r in rows:
+        lines.append(f"        a = a{r}[k]")
+        for c in cols:
+            lines.append(f"        c{r}_{c} += a * b{c}")
+
+    for r in rows:
+        values = ", ".join(f"c{r}_{c}" for c in cols)
+        lines.append(f"    c_row{r}[j:j + {nr}] = ({values},)")
+
+    return "\n".join(lines) + "\n"
+
+
+def get_kernel(mr, nr):
+    kernel = _KERNELS.get((mr, nr))
+    if kernel is None:
+        namespace = {}
+        code = compile(generate_kernel_source(mr, nr), f"<microkernel {mr}x{nr}>", "exec")
+        exec(code, namespace)
+        kernel = namespace[f"kernel_{mr}x{nr}"]
+        _KERNELS[(mr, nr)] = kernel
+    return kernel
+
+
+def multiply_tiled_micro(A, B, n, block_size, register_block=(4, 4)):
+    mr, nr = register_block
+    C = [[0.0] * n for _ in range(n)]
+
+    for i_block in range(0, n, block_size):
+        i_limit = min(i_block + block_size, n)
+        for j_block in range(0, n, block_size):
+            j_limit = min(j_block + block_size, n)
+            for k_block in range(0, n, block_size):
+                k_limit = min(k_block + block_size, n)
+
+                for i in range(i_block, i_limit, mr):
+                    rows = min(mr, i_limit - i)
+                    for j in range(j_block, j_limit, nr):
+                        cols = min(nr, j_limit - j)
+                        get_kernel(rows, cols)(A, B, C, i, j, k_block, k_limit)
+
+    return C
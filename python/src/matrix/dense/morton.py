@@ -0,0 +1,129 @@
+from python.src.matrix.dense.strassen import padded_size
+
+
+def morton_layout(n, leaf):
+    size, levels = padded_size(n, leaf)
+    return size, levels, size >> levels
+
+
+def morton_index(tile_row, tile_col):
+    index = 0
+    bit = 0
+    while tile_row or tile_col:
+        index |= (tile_col & 1) << (2 * bit)
+        index |= (tile_row & 1) << (2 * bit + 1)
+        tile_row >>= 1
+        tile_col >>= 1
+        bit += 1
+    return index
+
+
+def to_morton(rows, n, leaf):
+    size, levels, tile = morton_layout(n, leaf)
+    tiles_per_side = 1 << levels
+    flat = [0.0] * (size * size)
+
+    for tile_row in range(tiles_per_side):
+        for tile_col in range(tiles_per_side):
+            base = morton_index(tile_row, tile_col) * tile * tile
+            col_start = tile_col * tile
+            col_end = min(col_start + tile, n)
+            if col_start >= n:
+                continue
+            for r in range(tile):
+                i = tile_row * tile + r
+                if i >= n:
+                    break
+                start = base + r * tile
+                flat[start:start + col_end - col_start] = rows[i][col_start:col_end]
+
+    return flat
+
+
+def from_morton(flat, n, leaf):
+    size, levels, tile = morton_layout(n, leaf)
+    rows = [[0.0] * n for _ in range(n)]
+
+    for i in range(n):
+        tile_row, r = divmod(i, tile)
+        row = rows[i]
+        for tile_col in range(-(-n // tile)):
+            base = morton_index(tile_row, tile_col) * tile * tile + r * tile
+            col_start = tile_col * tile
+            col_end = min(col_start + tile, n)
+            row[col_start:col_end] = flat[base:base + col_end - col_start]
+
+    return rows
+
+
+def _multiply_tile(A, B, C, a, b, c, tile):
+    b_rows = [B[b + k * tile:b + (k + 1) * tile] for k in range(tile)]
+    for i in range(tile):
+        c_start = c + i * tile
+        c_row = C[c_start:c_start + tile]
+        for aik, b_row in zip(A[a + i * tile:a + (i + 1) * tile], b_rows):
+            if aik:
+                c_row = [x + aik * y for x, y in zip(c_row, b_row)]
+        C[c_start:c_start + tile] = c_row
+
+
+def multiply_morton(A, B, C, size, tile):
+    def recurse(a, b, c, s):
+        if s == tile:
+            _multiply_tile(A, B, C, a, b, c, tile)
+            return
+
+        q = (s // 2) ** 2
+        half = s // 2
+        recurse(a, b, c, half)
+        recurse(a + q, b + 2 * q, c, half)
+        recurse(a, b + q, c + q, half)
+        recurse(a + q, b + 3 * q, c + q, half)
+        recurse(a + 2 * q, b, c + 2 * q, half)
+        recurse(a + 3 * q, b + 2 * q, c + 2 * q, half)
+        recurse(a + 2 * q, b + q, c + 3 * q, half)
+        recurse(a + 3 * q, b + 3 * q, c + 3 * q, half)
+
+    recurse(0, 0, 0, size)
+    return C
+
+
+def multiply_recursive(A, B, n, leaf=32):
+    C = [[0.0] * n for _ in range(n)]
+
+    def recurse(i0, i1, j0, j1, k0, k1):
+        di, dj, dk = i1 - i0, j1 - j0, k1 - k0
+        if di <= leaf and dj <= leaf and dk <= leaf:
+            for i in range(i0, i1):
+                a_row = A[i]
+                c_row = C[i]
+                block = c_row[j0:j1]
+                for k in range(k0, k1):
+                    aik = a_row[k]
+                    if aik:
+                        block = [x + aik * y for x, y in zip(block, B[k][j0:j1])]
+                c_row[j0:j1] = block
+            return
+
+        if di >= dj and di >= dk:
+            mid = i0 + di // 2
+            recurse(i0, mid, j0, j1, k0, k1)
+            recurse(mid, i1, j0, j1, k0, k1)
+        elif dj >= dk:
+            mid = j0 + dj // 2
+            recurse(i0, i1, j0, mid, k0, k1)
+            recurse(i0, i1, mid, j1, k0, k1)
+        else:
+            mid = k0 + dk // 2
+            recurse(i0, i1, j0, j1, k0, mid)
+            recurse(i0, i1, j0, j1, mid, k1)
+
+    if n:
+        recurse(0, n, 0, n, 0, n)
+    return C
+
+
+def multiply_recursive_morton(A, B, n, leaf=32):
+    size, levels, tile = morton_layout(n, leaf)
+    C = multiply_morton(to_morton(A, n, leaf), to_morton(B, n, leaf), [0.0] * (size * size), size, tile)
+    return from_morton(C, n, leaf)
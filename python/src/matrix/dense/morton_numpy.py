@@ -0,0 +1,94 @@
+import numpy as np
+from python.src.matrix.dense.morton import morton_index, morton_layout
+
+
+def _tile_order(levels):
+    tiles_per_side = 1 << levels
+    codes = np.array([morton_index(r, c) for r in range(tiles_per_side) for c in range(tiles_per_side)], dtype=np.int64)
+    return np.argsort(codes)
+
+
+def to_morton_numpy(A, leaf):
+    n = A.shape[0]
+    size, levels, tile = morton_layout(n, leaf)
+    tiles_per_side = 1 << levels
+
+    padded = np.zeros((size, size), dtype=A.dtype)
+    padded[:n, :n] = A
+
+    tiles = padded.reshape(tiles_per_side, tile, tiles_per_side, tile).transpose(0, 2, 1, 3)
+    tiles = tiles.reshape(tiles_per_side * tiles_per_side, tile, tile)
+    return np.ascontiguousarray(tiles[_tile_order(levels)]).reshape(-1)
+
+
+def from_morton_numpy(flat, n, leaf):
+    size, levels, tile = morton_layout(n, leaf)
+    tiles_per_side = 1 << levels
+
+    tiles = np.empty((tiles_per_side * tiles_per_side, tile, tile), dtype=flat.dtype)
+    tiles[_tile_order(levels)] = flat.reshape(-1, tile, tile)
+
+    padded = tiles.reshape(tiles_per_side, tiles_per_side, tile, tile).transpose(0, 2, 1, 3).reshape(size, size)
+    return np.ascontiguousarray(padded[:n, :n])
+
+
+def multiply_morton_numpy(A, B, size, tile):
+    C = np.zeros(size * size, dtype=np.result_type(A, B))
+    buffer = np.empty((tile, tile), dtype=C.dtype)
+
+    def recurse(a, b, c, s):
+        if s == tile:
+            area = tile * tile
+            np.matmul(A[a:a + area].reshape(tile, tile), B[b:b + area].reshape(tile, tile), out=buffer)
+            c_view = C[c:c + area].reshape(tile, tile)
+            np.add(c_view, buffer, out=c_view)
+            return
+
+        q = (s // 2) ** 2
+        half = s // 2
+        recurse(a, b, c, half)
+        recurse(a + q, b + 2 * q, c, half)
+        recurse(a, b + q, c + q, half)
+        recurse(a + q, b + 3 * q, c + q, half)
+        recurse(a + 2 * q, b, c + 2 * q, half)
+        recurse(a + 3 * q, b + 2 * q, c + 2 * q, half)
+        recurse(a + 2 * q, b + q, c + 3 * q, half)
+        recurse(a + 3 * q, b + 3 * q, c + 3 * q, half)
+
+    recurse(0, 0, 0, size)
+    return C
+
+
+def multiply_recursive_numpy(A, B, leaf=64):
+    n = A.shape[0]
+    C = np.zeros((n, n), dtype=np.result_type(A, B))
+
+    def recurse(i0, i1, j0, j1, k0, k1):
+        di, dj, dk = i1 - i0, j1 - j0, k1 - k0
+        if di <= leaf and dj <= leaf and dk <= leaf:
+            C[i0:i1, j0:j1] += A[i0:i1, k0:k1] @ B[k0:k1, j0:j1]
+            return
+
+        if di >= dj and di >= dk:
+            mid = i0 + di // 2
+            recurse(i0, mid, j0, j1, k0, k1)
+            recurse(mid, i1, j0, j1, k0, k1)
+        elif dj >= dk:
+            mid = j0 + dj // 2
+            recurse(i0, i1, j0, mid, k0, k1)
+            recurse(i0, i1, mid, j1, k0, k1)
+        else:
+            mid = k0 + dk // 2
+            recurse(i0, i1, j0, j1, k0, mid)
+            recurse(i0, i1, j0, j1, mid, k1)
+
+    if n:
+        recurse(0, n, 0, n, 0, n)
+    return C
+
+
+def multiply_recursive_morton_numpy(A, B, leaf=64):
+    n = A.shape[0]
+    size, levels, tile = morton_layout(n, leaf)
+    C = multiply_morton_numpy(to_morton_numpy(A, leaf), to_morton_numpy(B, leaf), size, tile)
+    return from_morton_numpy(C, n, leaf)
@@ -0,0 +1,103 @@
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+
+def tile_size_for_budget(memory_budget_mb, itemsize):
+    # Two A tiles and two B tiles (double buffering), one C accumulator and one product buffer.
+    budget_bytes = memory_budget_mb * 1024 * 1024
+    return max(1, int((budget_bytes / (6 * itemsize)) ** 0.5))
+
+
+def create_random_memmap(path, n, dtype=np.float64, chunk_rows=1024, seed=None):
+    rng = np.random.default_rng(seed)
+    matrix = np.memmap(path, dtype=dtype, mode='w+', shape=(n, n))
+    for start in range(0, n, chunk_rows):
+        end = min(start + chunk_rows, n)
+        matrix[start:end] = rng.random((end - start, n), dtype=np.float64).astype(dtype, copy=False)
+    matrix.flush()
+    return matrix
+
+
+def multiply_out_of_core(A, B, C, memory_budget_mb=256, tile=None):
+    n_rows, n_inner = A.shape
+    n_cols = B.shape[1]
+    if n_inner != B.shape[0]:
+        raise ValueError(f"Incompatible Dimensions: {A.shape} × {B.shape}")
+
+    dtype = C.dtype
+    tile = tile or tile_size_for_budget(memory_budget_mb, dtype.itemsize)
+
+    A_buffers = [np.empty((tile, tile), dtype=dtype) for _ in range(2)]
+    B_buffers = [np.empty((tile, tile), dtype=dtype) for _ in range(2)]
+    accumulator = np.empty((tile, tile), dtype=dtype)
+    product = np.empty((tile, tile), dtype=dtype)
+
+    tasks = [(i, j, k)
+             for i in range(0, n_rows, tile)
+             for j in range(0, n_cols, tile)
+             for k in range(0, n_inner, tile)]
+
+    def load(index):
+        i, j, k = tasks[index]
+        i_end, j_end, k_end = min(i + tile, n_rows), min(j + tile, n_cols), min(k + tile, n_inner)
+        a = A_buffers[index % 2][:i_end - i, :k_end - k]
+        b = B_buffers[index % 2][:k_end - k, :j_end - j]
+
+        start = time.perf_counter()
+        np.copyto(a, A[i:i_end, k:k_end])
+        np.copyto(b, B[k:k_end, j:j_end])
+        return a, b, time.perf_counter() - start
+
+    bytes_read = 0
+    bytes_written = 0
+    read_seconds = 0.0
+    write_seconds = 0.0
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=1) as loader:
+        pending = loader.submit(load, 0) if tasks else None
+
+        for index, (i, j, k) in enumerate(tasks):
+            a, b, seconds = pending.result()
+            if index + 1 < len(tasks):
+                pending = loader.submit(load, index + 1)
+
+            read_seconds += seconds
+            bytes_read += a.nbytes + b.nbytes
+
+            c = accumulator[:a.shape[0], :b.shape[1]]
+            if k == 0:
+                np.matmul(a, b, out=c)
+            else:
+                p = product[:a.shape[0], :b.shape[1]]
+                np.matmul(a, b, out=p)
+                np.add(c, p, out=c)
+
+            if k + tile >= n_inner:
+                write_start = time.perf_counter()
+                C[i:i + c.shape[0], j:j + c.shape[1]] = c
+                write_seconds += time.perf_counter() - write_start
+                bytes_written += c.nbytes
+
+    if isinstance(C, np.memmap):
+        write_start = time.perf_counter()
+        C.flush()
+        write_seconds += time.perf_counter() - write_start
+
+    elapsed = time.perf_counter() - start
+    flops = 2 * n_rows * n_inner * n_cols
+    buffer_bytes = sum(x.nbytes for x in A_buffers + B_buffers) + accumulator.nbytes + product.nbytes
+
+    return {
+        'seconds': elapsed,
+        'tile': tile,
+        'gflops': flops / elapsed / 1e9 if elapsed > 0 else 0.0,
+        'bytes_read': bytes_read,
+        'bytes_written': bytes_written,
+        'io_gbps': (bytes_read + bytes_written) / elapsed / 1e9 if elapsed > 0 else 0.0,
+        'read_seconds': read_seconds,
+        'write_seconds': write_seconds,
+        'buffer_mb': buffer_bytes / (1024 * 1024),
+    }
@@ -0,0 +1,81 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from python.src.matrix.shared import attach_shared_array, create_shared_array, release_shared_arrays
+
+
+_worker = {}
+
+
+def _init_worker(a_name, b_name, c_name, n):
+    # B is read through the shared view, never copied per worker; the views are released
+    # before the segments are closed when the worker exits.
+    shms = [attach_shared_array(name) for name in (a_name, b_name, c_name)]
+    A, B, C = (shm.buf.cast('d') for shm in shms)
+
+    _worker['shms'] = shms
+    _worker['A'] = A
+    _worker['B'] = B
+    _worker['C'] = C
+    _worker['n'] = n
+    Finalize(None, _release_worker, exitpriority=10)
+
+
+def _release_worker():
+    for name in ('A', 'B', 'C'):
+        _worker.pop(name).release()
+    for shm in _worker.pop('shms'):
+        shm.close()
+
+
+def _multiply_row_block(row_start, row_end):
+    n = _worker['n']
+    A = _worker['A']
+    B = _worker['B']
+    C = _worker['C']
+
+    for i in range(row_start, row_end):
+        c_row = [0.0] * n
+        for k, aik in enumerate(A[i * n:(i + 1) * n].tolist()):
+            if aik:
+                c_row = [c + aik * b for c, b in zip(c_row, B[k * n:(k + 1) * n])]
+        C[i * n:(i + 1) * n] = array('d', c_row)
+
+    return row_end - row_start
+
+
+def row_blocks(n, workers, block_rows=None):
+    if block_rows is None:
+        block_rows = max(1, -(-n // (workers * 4)))
+    return [(start, min(start + block_rows, n)) for start in range(0, n, block_rows)]
+
+
+def multiply_parallel(A_rows, B_rows, n, workers=None, block_rows=None):
+    workers = workers or os.cpu_count() or 1
+
+    shm_a = create_shared_array('d', n * n)
+    shm_b = create_shared_array('d', n * n)
+    shm_c = create_shared_array('d', n * n)
+    shms = [shm_a, shm_b, shm_c]
+
+    try:
+        for shm, rows in ((shm_a, A_rows), (shm_b, B_rows)):
+            view = shm.buf.cast('d')
+            for i, row in enumerate(rows):
+                view[i * n:(i + 1) * n] = array('d', row)
+            view.release()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shm_a.name, shm_b.name, shm_c.name, n)) as pool:
+            futures = [pool.submit(_multiply_row_block, start, end) for start, end in row_blocks(n, workers, block_rows)]
+            for future in futures:
+                future.result()
+
+        view = shm_c.buf.cast('d')
+        C = [view[i * n:(i + 1) * n].tolist() for i in range(n)]
+        view.release()
+    finally:
+        release_shared_arrays(shms)
+
+    return C
@@ -0,0 +1,195 @@
+from operator import add, sub
+
+
+def padded_size(n, cutoff):
+    levels = 0
+    leaf = n
+    while leaf > cutoff:
+        leaf = -(-leaf // 2)
+        levels += 1
+    return leaf << levels, levels
+
+
+def _combine(dst, X, Y, h, op):
+    d_buf, d_off, d_stride = dst
+    x_buf, x_off, x_stride = X
+    y_buf, y_off, y_stride = Y
+    for r in range(h):
+        xs = x_off + r * x_stride
+        ys = y_off + r * y_stride
+        ds = d_off + r * d_stride
+        d_buf[ds:ds + h] = map(op, x_buf[xs:xs + h], y_buf[ys:ys + h])
+
+
+def _copy(dst, src, h):
+    d_buf, d_off, d_stride = dst
+    s_buf, s_off, s_stride = src
+    for r in range(h):
+        ds = d_off + r * d_stride
+        ss = s_off + r * s_stride
+        d_buf[ds:ds + h] = s_buf[ss:ss + h]
+
+
+def _multiply_leaf(A, B, C, h):
+    a_buf, a_off, a_stride = A
+    b_buf, b_off, b_stride = B
+    c_buf, c_off, c_stride = C
+
+    b_rows = [b_buf[b_off + k * b_stride:b_off + k * b_stride + h] for k in range(h)]
+
+    for i in range(h):
+        a_start = a_off + i * a_stride
+        c_row = [0] * h
+        for aik, b_row in zip(a_buf[a_start:a_start + h], b_rows):
+            if aik:
+                c_row = [c + aik * b for c, b in zip(c_row, b_row)]
+        c_start = c_off + i * c_stride
+        c_buf[c_start:c_start + h] = c_row
+
+
+class _StrassenEngine:
+
+    def __init__(self, size, levels, winograd):
+        self.levels = levels
+        self.winograd = winograd
+
+        self.offsets = []
+        total = 0
+        h = size
+        for _ in range(levels):
+            h //= 2
+            self.offsets.append(total)
+            total += 3 * h * h
+        self.arena = [0] * total
+
+    def multiply(self, A, B, C, h, level=0):
+        if level == self.levels:
+            _multiply_leaf(A, B, C, h)
+            return
+
+        half = h // 2
+
+        def quadrant(V, row, col):
+            buf, off, stride = V
+            return (buf, off + row * half * stride + col * half, stride)
+
+        A11, A12, A21, A22 = quadrant(A, 0, 0), quadrant(A, 0, 1), quadrant(A, 1, 0), quadrant(A, 1, 1)
+        B11, B12, B21, B22 = quadrant(B, 0, 0), quadrant(B, 0, 1), quadrant(B, 1, 0), quadrant(B, 1, 1)
+        C11, C12, C21, C22 = quadrant(C, 0, 0), quadrant(C, 0, 1), quadrant(C, 1, 0), quadrant(C, 1, 1)
+
+        base = self.offsets[level]
+        X = (self.arena, base, half)
+        Y = (self.arena, base + half * half, half)
+        Z = (self.arena, base + 2 * half * half, half)
+
+        if self.winograd:
+            self._winograd_step(A11, A12, A21, A22, B11, B12, B21, B22, C11, C12, C21, C22, X, Y, Z, half, level)
+        else:
+            self._strassen_step(A11, A12, A21, A22, B11, B12, B21, B22, C11, C12, C21, C22, X, Y, Z, half, level)
+
+    def _strassen_step(self, A11, A12, A21, A22, B11, B12, B21, B22, C11, C12, C21, C22, X, Y, Z, h, level):
+        recurse = self.multiply
+        nxt = level + 1
+
+        _combine(X, A11, A22, h, add)
+        _combine(Y, B11, B22, h, add)
+        recurse(X, Y, Z, h, nxt)
+        _copy(C11, Z, h)
+        _copy(C22, Z, h)
+
+        _combine(X, A21, A22, h, add)
+        recurse(X, B11, C21, h, nxt)
+        _combine(C22, C22, C21, h, sub)
+
+        _combine(Y, B12, B22, h, sub)
+        recurse(A11, Y, C12, h, nxt)
+        _combine(C22, C22, C12, h, add)
+
+        _combine(Y, B21, B11, h, sub)
+        recurse(A22, Y, Z, h, nxt)
+        _combine(C11, C11, Z, h, add)
+        _combine(C21, C21, Z, h, add)
+
+        _combine(X, A11, A12, h, add)
+        recurse(X, B22, Z, h, nxt)
+        _combine(C11, C11, Z, h, sub)
+        _combine(C12, C12, Z, h, add)
+
+        _combine(X, A21, A11, h, sub)
+        _combine(Y, B11, B12, h, add)
+        recurse(X, Y, Z, h, nxt)
+        _combine(C22, C22, Z, h, add)
+
+        _combine(X, A12, A22, h, sub)
+        _combine(Y, B21, B22, h, add)
+        recurse(X, Y, Z, h, nxt)
+        _combine(C11, C11, Z, h, add)
+
+    def _winograd_step(self, A11, A12, A21, A22, B11, B12, B21, B22, C11, C12, C21, C22, X, Y, Z, h, level):
+        recurse = self.multiply
+        nxt = level + 1
+
+        _combine(X, A11, A21, h, sub)
+        _combine(Y, B22, B12, h, sub)
+        recurse(X, Y, Z, h, nxt)
+
+        _combine(X, A21, A22, h, add)
+        _combine(Y, B12, B11, h, sub)
+        recurse(X, Y, C22, h, nxt)
+
+        _combine(X, X, A11, h, sub)
+        _combine(Y, B22, Y, h, sub)
+        recurse(X, Y, C12, h, nxt)
+
+        recurse(A11, B11, C11, h, nxt)
+
+        _combine(C12, C12, C11, h, add)
+        _combine(Z, C12, Z, h, add)
+        _combine(C12, C12, C22, h, add)
+        _combine(C22, Z, C22, h, add)
+
+        _combine(Y, Y, B21, h, sub)
+        recurse(A22, Y, C21, h, nxt)
+        _combine(C21, Z, C21, h, sub)
+
+        _combine(X, A12, X, h, sub)
+        recurse(X, B22, Y, h, nxt)
+        _combine(C12, C12, Y, h, add)
+
+        recurse(A12, B21, Y, h, nxt)
+        _combine(C11, C11, Y, h, add)
+
+
+def strassen_multiply_flat(A, B, n, cutoff=64, winograd=False):
+    size, levels = padded_size(n, cutoff)
+
+    if size == n:
+        A_padded = list(A)
+        B_padded = list(B)
+    else:
+        A_padded = [0] * (size * size)
+        B_padded = [0] * (size * size)
+        for i in range(n):
+            A_padded[i * size:i * size + n] = A[i * n:(i + 1) * n]
+            B_padded[i * size:i * size + n] = B[i * n:(i + 1) * n]
+
+    C_padded = [0] * (size * size)
+
+    engine = _StrassenEngine(size, levels, winograd)
+    engine.multiply((A_padded, 0, size), (B_padded, 0, size), (C_padded, 0, size), size)
+
+    if size == n:
+        return C_padded
+
+    C = []
+    for i in range(n):
+        C.extend(C_padded[i * size:i * size + n])
+    return C
+
+
+def strassen_multiply(A, B, n, cutoff=64, winograd=False):
+    A_flat = [value for row in A for value in row]
+    B_flat = [value for row in B for value in row]
+
+    C = strassen_multiply_flat(A_flat, B_flat, n, cutoff, winograd)
+    return [C[i * n:(i + 1) * n] for i in range(n)]
@@ -0,0 +1,164 @@
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
+from python.src.matrix.dense.strassen import padded_size
+
+
+def _quadrants(M, half):
+    return M[:half, :half], M[:half, half:], M[half:, :half], M[half:, half:]
+
+
+class StrassenWorkspace:
+
+    def __init__(self, size, levels, dtype):
+        self.levels = levels
+        self.buffers = []
+        h = size
+        for _ in range(levels):
+            h //= 2
+            self.buffers.append(np.empty((3, h, h), dtype=dtype))
+
+    def multiply(self, A, B, C, level=0):
+        if level == self.levels:
+            np.matmul(A, B, out=C)
+            return
+
+        half = A.shape[0] // 2
+        A11, A12, A21, A22 = _quadrants(A, half)
+        B11, B12, B21, B22 = _quadrants(B, half)
+        C11, C12, C21, C22 = _quadrants(C, half)
+        X, Y, Z = self.buffers[level]
+        nxt = level + 1
+
+        np.add(A11, A22, out=X)
+        np.add(B11, B22, out=Y)
+        self.multiply(X, Y, Z, nxt)
+        np.copyto(C11, Z)
+        np.copyto(C22, Z)
+
+        np.add(A21, A22, out=X)
+        self.multiply(X, B11, C21, nxt)
+        np.subtract(C22, C21, out=C22)
+
+        np.subtract(B12, B22, out=Y)
+        self.multiply(A11, Y, C12, nxt)
+        np.add(C22, C12, out=C22)
+
+        np.subtract(B21, B11, out=Y)
+        self.multiply(A22, Y, Z, nxt)
+        np.add(C11, Z, out=C11)
+        np.add(C21, Z, out=C21)
+
+        np.add(A11, A12, out=X)
+        self.multiply(X, B22, Z, nxt)
+        np.subtract(C11, Z, out=C11)
+        np.add(C12, Z, out=C12)
+
+        np.subtract(A21, A11, out=X)
+        np.add(B11, B12, out=Y)
+        self.multiply(X, Y, Z, nxt)
+        np.add(C22, Z, out=C22)
+
+        np.subtract(A12, A22, out=X)
+        np.add(B21, B22, out=Y)
+        self.multiply(X, Y, Z, nxt)
+        np.add(C11, Z, out=C11)
+
+
+class ParallelStrassenWorkspace:
+
+    # The seven top-level products run on threads: S/T hold the operand sums, M the
+    # products, and each worker owns a workspace for the levels below. Allocated once
+    # per (size, levels, dtype, workers) and reused across calls.
+
+    def __init__(self, size, levels, dtype, workers):
+        half = size // 2
+        self.S = np.empty((5, half, half), dtype=dtype)
+        self.T = np.empty((5, half, half), dtype=dtype)
+        self.M = np.empty((7, half, half), dtype=dtype)
+        self.workers = min(workers, 7)
+        self.workspaces = SimpleQueue()
+        for _ in range(self.workers):
+            self.workspaces.put(StrassenWorkspace(half, levels - 1, dtype))
+
+    def multiply(self, A, B, C):
+        half = A.shape[0] // 2
+        A11, A12, A21, A22 = _quadrants(A, half)
+        B11, B12, B21, B22 = _quadrants(B, half)
+        C11, C12, C21, C22 = _quadrants(C, half)
+        S, T, M = self.S, self.T, self.M
+
+        np.add(A11, A22, out=S[0])
+        np.add(A21, A22, out=S[1])
+        np.add(A11, A12, out=S[2])
+        np.subtract(A21, A11, out=S[3])
+        np.subtract(A12, A22, out=S[4])
+
+        np.add(B11, B22, out=T[0])
+        np.subtract(B12, B22, out=T[1])
+        np.subtract(B21, B11, out=T[2])
+        np.add(B11, B12, out=T[3])
+        np.add(B21, B22, out=T[4])
+
+        products = [(S[0], T[0]), (S[1], B11), (A11, T[1]), (A22, T[2]), (S[2], B22), (S[3], T[3]), (S[4], T[4])]
+
+        def compute(index):
+            X, Y = products[index]
+            workspace = self.workspaces.get()
+            try:
+                workspace.multiply(X, Y, M[index])
+            finally:
+                self.workspaces.put(workspace)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(compute, range(7)))
+
+        M1, M2, M3, M4, M5, M6, M7 = M
+
+        np.add(M1, M4, out=C11)
+        np.subtract(C11, M5, out=C11)
+        np.add(C11, M7, out=C11)
+
+        np.add(M3, M5, out=C12)
+        np.add(M2, M4, out=C21)
+
+        np.subtract(M1, M2, out=C22)
+        np.add(C22, M3, out=C22)
+        np.add(C22, M6, out=C22)
+
+
+# The last workspace each calling thread used; repeated multiplies of one size reuse it.
+_cached = threading.local()
+
+
+def workspace_for(size, levels, dtype, workers=1):
+    parallel = levels > 0 and workers > 1
+    key = (size, levels, np.dtype(dtype), min(workers, 7) if parallel else 1)
+    if getattr(_cached, 'key', None) != key:
+        _cached.key = key
+        _cached.workspace = (ParallelStrassenWorkspace(size, levels, dtype, workers) if parallel
+                             else StrassenWorkspace(size, levels, dtype))
+    return _cached.workspace
+
+
+def strassen_numpy(A, B, cutoff=64, workers=1):
+    n = A.shape[0]
+    dtype = np.result_type(A, B)
+    size, levels = padded_size(n, cutoff)
+
+    if size != n:
+        A_padded = np.zeros((size, size), dtype=dtype)
+        B_padded = np.zeros((size, size), dtype=dtype)
+        A_padded[:n, :n] = A
+        B_padded[:n, :n] = B
+        A, B = A_padded, B_padded
+    else:
+        A = np.asarray(A, dtype=dtype)
+        B = np.asarray(B, dtype=dtype)
+
+    C = np.empty((size, size), dtype=dtype)
+
+    workspace_for(size, levels, dtype, workers).multiply(A, B, C)
+
+    return C if size == n else C[:n, :n]
@@ -1,12 +1,24 @@
-import random
 import numpy as np
+from python.src.matrix.dtypes import is_integer, random_value_func
 
-def generate_matrices(n):
-    A = [[random.random() for _ in range(n)] for _ in range(n)]
-    B = [[random.random() for _ in range(n)] for _ in range(n)]
+def generate_matrices(n, dtype='float64'):
+    value = random_value_func(dtype)
+    A = [[value() for _ in range(n)] for _ in range(n)]
+    B = [[value() for _ in range(n)] for _ in range(n)]
     return A, B
 
-def generate_matrices_numpy(n):
-    A = np.random.rand(n, n)
-    B = np.random.rand(n, n)
-    return A, B
\ No newline at end of file
+def random_numpy(shape, dtype=np.float64):
+    if is_integer(dtype):
+        return np.random.randint(1, 9, size=shape).astype(dtype)
+    return np.random.rand(*shape).astype(dtype, copy=False)
+
+def generate_matrices_numpy(n, dtype=np.float64):
+    A = random_numpy((n, n), dtype)
+    B = random_numpy((n, n), dtype)
+    return A, B
+
+def relative_error(result, reference):
+    reference = np.asarray(reference, dtype=np.float64)
+    difference = np.asarray(result, dtype=np.float64) - reference
+    norm = np.linalg.norm(reference)
+    return float(np.linalg.norm(difference) / norm) if norm > 0 else float(np.linalg.norm(difference))
\ No newline at end of file
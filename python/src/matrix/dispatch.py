@@ -0,0 +1,274 @@
+import csv
+import os
+from collections import namedtuple
+import numpy as np
+from scipy.optimize import nnls
+from python.src.matrix.dense.matrix import DenseMatrix
+from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+from python.src.matrix.sparse.parallel_scipy import row_flops
+
+
+COST_MODEL_ENV = "MATRIX_COST_MODEL_DIR"
+
+KERNEL_CSV = "dense_vs_sparse.csv"
+CONVERSION_CSV = "conversion_costs.csv"
+
+# Names match the Algorithm column of dense_vs_sparse.csv.
+REPRESENTATIONS = {
+    'Dense-Python': DenseMatrix,
+    'Sparse-CSR': SparseMatrixCSR,
+    'Dense-NumPy': DenseMatrixNumPy,
+    'Sparse-SciPy': SparseMatrixSciPy,
+}
+
+KERNELS = {
+    'Dense-Python': lambda A, B: A.multiply_row_oriented(B),
+    'Sparse-CSR': lambda A, B: A.multiply(B),
+    'Dense-NumPy': lambda A, B: A.multiply_matmul(B),
+    'Sparse-SciPy': lambda A, B: A.multiply(B),
+}
+
+# Seconds per feature, fitted on this repository's results/ CSVs. Dense kernels use
+# (1, output cells, multiply-adds); sparse kernels (1, rows, flops, output non-zeros).
+DEFAULT_KERNEL_COEFFICIENTS = {
+    'Dense-Python': (0.0, 1.08e-06, 9.37e-08),
+    'Sparse-CSR': (0.0, 9.52e-07, 3.88e-07, 5.05e-06),
+    'Dense-NumPy': (0.000112, 1.21e-08, 7.25e-12),
+    'Sparse-SciPy': (0.000168, 0.0, 1.68e-09, 9.97e-09),
+}
+
+# Seconds per (1, cells, non-zeros) for each (source, target) conversion.
+DEFAULT_CONVERSION_COEFFICIENTS = {
+    ('Dense-Python', 'Sparse-CSR'): (0.0, 5.7e-08, 1.32e-07),
+    ('Dense-Python', 'Dense-NumPy'): (4.43e-05, 9.18e-08, 0.0),
+    ('Dense-Python', 'Sparse-SciPy'): (0.000243, 9.98e-08, 6.56e-08),
+    ('Sparse-CSR', 'Dense-Python'): (1.69e-05, 6.9e-09, 9.02e-08),
+    ('Sparse-CSR', 'Dense-NumPy'): (6.74e-05, 1.67e-09, 1.33e-07),
+    ('Sparse-CSR', 'Sparse-SciPy'): (3.92e-05, 3.94e-10, 1.31e-07),
+    ('Dense-NumPy', 'Dense-Python'): (0.0, 3.49e-08, 0.0),
+    ('Dense-NumPy', 'Sparse-CSR'): (0.000152, 9.4e-09, 9.58e-08),
+    ('Dense-NumPy', 'Sparse-SciPy'): (0.000167, 6.89e-09, 5.09e-08),
+    ('Sparse-SciPy', 'Dense-Python'): (0.0, 3.98e-08, 0.0),
+    ('Sparse-SciPy', 'Sparse-CSR'): (0.0, 2.42e-10, 4.68e-08),
+    ('Sparse-SciPy', 'Dense-NumPy'): (3.58e-06, 1.28e-09, 2.98e-09),
+}
+
+Profile = namedtuple('Profile', ['rows', 'inner', 'cols', 'nnz_a', 'nnz_b', 'flops', 'nnz_out'])
+
+Decision = namedtuple('Decision', ['kernel', 'conversions', 'estimated_seconds', 'candidates', 'profile'])
+
+
+def representation(matrix):
+    for name, cls in REPRESENTATIONS.items():
+        if type(matrix) is cls:
+            return name
+    raise ValueError(f"Unsupported matrix type: {type(matrix).__name__} (expected one of {tuple(REPRESENTATIONS)})")
+
+
+def numbers_non_zero(matrix):
+    if isinstance(matrix, DenseMatrix):
+        return sum(len(row) - row.count(0) for row in matrix.data)
+    if isinstance(matrix, DenseMatrixNumPy):
+        return int(np.count_nonzero(matrix.data))
+    return matrix.numbers_non_zero()
+
+
+def _csr_structure(matrix):
+    if isinstance(matrix, SparseMatrixSciPy):
+        return matrix.matrix.indptr, matrix.matrix.indices
+    if isinstance(matrix, SparseMatrixCSR):
+        return np.asarray(matrix.row_ptr), np.asarray(matrix.col_index)
+    return None
+
+
+def expected_non_zeros(flops, cols):
+    # Each product lands in one of `cols` columns; with independent columns the row
+    # fills cols * (1 - exp(-flops / cols)) distinct entries.
+    return cols * -np.expm1(-np.asarray(flops, dtype=np.float64) / cols) if cols else 0.0
+
+
+def profile(A, B):
+    rows, inner = A.shape
+    cols = B.shape[1]
+    nnz_a, nnz_b = numbers_non_zero(A), numbers_non_zero(B)
+
+    a_structure, b_structure = _csr_structure(A), _csr_structure(B)
+    if a_structure is not None and b_structure is not None:
+        flops = row_flops(a_structure[0], a_structure[1], b_structure[0])
+        nnz_out = float(np.sum(expected_non_zeros(flops, cols)))
+        flops = int(np.sum(flops))
+    else:
+        # Without a column structure for A, assume non-zeros are spread uniformly.
+        flops = nnz_a * nnz_b / inner if inner else 0
+        nnz_out = rows * float(expected_non_zeros(flops / rows, cols)) if rows else 0.0
+
+    return Profile(rows, inner, cols, nnz_a, nnz_b, flops, nnz_out)
+
+
+def kernel_features(kernel, p):
+    if kernel.startswith('Dense'):
+        return (1, p.rows * p.cols, p.rows * p.inner * p.cols)
+    return (1, p.rows, p.flops, p.nnz_out)
+
+
+def conversion_features(shape, nnz):
+    return (1, shape[0] * shape[1], nnz)
+
+
+def fit(features, times):
+    # Non-negative least squares on relative error, so small and large sizes weigh the same.
+    X = np.array(features, dtype=np.float64)
+    t = np.array(times, dtype=np.float64)
+    keep = t > 0
+    X, t = X[keep], t[keep]
+    if len(t) < X.shape[1]:
+        return None
+
+    scale = X.max(axis=0)
+    scale[scale == 0] = 1
+    coefficients, _ = nnls(X / scale / t[:, None], np.ones(len(t)))
+    return tuple(float(c) for c in coefficients / scale)
+
+
+class CostModel:
+
+    def __init__(self, kernels=None, conversions=None):
+        self.kernels = dict(DEFAULT_KERNEL_COEFFICIENTS)
+        self.kernels.update(kernels or {})
+        self.conversions = dict(DEFAULT_CONVERSION_COEFFICIENTS)
+        self.conversions.update(conversions or {})
+
+    @classmethod
+    def from_csv(cls, kernel_csv=None, conversion_csv=None):
+        kernels = {}
+        if kernel_csv and os.path.exists(kernel_csv):
+            samples = {}
+            with open(kernel_csv, newline='') as f:
+                for row in csv.DictReader(f):
+                    if row.get('DType', 'float64') != 'float64' or row.get('Structure', 'uniform') != 'uniform':
+                        continue
+                    if row['Algorithm'] not in REPRESENTATIONS:
+                        continue
+                    # Both operands were generated at the same density, so A's nnz stands in for B's.
+                    n, nnz = int(row['Size']), int(row['NonZeroElements'])
+                    flops = nnz * nnz / n
+                    p = Profile(n, n, n, nnz, nnz, flops, n * float(expected_non_zeros(flops / n, n)))
+                    features, times = samples.setdefault(row['Algorithm'], ([], []))
+                    features.append(kernel_features(row['Algorithm'], p))
+                    times.append(float(row['AvgTimeSeconds']))
+
+            for kernel, (features, times) in samples.items():
+                coefficients = fit(features, times)
+                if coefficients is not None:
+                    kernels[kernel] = coefficients
+
+        conversions = {}
+        if conversion_csv and os.path.exists(conversion_csv):
+            samples = {}
+            with open(conversion_csv, newline='') as f:
+                for row in csv.DictReader(f):
+                    features, times = samples.setdefault((row['Source'], row['Target']), ([], []))
+                    features.append(conversion_features((int(row['Rows']), int(row['Cols'])), int(row['NonZeroElements'])))
+                    times.append(float(row['TimeSeconds']))
+
+            for pair, (features, times) in samples.items():
+                coefficients = fit(features, times)
+                if coefficients is not None:
+                    conversions[pair] = coefficients
+
+        return cls(kernels, conversions)
+
+    def kernel_seconds(self, kernel, p):
+        return sum(c * x for c, x in zip(self.kernels[kernel], kernel_features(kernel, p)))
+
+    def conversion_seconds(self, source, target, shape, nnz):
+        if source == target:
+            return 0.0
+        return sum(c * x for c, x in zip(self.conversions[(source, target)], conversion_features(shape, nnz)))
+
+
+def default_results_dir():
+    if os.environ.get(COST_MODEL_ENV):
+        return os.environ[COST_MODEL_ENV]
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'results')
+
+
+_default_model = None
+
+
+def default_cost_model():
+    global _default_model
+    if _default_model is None:
+        results = default_results_dir()
+        _default_model = CostModel.from_csv(os.path.join(results, KERNEL_CSV), os.path.join(results, CONVERSION_CSV))
+    return _default_model
+
+
+def convert(matrix, target):
+    source = representation(matrix)
+    if target not in REPRESENTATIONS:
+        raise ValueError(f"Unknown representation: {target} (expected one of {tuple(REPRESENTATIONS)})")
+    if source == target:
+        return matrix
+
+    if target == 'Dense-Python':
+        if source == 'Sparse-CSR':
+            return DenseMatrix(matrix.to_dense())
+        return DenseMatrix(matrix.data.tolist() if source == 'Dense-NumPy' else matrix.to_dense().tolist())
+
+    if target == 'Dense-NumPy':
+        if source == 'Sparse-SciPy':
+            return DenseMatrixNumPy(matrix.to_dense(), copy=False)
+        if source == 'Sparse-CSR':
+            return DenseMatrixNumPy(convert(matrix, 'Sparse-SciPy').to_dense(), copy=False)
+        return DenseMatrixNumPy(matrix.data)
+
+    if target == 'Sparse-SciPy':
+        if source == 'Sparse-CSR':
+            return SparseMatrixSciPy.from_csr(matrix)
+        return SparseMatrixSciPy.from_dense(matrix.data)
+
+    if source == 'Dense-Python':
+        return SparseMatrixCSR.from_dense(matrix.data)
+    scipy_matrix = (matrix if source == 'Sparse-SciPy' else convert(matrix, 'Sparse-SciPy')).matrix
+    return SparseMatrixCSR(scipy_matrix.data.tolist(), scipy_matrix.indices.tolist(), scipy_matrix.indptr.tolist(),
+                           scipy_matrix.shape)
+
+
+def decide(A, B, model=None, kernels=None):
+    sources = (representation(A), representation(B))
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(f"Incompatible Dimensions: {A.shape} × {B.shape}")
+    model = default_cost_model() if model is None else model
+    kernels = tuple(KERNELS) if kernels is None else tuple(kernels)
+    for kernel in kernels:
+        if kernel not in KERNELS:
+            raise ValueError(f"Unknown kernel: {kernel} (expected one of {tuple(KERNELS)})")
+
+    p = profile(A, B)
+    nnz = (p.nnz_a, p.nnz_b)
+    shapes = (A.shape, B.shape)
+    square = p.rows == p.inner == p.cols
+
+    candidates = {}
+    for kernel in kernels:
+        # The pure dense kernel only handles square operands.
+        if kernel == 'Dense-Python' and not square:
+            continue
+        candidates[kernel] = model.kernel_seconds(kernel, p) + sum(
+            model.conversion_seconds(source, kernel, shape, count) for source, shape, count in zip(sources, shapes, nnz))
+
+    if not candidates:
+        raise ValueError(f"No kernel in {kernels} supports {A.shape} × {B.shape}")
+
+    kernel = min(candidates, key=candidates.get)
+    conversions = tuple((operand, source, kernel) for operand, source in zip('AB', sources) if source != kernel)
+    return Decision(kernel, conversions, candidates[kernel], candidates, p)
+
+
+def multiply(A, B, model=None, kernels=None, report=False):
+    decision = decide(A, B, model, kernels)
+    result = KERNELS[decision.kernel](convert(A, decision.kernel), convert(B, decision.kernel))
+    return (result, decision) if report else result
@@ -0,0 +1,49 @@
+import random
+from functools import wraps
+
+
+DTYPES = ('float64', 'float32', 'int64', 'int32')
+
+ARRAY_TYPECODES = {'float64': 'd', 'float32': 'f', 'int64': 'q', 'int32': 'i'}
+
+
+def dtype_name(dtype):
+    if dtype is None or dtype is float:
+        return 'float64'
+    if dtype is int:
+        return 'int64'
+
+    name = getattr(dtype, 'name', None)
+    if not isinstance(name, str):
+        name = getattr(dtype, '__name__', None) or str(dtype)
+
+    if name not in DTYPES:
+        raise ValueError(f"Unsupported dtype: {dtype} (expected one of {DTYPES})")
+    return name
+
+
+def storage_typecode(storage):
+    # array.array and memoryview storage both carry an array-module type code.
+    return storage.typecode if hasattr(storage, 'typecode') else storage.format
+
+
+def checked_product(method):
+    # Integer array storage raises OverflowError where NumPy and SciPy wrap around;
+    # report it as a dtype error instead.
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except OverflowError:
+            raise ValueError(f"Product overflows {self.dtype} storage: convert the operands to a wider dtype") from None
+    return wrapper
+
+
+def is_integer(dtype):
+    return dtype_name(dtype).startswith('int')
+
+
+def random_value_func(dtype, rng=random):
+    if is_integer(dtype):
+        return lambda: rng.randint(1, 9)
+    return rng.random
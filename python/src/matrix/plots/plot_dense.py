@@ -10,10 +10,19 @@ sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (10, 6)
 plt.rcParams['font.size'] = 11
 
-def load_data(csv_path):
+def load_data(csv_path, dtype='float64'):
     df = pd.read_csv(csv_path)
+    if 'DType' in df.columns:
+        df = df[df['DType'] == dtype]
     return df.groupby(['Algorithm', 'Size']).agg({'TimeSeconds': 'mean', 'MemoryMB': 'mean'}).reset_index()
 
+def load_dtype_data(csv_path):
+    df = pd.read_csv(csv_path)
+    if 'DType' not in df.columns:
+        return None
+    df = df[df['Algorithm'].str.startswith('NumPy')]
+    return df.groupby(['Algorithm', 'DType', 'Size']).agg({'TimeSeconds': 'mean', 'RelativeError': 'max'}).reset_index()
+
 def plot_python_pure(df, output_dir):
     algorithms = ['Standard', 'Row-Oriented', 'Tiled-32', 'Tiled-64', 'Strassen']
     data = df[df['Algorithm'].isin(algorithms)]
@@ -125,6 +134,43 @@ def plot_memory(df, output_dir):
     plt.savefig(f'{output_dir}/memory_comparison_dense.png', dpi=300)
     plt.close()
 
+def plot_dtype_tradeoff(df, output_dir):
+    variants = [('NumPy-matmul', 'float64'), ('NumPy-matmul', 'float32'),
+                ('NumPy-Strassen', 'float64'), ('NumPy-Strassen', 'float32'),
+                ('NumPy-Mixed-Accumulate', 'mixed'), ('NumPy-Mixed-Refine', 'mixed')]
+    
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    
+    for algo, dtype in variants:
+        subset = df[(df['Algorithm'] == algo) & (df['DType'] == dtype)]
+        if subset.empty:
+            continue
+        label = algo if dtype == 'mixed' else f'{algo} ({dtype})'
+        ax1.plot(subset['Size'], subset['TimeSeconds'], marker='o', label=label, linewidth=2)
+        errors = subset.dropna(subset=['RelativeError'])
+        if not errors.empty:
+            ax2.plot(errors['Size'], errors['RelativeError'], marker='s', label=label, linewidth=2)
+    
+    ax1.set_xlabel('Matrix Size (n×n)')
+    ax1.set_ylabel('Time (seconds)')
+    ax1.set_title('NumPy - Time by Data Type')
+    ax1.set_xscale('log', base=2)
+    ax1.set_yscale('log')
+    ax1.legend()
+    ax1.grid(True, which="both", ls="-", alpha=0.3)
+    
+    ax2.set_xlabel('Matrix Size (n×n)')
+    ax2.set_ylabel('Relative Error vs float64')
+    ax2.set_title('NumPy - Accuracy by Data Type')
+    ax2.set_xscale('log', base=2)
+    ax2.set_yscale('log')
+    ax2.legend()
+    ax2.grid(True, which="both", ls="-", alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig(f'{output_dir}/dtype_tradeoff_dense.png', dpi=300)
+    plt.close()
+
 if __name__ == "__main__":
     if len(sys.argv) < 3:
         print("Usage: python plot_dense.py <csv_file> <output_directory>")
@@ -144,4 +190,8 @@ if __name__ == "__main__":
     plot_comparison(df, output_dir)
     plot_memory(df, output_dir)
     
+    dtype_df = load_dtype_data(csv_file)
+    if dtype_df is not None:
+        plot_dtype_tradeoff(dtype_df, output_dir)
+    
     print(f"\nAll 4 plots saved to {output_dir}")
\ No newline at end of file
@@ -8,8 +8,12 @@ from matplotlib.ticker import FuncFormatter
 sns.set_style("whitegrid")
 plt.rcParams['font.size'] = 11
 
-def load_data(csv_path):
+def load_data(csv_path, dtype='float64'):
     df = pd.read_csv(csv_path)
+    if 'DType' in df.columns:
+        df = df[df['DType'] == dtype]
+    if 'Structure' in df.columns:
+        df = df[df['Structure'] == 'uniform']
     return df.groupby(['Algorithm', 'Size', 'Sparsity']).agg({'TimeSeconds': 'mean', 'MemoryMB': 'mean'}).reset_index()
 
 def plot_pure(df, output_dir):
@@ -0,0 +1,26 @@
+from array import array
+from multiprocessing import shared_memory
+
+
+def share_array(typecode, values):
+    values = array(typecode, values)
+    shm = shared_memory.SharedMemory(create=True, size=max(len(values) * values.itemsize, 1))
+    view = shm.buf.cast(typecode)
+    view[:len(values)] = values
+    view.release()
+    return shm
+
+
+def create_shared_array(typecode, length):
+    itemsize = array(typecode).itemsize
+    return shared_memory.SharedMemory(create=True, size=max(length * itemsize, 1))
+
+
+def attach_shared_array(name):
+    return shared_memory.SharedMemory(name=name)
+
+
+def release_shared_arrays(shms):
+    for shm in shms:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,52 @@
+import random
+from collections import namedtuple
+from itertools import accumulate, compress
+from operator import sub
+
+
+# Per-row lists for C = A @ B: multiply-adds, estimated stored entries and their upper bound.
+RowEstimate = namedtuple('RowEstimate', ['flops', 'nnz', 'nnz_upper', 'sampled_rows'])
+
+
+def row_flops(A_row_ptr, A_col_index, B_row_ptr, n_rows):
+    # Prefix sums of the B row lengths met along A's entries; a row's flops is the
+    # difference at its bounds.
+    b_lengths = list(map(sub, B_row_ptr[1:], B_row_ptr[:-1]))
+    prefix = [0, *accumulate(map(b_lengths.__getitem__, A_col_index))]
+    return list(map(sub, map(prefix.__getitem__, A_row_ptr[1:n_rows + 1]), map(prefix.__getitem__, A_row_ptr[:n_rows])))
+
+
+def row_nnz(A_row_ptr, A_col_index, B_row_ptr, B_col_index, i):
+    columns = set()
+    for k in A_col_index[A_row_ptr[i]:A_row_ptr[i + 1]]:
+        columns.update(B_col_index[B_row_ptr[k]:B_row_ptr[k + 1]])
+    return len(columns)
+
+
+def sampled_ratio(A_row_ptr, A_col_index, B_row_ptr, B_col_index, flops, samples, seed=None):
+    # Stored entries per flop over a random sample of non-empty rows; 1 means no
+    # products of the sampled rows land in the same column.
+    candidates = list(compress(range(len(flops)), flops))
+    if not samples or not candidates:
+        return 1.0, {}
+
+    sampled = random.Random(seed).sample(candidates, min(samples, len(candidates)))
+    exact = {i: row_nnz(A_row_ptr, A_col_index, B_row_ptr, B_col_index, i) for i in sampled}
+    return sum(exact.values()) / sum(flops[i] for i in sampled), exact
+
+
+def estimate_rows(A_row_ptr, A_col_index, B_row_ptr, B_col_index, n_rows, n_cols, samples=0, seed=None):
+    # Every product can land in a new column, so a row stores at most its flops, capped
+    # at the row width. Sampling counts a few rows exactly and scales the others by the
+    # sampled ratio of stored entries to flops.
+    flops = row_flops(A_row_ptr, A_col_index, B_row_ptr, n_rows)
+    nnz_upper = [min(f, n_cols) for f in flops]
+
+    ratio, exact = sampled_ratio(A_row_ptr, A_col_index, B_row_ptr, B_col_index, flops, samples, seed)
+    if not exact:
+        return RowEstimate(flops, nnz_upper, nnz_upper, 0)
+
+    nnz = [min(n_cols, round(f * ratio)) for f in flops] if ratio < 1 else list(nnz_upper)
+    for i, count in exact.items():
+        nnz[i] = count
+    return RowEstimate(flops, nnz, nnz_upper, len(exact))
@@ -0,0 +1,126 @@
+from collections import Counter, namedtuple
+from operator import mul, sub
+from python.src.matrix.sparse.formulations import INNER, OPERAND_FORMATS, OUTER, ROW_WISE, formulation_costs, inner_rows, outer_rows
+from python.src.matrix.sparse.masked import check_filters
+from python.src.matrix.sparse.matrix_coo import SparseMatrixCOO
+from python.src.matrix.sparse.matrix_csc import SparseMatrixCSC
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+
+
+FORMATS = {
+    'csr': SparseMatrixCSR,
+    'csc': SparseMatrixCSC,
+    'coo': SparseMatrixCOO,
+}
+
+FormulationProfile = namedtuple('FormulationProfile', ['nnz_a', 'nnz_b', 'flops', 'gathers', 'dots'])
+
+FormulationDecision = namedtuple('FormulationDecision', ['formulation', 'costs', 'profile'])
+
+
+def sparse_format(matrix):
+    for name, cls in FORMATS.items():
+        if type(matrix) is cls:
+            return name
+    raise ValueError(f"Unsupported matrix type: {type(matrix).__name__} (expected one of {tuple(FORMATS)})")
+
+
+def convert(matrix, target):
+    source = sparse_format(matrix)
+    if target not in FORMATS:
+        raise ValueError(f"Unknown format: {target} (expected one of {tuple(FORMATS)})")
+    if source == target:
+        return matrix
+
+    if target == 'coo':
+        return SparseMatrixCOO.from_csr(matrix) if source == 'csr' else SparseMatrixCOO.from_csc(matrix)
+    if target == 'csc':
+        return SparseMatrixCSC.from_csr(matrix) if source == 'csr' else matrix.to_csc()
+    return matrix.to_csr()
+
+
+def index_counts(index, n):
+    counts = Counter(index)
+    return list(map(counts.__getitem__, range(n)))
+
+
+def row_lengths(matrix):
+    if isinstance(matrix, SparseMatrixCSR):
+        return list(map(sub, matrix.row_ptr[1:], matrix.row_ptr[:-1]))
+    return index_counts(matrix.row_index, matrix.shape[0])
+
+
+def col_lengths(matrix):
+    if isinstance(matrix, SparseMatrixCSC):
+        return list(map(sub, matrix.col_ptr[1:], matrix.col_ptr[:-1]))
+    return index_counts(matrix.col_index, matrix.shape[1])
+
+
+def profile(A, B, mask=None):
+    # Work of each formulation, read from the operands' index arrays without converting them.
+    # Row-wise and outer do one product per pair of A[:, k] and B[k, :] entries; inner gathers
+    # every stored entry of B's columns once per dot product it computes.
+    nnz_a, nnz_b = A.numbers_non_zero(), B.numbers_non_zero()
+    B_row_lengths = row_lengths(B)
+    if isinstance(A, SparseMatrixCSC):
+        flops = sum(map(mul, map(sub, A.col_ptr[1:], A.col_ptr[:-1]), B_row_lengths))
+    else:
+        flops = sum(map(B_row_lengths.__getitem__, A.col_index))
+
+    if mask is None:
+        rows = sum(map(bool, row_lengths(A)))
+        return FormulationProfile(nnz_a, nnz_b, flops, rows * nnz_b, rows * B.shape[1])
+
+    B_col_lengths = col_lengths(B)
+    return FormulationProfile(nnz_a, nnz_b, flops, sum(map(B_col_lengths.__getitem__, mask.col_index)), mask.numbers_non_zero())
+
+
+def check_operands(A, B, mask=None):
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(f"Incompatible Dimensions: {A.shape} × {B.shape}")
+    check_filters((A.shape[0], B.shape[1]), mask)
+
+
+def choose_formulation(A, B, mask=None):
+    check_operands(A, B, mask)
+    mask = convert(mask, 'csr') if mask is not None else None
+
+    p = profile(A, B, mask)
+    costs = formulation_costs(sparse_format(A), sparse_format(B), (A.shape, B.shape), *p, mask is not None)
+    return FormulationDecision(min(costs, key=costs.get), costs, p)
+
+
+def multiply(A, B, mask=None, formulation=None, report=False):
+    # A × B as CSR for any mix of CSR, CSC and COO operands. Row-wise is Gustavson on
+    # CSR × CSR, inner takes dot products of CSR rows and CSC columns, outer sums the
+    # rank-1 products of CSC columns and CSR rows. Without a formulation, the one with
+    # the lowest estimated cost, including operand conversions, is used.
+    check_operands(A, B, mask)
+    if formulation is not None and formulation not in OPERAND_FORMATS:
+        raise ValueError(f"Unknown formulation: {formulation} (expected one of {tuple(OPERAND_FORMATS)})")
+    if formulation == OUTER and mask is not None:
+        raise ValueError("The outer formulation does not support a mask")
+
+    decision = choose_formulation(A, B, mask) if formulation is None or report else None
+    formulation = formulation or decision.formulation
+
+    a_format, b_format = OPERAND_FORMATS[formulation]
+    A, B = convert(A, a_format), convert(B, b_format)
+    mask = convert(mask, 'csr') if mask is not None else None
+    n_rows, n_inner = A.shape
+    n_cols = B.shape[1]
+
+    if formulation == ROW_WISE:
+        result = A.multiply(B, mask=mask)
+    else:
+        values, col_index, row_ptr = [], [], [0]
+        if formulation == INNER:
+            inner_rows(A.row_ptr, A.col_index, A.values, B.col_ptr, B.row_index, B.values, n_inner, n_cols, 0, n_rows,
+                       values, col_index, row_ptr,
+                       mask.row_ptr if mask is not None else None, mask.col_index if mask is not None else None)
+        else:
+            outer_rows(A.col_ptr, A.row_index, A.values, B.row_ptr, B.col_index, B.values, n_inner, n_rows, n_cols,
+                       values, col_index, row_ptr)
+        result = SparseMatrixCSR(values, col_index, row_ptr, (n_rows, n_cols))
+
+    return (result, decision._replace(formulation=formulation)) if report else result
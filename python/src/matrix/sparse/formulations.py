@@ -0,0 +1,155 @@
+from bisect import bisect_left
+from itertools import compress, repeat
+from operator import mul
+
+
+ROW_WISE = 'row-wise'
+INNER = 'inner'
+OUTER = 'outer'
+
+# Operand formats each formulation reads, (A, B); other formats are converted first.
+OPERAND_FORMATS = {
+    ROW_WISE: ('csr', 'csr'),
+    INNER: ('csr', 'csc'),
+    OUTER: ('csc', 'csr'),
+}
+
+# Rows of C the outer product buffers at a time.
+OUTER_PANEL_ROWS = 1024
+
+# Seconds per (A entries, products or gathered B entries, output rows or dot products),
+# fitted on this repository's formats benchmark; only the ratios between them matter.
+FORMULATION_COEFFICIENTS = {
+    ROW_WISE: (6.73e-07, 1.42e-07, 9.48e-07),
+    INNER: (3.10e-07, 8.67e-08, 3.93e-07),
+    OUTER: (1.18e-06, 2.08e-07, 1.54e-06),
+}
+
+# The same for a masked product; the outer product has no masked form.
+MASKED_FORMULATION_COEFFICIENTS = {
+    ROW_WISE: (1.09e-07, 5.49e-08, 4.30e-06),
+    INNER: (3.54e-08, 1.51e-07, 4.52e-07),
+}
+
+# Seconds per (stored entries, rows + columns) of each O(nnz) conversion.
+CONVERSION_COEFFICIENTS = {
+    ('csr', 'csc'): (1.81e-07, 1.70e-07),
+    ('csc', 'csr'): (2.00e-07, 5.31e-08),
+    # Both sort the entries the same way, so they share one fit over ordered and shuffled input.
+    ('coo', 'csr'): (9.23e-07, 2.73e-07),
+    ('coo', 'csc'): (9.23e-07, 2.73e-07),
+}
+
+
+def inner_rows(A_row_ptr, A_col_index, A_values, B_col_ptr, B_row_index, B_values, n_inner, n_cols,
+               row_start, row_end, values, col_index, row_ptr, mask_row_ptr=None, mask_col_index=None):
+    # C[i, j] as the dot product of A's row i and B's column j: the row is scattered into
+    # a dense vector once and each column gathers from it in one C-level sum. With a mask
+    # only its entries are computed. Dots that sum to zero are not stored. Repeated
+    # columns in a row of A add up.
+    dense = [0] * n_inner
+    gather = dense.__getitem__
+    masked = mask_row_ptr is not None
+    if not masked:
+        columns = [(B_row_index[B_col_ptr[j]:B_col_ptr[j + 1]], B_values[B_col_ptr[j]:B_col_ptr[j + 1]])
+                   for j in range(n_cols)]
+
+    for i in range(row_start, row_end):
+        a_start, a_end = A_row_ptr[i], A_row_ptr[i + 1]
+        mask_cols = mask_col_index[mask_row_ptr[i]:mask_row_ptr[i + 1]] if masked else None
+        if a_start == a_end or (masked and not mask_cols):
+            row_ptr.append(len(values))
+            continue
+
+        a_cols = A_col_index[a_start:a_end]
+        for k, a_val in zip(a_cols, A_values[a_start:a_end]):
+            dense[k] += a_val
+
+        if masked:
+            dots = [sum(map(mul, B_values[B_col_ptr[j]:B_col_ptr[j + 1]], map(gather, B_row_index[B_col_ptr[j]:B_col_ptr[j + 1]])))
+                    for j in mask_cols]
+            col_index.extend(compress(mask_cols, dots))
+        else:
+            dots = [sum(map(mul, column_values, map(gather, rows))) for rows, column_values in columns]
+            col_index.extend(compress(range(n_cols), dots))
+        values.extend(filter(None, dots))
+
+        for k in a_cols:
+            dense[k] = 0
+        row_ptr.append(len(values))
+
+
+def outer_rows(A_col_ptr, A_row_index, A_values, B_row_ptr, B_col_index, B_values, n_inner, n_rows, n_cols,
+               values, col_index, row_ptr, panel_rows=OUTER_PANEL_ROWS):
+    # C as the sum of the rank-1 products A[:, k] ⊗ B[k, :], one panel of rows at a time.
+    # Every product row a_ik · B[k, :] is computed at C speed into a chunk of row i; rows
+    # with one chunk are copied as they are, others are merged in a dense accumulator.
+    # A's columns must list their rows in increasing order.
+    accumulator = [0] * n_cols
+    marker = [-1] * n_cols
+    cursor = list(A_col_ptr[:n_inner])
+
+    for panel_start in range(0, n_rows, panel_rows):
+        panel_end = min(n_rows, panel_start + panel_rows)
+        chunk_cols = [[] for _ in range(panel_end - panel_start)]
+        chunk_values = [[] for _ in range(panel_end - panel_start)]
+
+        for k in range(n_inner):
+            a_start = cursor[k]
+            a_end = bisect_left(A_row_index, panel_end, a_start, A_col_ptr[k + 1])
+            cursor[k] = a_end
+            b_start, b_end = B_row_ptr[k], B_row_ptr[k + 1]
+            if a_start == a_end or b_start == b_end:
+                continue
+
+            b_cols, b_values = B_col_index[b_start:b_end], B_values[b_start:b_end]
+            for i, a_val in zip(A_row_index[a_start:a_end], A_values[a_start:a_end]):
+                chunk_cols[i - panel_start].append(b_cols)
+                chunk_values[i - panel_start].append(list(map(mul, b_values, repeat(a_val))))
+
+        for i, row_cols, row_values in zip(range(panel_start, panel_end), chunk_cols, chunk_values):
+            if len(row_cols) == 1:
+                col_index.extend(row_cols[0])
+                values.extend(row_values[0])
+            elif row_cols:
+                occupied = []
+                for cols, products in zip(row_cols, row_values):
+                    for j, product in zip(cols, products):
+                        if marker[j] != i:
+                            marker[j] = i
+                            accumulator[j] = product
+                            occupied.append(j)
+                        else:
+                            accumulator[j] += product
+
+                occupied.sort()
+                col_index.extend(occupied)
+                values.extend(map(accumulator.__getitem__, occupied))
+            row_ptr.append(len(values))
+
+
+def formulation_features(formulation, nnz_a, flops, gathers, dots, n_rows):
+    if formulation == INNER:
+        return (nnz_a, gathers, dots)
+    return (nnz_a, flops, n_rows)
+
+
+def conversion_seconds(source, target, nnz, n_rows, n_cols):
+    if source == target:
+        return 0.0
+    coefficients = CONVERSION_COEFFICIENTS[(source, target)]
+    return coefficients[0] * nnz + coefficients[1] * (n_rows + n_cols)
+
+
+def formulation_costs(a_format, b_format, shapes, nnz_a, nnz_b, flops, gathers, dots, masked=False):
+    # Estimated seconds of each formulation, including converting the operands it reads.
+    (n_rows, n_inner), (_, n_cols) = shapes
+    coefficients = MASKED_FORMULATION_COEFFICIENTS if masked else FORMULATION_COEFFICIENTS
+    costs = {}
+    for formulation, formulation_coefficients in coefficients.items():
+        a_target, b_target = OPERAND_FORMATS[formulation]
+        features = formulation_features(formulation, nnz_a, flops, gathers, dots, n_rows)
+        costs[formulation] = (sum(c * x for c, x in zip(formulation_coefficients, features))
+                              + conversion_seconds(a_format, a_target, nnz_a, n_rows, n_inner)
+                              + conversion_seconds(b_format, b_target, nnz_b, n_inner, n_cols))
+    return costs
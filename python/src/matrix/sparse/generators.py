@@ -0,0 +1,44 @@
+import math
+import random
+from python.src.matrix.dtypes import random_value_func
+
+
+def random_csr(n_rows, n_cols=None, sparsity=0.9, dtype='float64', seed=None):
+    # Geometric skipping over the row-major cell order: each cell is non-zero with
+    # probability 1 - sparsity, but only the non-zeros are ever visited.
+    n_cols = n_rows if n_cols is None else n_cols
+    if not 0 <= sparsity <= 1:
+        raise ValueError(f"Sparsity must be in [0, 1], got {sparsity}")
+
+    rng = random.Random(seed)
+    value = random_value_func(dtype, rng)
+
+    values = []
+    col_index = []
+    row_ptr = [0]
+
+    total = n_rows * n_cols
+    log_sparsity = math.log(sparsity) if 0 < sparsity < 1 else None
+
+    position = -1
+    row_end = n_cols
+
+    while sparsity < 1:
+        if log_sparsity is None:
+            position += 1
+        else:
+            position += int(math.log(1.0 - rng.random()) / log_sparsity) + 1
+        if position >= total:
+            break
+
+        while position >= row_end:
+            row_ptr.append(len(col_index))
+            row_end += n_cols
+
+        col_index.append(position - row_end + n_cols)
+        values.append(value())
+
+    while len(row_ptr) <= n_rows:
+        row_ptr.append(len(col_index))
+
+    return values, col_index, row_ptr
@@ -0,0 +1,79 @@
+from itertools import accumulate
+
+
+def column_lists(row_ptr, col_index, values, n_rows, n_cols):
+    # Counting sort of the entries by column (CSC layout); rows are visited in order,
+    # so every column's row indices come out increasing.
+    counts = [0] * (n_cols + 1)
+    for j in col_index:
+        counts[j + 1] += 1
+    col_ptr = list(accumulate(counts))
+
+    next_free = col_ptr[:-1]
+    row_index = [0] * len(col_index)
+    col_values = [0] * len(col_index)
+    for i in range(n_rows):
+        for idx in range(row_ptr[i], row_ptr[i + 1]):
+            position = next_free[col_index[idx]]
+            row_index[position] = i
+            col_values[position] = values[idx]
+            next_free[col_index[idx]] = position + 1
+
+    return col_ptr, row_index, col_values
+
+
+def gram_upper_rows(row_ptr, col_index, values, col_ptr, row_index, col_values, n_rows,
+                    out_values, out_col_index, out_row_ptr):
+    # Row i of the upper triangle of A @ A.T: each A[i, k] is paired only with the
+    # entries of column k in rows j >= i. Those start at cursor[k], because each earlier
+    # row advanced it past its own entry, so the lower triangle is never computed.
+    accumulator = [0] * n_rows
+    marker = [-1] * n_rows
+    cursor = col_ptr[:-1]
+
+    for i in range(n_rows):
+        occupied = []
+
+        for idx_a in range(row_ptr[i], row_ptr[i + 1]):
+            k = col_index[idx_a]
+            a_val = values[idx_a]
+            start = cursor[k]
+            cursor[k] = start + 1
+
+            for idx_b in range(start, col_ptr[k + 1]):
+                j = row_index[idx_b]
+
+                if marker[j] != i:
+                    marker[j] = i
+                    accumulator[j] = a_val * col_values[idx_b]
+                    occupied.append(j)
+                else:
+                    accumulator[j] += a_val * col_values[idx_b]
+
+        occupied.sort()
+        for j in occupied:
+            out_values.append(accumulator[j])
+            out_col_index.append(j)
+        out_row_ptr.append(len(out_values))
+
+
+def mirror_upper(row_ptr, col_index, values, n_rows, out_values, out_col_index, out_row_ptr):
+    # Full symmetric CSR from the upper triangle. Row r is the mirrored entries (i, r),
+    # i < r, gathered in increasing i, followed by upper row r itself.
+    lower_cols = [[] for _ in range(n_rows)]
+    lower_values = [[] for _ in range(n_rows)]
+    for i in range(n_rows):
+        start, end = row_ptr[i], row_ptr[i + 1]
+        if start < end and col_index[start] == i:
+            start += 1
+        for j, value in zip(col_index[start:end], values[start:end]):
+            lower_cols[j].append(i)
+            lower_values[j].append(value)
+
+    for r in range(n_rows):
+        start, end = row_ptr[r], row_ptr[r + 1]
+        out_values.extend(lower_values[r])
+        out_values.extend(values[start:end])
+        out_col_index.extend(lower_cols[r])
+        out_col_index.extend(col_index[start:end])
+        out_row_ptr.append(len(out_values))
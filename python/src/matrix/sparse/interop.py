@@ -0,0 +1,32 @@
+from array import array
+import numpy as np
+from python.src.matrix.dtypes import ARRAY_TYPECODES, dtype_name, storage_typecode
+
+
+def as_numpy(storage, dtype=None):
+    # array.array and memoryview storage is wrapped in place through the buffer
+    # protocol; list storage has no buffer and is copied.
+    if isinstance(storage, (array, memoryview)):
+        wrapped = np.frombuffer(storage, dtype=storage_typecode(storage))
+        return wrapped if dtype is None else wrapped.astype(dtype, copy=False)
+    return np.array(storage, dtype=dtype)
+
+
+def as_storage(values, copy=False):
+    # A memoryview over the ndarray's buffer (or an array.array copy), typed with
+    # the array-module code that compact CSR storage uses.
+    values = np.ascontiguousarray(values)
+    typecode = ARRAY_TYPECODES[dtype_name(values.dtype)]
+    if copy:
+        return array(typecode, values.tobytes())
+    return memoryview(values).cast('B').cast(typecode)
+
+
+def csr_arrays(csr, dtype=None):
+    # While NumPy views are alive the underlying array.array objects cannot be resized.
+    values = as_numpy(csr.values, dtype or csr.dtype)
+    if csr.is_compact():
+        return values, as_numpy(csr.col_index), as_numpy(csr.row_ptr)
+
+    index_dtype = np.int32 if max(len(csr.col_index), *csr.shape) < 2 ** 31 else np.int64
+    return values, np.array(csr.col_index, dtype=index_dtype), np.array(csr.row_ptr, dtype=index_dtype)
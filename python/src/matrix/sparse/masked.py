@@ -0,0 +1,64 @@
+import heapq
+
+
+def check_filters(shape, mask=None, complement=False, top_k=None):
+    if mask is not None and tuple(mask.shape) != tuple(shape):
+        raise ValueError(f"Incompatible Mask: {mask.shape} for product {shape}")
+    if complement and mask is None:
+        raise ValueError("A complemented mask needs a mask")
+    if top_k is not None and top_k < 1:
+        raise ValueError(f"top_k must be at least 1, got {top_k}")
+
+
+def filtered_rows(A_row_ptr, A_col_index, A_values, B_row_ptr, B_col_index, B_values, n_cols,
+                  mask_row_ptr, mask_col_index, complement, threshold, top_k,
+                  row_start, row_end, values, col_index, row_ptr):
+    # Gustavson with the mask applied per product: columns outside the mask (or inside
+    # it, when complemented) are never accumulated. threshold and top_k are applied to
+    # each finished row before it is written, so pruned entries are never stored.
+    # Without a mask, mask_row_ptr is None and every column is allowed.
+    accumulator = [0] * n_cols
+    marker = [-1] * n_cols
+    allowed = [-1] * n_cols
+    masked = mask_row_ptr is not None
+    skip_allowed = not complement
+
+    for i in range(row_start, row_end):
+        mask_cols = mask_col_index[mask_row_ptr[i]:mask_row_ptr[i + 1]] if masked else ()
+        if masked and not complement and not mask_cols:
+            row_ptr.append(len(values))
+            continue
+        for j in mask_cols:
+            allowed[j] = i
+
+        occupied = []
+
+        for idx_a in range(A_row_ptr[i], A_row_ptr[i + 1]):
+            k = A_col_index[idx_a]
+            a_val = A_values[idx_a]
+
+            for idx_b in range(B_row_ptr[k], B_row_ptr[k + 1]):
+                j = B_col_index[idx_b]
+                if masked and (allowed[j] != i) == skip_allowed:
+                    continue
+
+                if marker[j] != i:
+                    marker[j] = i
+                    accumulator[j] = a_val * B_values[idx_b]
+                    occupied.append(j)
+                else:
+                    accumulator[j] += a_val * B_values[idx_b]
+
+        if masked and not complement:
+            occupied = [j for j in mask_cols if marker[j] == i]
+        else:
+            occupied.sort()
+        if threshold is not None:
+            occupied = [j for j in occupied if abs(accumulator[j]) >= threshold]
+        if top_k is not None and len(occupied) > top_k:
+            occupied = sorted(heapq.nlargest(top_k, occupied, key=lambda j: abs(accumulator[j])))
+
+        for j in occupied:
+            values.append(accumulator[j])
+            col_index.append(j)
+        row_ptr.append(len(values))
@@ -0,0 +1,65 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from python.src.matrix.sparse.parallel_scipy import panel_rows, row_flops, stitch
+
+
+# Products per row panel: each panel is filtered as soon as it is computed, so the
+# unfiltered product never exists in full.
+FILTER_PANEL_FLOPS = 1 << 20
+
+
+def _row_ids(indptr):
+    return np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+
+
+def _indptr(rows, n_rows, dtype):
+    indptr = np.zeros(n_rows + 1, dtype=dtype)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+    return indptr
+
+
+def filter_panel(panel, mask_panel=None, complement=False, threshold=None, top_k=None):
+    n_rows = panel.shape[0]
+
+    if mask_panel is not None:
+        # C++ element-wise kernels against the mask's pattern (values set to one).
+        pattern = csr_matrix((np.ones(mask_panel.nnz, dtype=panel.dtype), mask_panel.indices, mask_panel.indptr),
+                             shape=mask_panel.shape)
+        inside = panel.multiply(pattern).tocsr()
+        panel = (panel - inside).tocsr() if complement else inside
+    if threshold is not None:
+        rows = _row_ids(panel.indptr)
+        kept = np.flatnonzero(np.abs(panel.data) >= threshold)
+        panel = csr_matrix((panel.data[kept], panel.indices[kept], _indptr(rows[kept], n_rows, panel.indptr.dtype)),
+                           shape=panel.shape)
+
+    # Sorting after the mask and threshold only touches the surviving entries.
+    panel.sort_indices()
+
+    if top_k is not None:
+        # Rank entries within each row by magnitude; ties keep their column order.
+        rows = _row_ids(panel.indptr)
+        order = np.lexsort((-np.abs(panel.data), rows))
+        ranked_rows = rows[order]
+        rank = np.arange(len(order)) - np.searchsorted(ranked_rows, ranked_rows, side='left')
+        kept = np.sort(order[rank < top_k])
+        return panel.data[kept], panel.indices[kept], _indptr(rows[kept], n_rows, panel.indptr.dtype)
+
+    return panel.data, panel.indices, panel.indptr
+
+
+def multiply_filtered(A, B, mask=None, complement=False, threshold=None, top_k=None, panel_flops=FILTER_PANEL_FLOPS):
+    A = A.tocsr()
+    B = B.tocsr()
+    mask = mask.tocsr() if mask is not None else None
+    shape = (A.shape[0], B.shape[1])
+
+    panels = []
+    for row_start, row_end in panel_rows(row_flops(A.indptr, A.indices, B.indptr), panel_flops):
+        panel = (A[row_start:row_end] @ B).tocsr()
+        mask_panel = mask[row_start:row_end] if mask is not None else None
+        panels.append(filter_panel(panel, mask_panel, complement, threshold, top_k))
+
+    if not panels:
+        return csr_matrix(shape, dtype=np.result_type(A.dtype, B.dtype))
+    return stitch(panels, shape)
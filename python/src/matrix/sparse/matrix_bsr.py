@@ -0,0 +1,136 @@
+from operator import add, mul
+from python.src.matrix.sparse import workloads
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+
+
+def check_block_size(shape, block_size):
+    if block_size < 1 or shape[0] % block_size or shape[1] % block_size:
+        raise ValueError(f"Block size {block_size} does not divide shape {shape}")
+
+
+def block_rows(block, block_size):
+    return [block[i:i + block_size] for i in range(0, block_size * block_size, block_size)]
+
+
+def block_columns(block, block_size):
+    return [block[j::block_size] for j in range(block_size)]
+
+
+def block_product(A_rows, B_columns):
+    # Flat row-major A @ B; every entry is one C-level dot product.
+    return [sum(map(mul, row, column)) for row in A_rows for column in B_columns]
+
+
+class SparseMatrixBSR:
+
+    __slots__ = ('blocks', 'block_col_index', 'block_row_ptr', 'shape', 'block_size')
+
+    def __init__(self, blocks, block_col_index, block_row_ptr, shape, block_size):
+        self.blocks = blocks
+        self.block_col_index = block_col_index
+        self.block_row_ptr = block_row_ptr
+        self.shape = shape
+        self.block_size = block_size
+
+    @classmethod
+    def from_csr(cls, csr, block_size):
+        check_block_size(csr.shape, block_size)
+        b = block_size
+        blocks, block_col_index, block_row_ptr = [], [], [0]
+
+        for I in range(csr.shape[0] // b):
+            row_blocks = {}
+            for r in range(b):
+                i = I * b + r
+                for idx in range(csr.row_ptr[i], csr.row_ptr[i + 1]):
+                    j = csr.col_index[idx]
+                    block = row_blocks.get(j // b)
+                    if block is None:
+                        block = row_blocks[j // b] = [0] * (b * b)
+                    block[r * b + j % b] = csr.values[idx]
+
+            for J in sorted(row_blocks):
+                block_col_index.append(J)
+                blocks.append(row_blocks[J])
+            block_row_ptr.append(len(blocks))
+
+        return cls(blocks, block_col_index, block_row_ptr, csr.shape, b)
+
+    @classmethod
+    def from_dense(cls, dense_matrix, block_size):
+        return cls.from_csr(SparseMatrixCSR.from_dense(dense_matrix), block_size)
+
+    @classmethod
+    def random(cls, n, block_size=4, sparsity=0.9, dtype='float64', seed=None):
+        csr = SparseMatrixCSR(*workloads.block_sparse(n, block_size, sparsity, dtype, seed), (n, n))
+        return cls.from_csr(csr, block_size)
+
+    def multiply(self, other):
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
+        if self.block_size != other.block_size:
+            raise ValueError(f"Incompatible Block Sizes: {self.block_size} × {other.block_size}")
+
+        b = self.block_size
+        A_rows = [block_rows(block, b) for block in self.blocks]
+        B_columns = [block_columns(block, b) for block in other.blocks]
+        blocks, block_col_index, block_row_ptr = [], [], [0]
+
+        for I in range(len(self.block_row_ptr) - 1):
+            accumulator = {}
+            for a_idx in range(self.block_row_ptr[I], self.block_row_ptr[I + 1]):
+                K = self.block_col_index[a_idx]
+                for b_idx in range(other.block_row_ptr[K], other.block_row_ptr[K + 1]):
+                    J = other.block_col_index[b_idx]
+                    product = block_product(A_rows[a_idx], B_columns[b_idx])
+                    C_block = accumulator.get(J)
+                    accumulator[J] = product if C_block is None else list(map(add, C_block, product))
+
+            for J in sorted(accumulator):
+                block_col_index.append(J)
+                blocks.append(accumulator[J])
+            block_row_ptr.append(len(blocks))
+
+        return SparseMatrixBSR(blocks, block_col_index, block_row_ptr, (self.shape[0], other.shape[1]), b)
+
+    def to_dense(self):
+        n_rows, n_cols = self.shape
+        b = self.block_size
+        dense = [[0] * n_cols for _ in range(n_rows)]
+
+        for I in range(len(self.block_row_ptr) - 1):
+            for idx in range(self.block_row_ptr[I], self.block_row_ptr[I + 1]):
+                j = self.block_col_index[idx] * b
+                block = self.blocks[idx]
+                for r in range(b):
+                    dense[I * b + r][j:j + b] = block[r * b:r * b + b]
+
+        return dense
+
+    def to_csr(self):
+        b = self.block_size
+        values, col_index, row_ptr = [], [], [0]
+
+        for I in range(len(self.block_row_ptr) - 1):
+            start, end = self.block_row_ptr[I], self.block_row_ptr[I + 1]
+            for r in range(b):
+                for idx in range(start, end):
+                    j = self.block_col_index[idx] * b
+                    for c, value in enumerate(self.blocks[idx][r * b:r * b + b]):
+                        if value != 0:
+                            values.append(value)
+                            col_index.append(j + c)
+                row_ptr.append(len(values))
+
+        return SparseMatrixCSR(values, col_index, row_ptr, self.shape)
+
+    def numbers_blocks(self):
+        return len(self.blocks)
+
+    def numbers_non_zero(self):
+        # Stored entries, including explicit zeros inside blocks.
+        return len(self.blocks) * self.block_size * self.block_size
+
+    def get_sparsity(self):
+        total = self.shape[0] * self.shape[1]
+        return (total - self.numbers_non_zero()) / total if total > 0 else 0
@@ -0,0 +1,135 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from python.src.matrix.dtypes import dtype_name
+from python.src.matrix.sparse import workloads
+from python.src.matrix.sparse.matrix_bsr import check_block_size
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+# Upper bound on the block products materialised by one batched matmul.
+BATCH_PRODUCTS = 1 << 16
+
+
+class SparseMatrixBSRNumPy:
+
+    def __init__(self, blocks, block_col_index, block_row_ptr, shape):
+        self.blocks = blocks
+        self.block_col_index = block_col_index
+        self.block_row_ptr = block_row_ptr
+        self.shape = shape
+        self.block_size = blocks.shape[1]
+
+    @classmethod
+    def from_csr(cls, matrix, block_size):
+        check_block_size(matrix.shape, block_size)
+        if isinstance(matrix, SparseMatrixSciPy):
+            data, indices, indptr = matrix.matrix.data, matrix.matrix.indices, matrix.matrix.indptr
+        else:
+            data = np.asarray(matrix.values, dtype=matrix.dtype)
+            # int64 even when the lists are empty, where NumPy would default to float64.
+            indices, indptr = np.asarray(matrix.col_index, dtype=np.int64), np.asarray(matrix.row_ptr, dtype=np.int64)
+
+        b = block_size
+        n_rows, n_cols = matrix.shape
+        n_block_cols = n_cols // b
+
+        rows = np.repeat(np.arange(n_rows), np.diff(indptr))
+        keys, inverse = np.unique((rows // b) * n_block_cols + indices // b, return_inverse=True)
+
+        blocks = np.zeros((len(keys), b, b), dtype=data.dtype)
+        blocks[inverse, rows % b, indices % b] = data
+        block_row_ptr = np.concatenate(([0], np.cumsum(np.bincount(keys // n_block_cols, minlength=n_rows // b))))
+
+        return cls(blocks, keys % n_block_cols, block_row_ptr, matrix.shape)
+
+    @classmethod
+    def from_dense(cls, dense_matrix, block_size):
+        return cls.from_csr(SparseMatrixSciPy.from_dense(dense_matrix), block_size)
+
+    @classmethod
+    def random(cls, n, block_size=4, sparsity=0.9, dtype=np.float64, seed=None):
+        arrays = workloads.block_sparse(n, block_size, sparsity, dtype_name(dtype), seed)
+        return cls.from_csr(SparseMatrixSciPy._from_arrays(*arrays, (n, n), dtype), block_size)
+
+    @property
+    def dtype(self):
+        return self.blocks.dtype
+
+    def _block_rows(self):
+        return np.repeat(np.arange(len(self.block_row_ptr) - 1), np.diff(self.block_row_ptr))
+
+    def multiply(self, other, batch_products=BATCH_PRODUCTS):
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
+        if self.block_size != other.block_size:
+            raise ValueError(f"Incompatible Block Sizes: {self.block_size} × {other.block_size}")
+
+        b = self.block_size
+        n_block_rows = len(self.block_row_ptr) - 1
+        n_block_cols = other.shape[1] // b
+        dtype = np.result_type(self.blocks, other.blocks)
+
+        # counts[a] = number of B blocks that A block a meets; row_prefix splits A's
+        # block rows into batches of at most batch_products block products.
+        counts = np.diff(other.block_row_ptr)[self.block_col_index]
+        products_prefix = np.concatenate(([0], np.cumsum(counts)))
+        row_prefix = products_prefix[self.block_row_ptr]
+        block_rows = self._block_rows()
+
+        keys, blocks = [], []
+        start = 0
+        while start < n_block_rows:
+            end = np.searchsorted(row_prefix, row_prefix[start] + batch_products, side='right') - 1
+            end = min(max(end, start + 1), n_block_rows)
+
+            a_lo, a_hi = self.block_row_ptr[start], self.block_row_ptr[end]
+            a_counts = counts[a_lo:a_hi]
+            if a_counts.sum():
+                pair_a = np.repeat(np.arange(a_lo, a_hi), a_counts)
+                offsets = other.block_row_ptr[self.block_col_index[a_lo:a_hi]] - (np.cumsum(a_counts) - a_counts)
+                pair_b = np.repeat(offsets, a_counts) + np.arange(len(pair_a))
+
+                products = np.matmul(self.blocks[pair_a], other.blocks[pair_b])
+                pair_keys = block_rows[pair_a] * n_block_cols + other.block_col_index[pair_b]
+
+                order = np.argsort(pair_keys, kind='stable')
+                pair_keys = pair_keys[order]
+                firsts = np.flatnonzero(np.concatenate(([True], pair_keys[1:] != pair_keys[:-1])))
+
+                keys.append(pair_keys[firsts])
+                blocks.append(np.add.reduceat(products[order], firsts, axis=0))
+            start = end
+
+        keys = np.concatenate(keys) if keys else np.empty(0, dtype=np.int64)
+        blocks = np.concatenate(blocks).astype(dtype, copy=False) if blocks else np.empty((0, b, b), dtype=dtype)
+        block_row_ptr = np.concatenate(([0], np.cumsum(np.bincount(keys // n_block_cols, minlength=n_block_rows))))
+
+        return SparseMatrixBSRNumPy(blocks, keys % n_block_cols, block_row_ptr, (self.shape[0], other.shape[1]))
+
+    def to_dense(self):
+        b = self.block_size
+        n_rows, n_cols = self.shape
+        dense = np.zeros(self.shape, dtype=self.dtype)
+        dense.reshape(n_rows // b, b, n_cols // b, b)[self._block_rows(), :, self.block_col_index, :] = self.blocks
+        return dense
+
+    def to_csr(self):
+        b = self.block_size
+        offsets = np.arange(b)
+        rows = (self._block_rows() * b)[:, None, None] + offsets[None, :, None]
+        cols = (self.block_col_index * b)[:, None, None] + offsets[None, None, :]
+        rows, cols = np.broadcast_arrays(rows, cols)
+
+        matrix = csr_matrix((self.blocks.ravel(), (rows.ravel(), cols.ravel())), shape=self.shape)
+        matrix.eliminate_zeros()
+        return SparseMatrixSciPy(matrix)
+
+    def numbers_blocks(self):
+        return len(self.blocks)
+
+    def numbers_non_zero(self):
+        return self.blocks.size
+
+    def get_sparsity(self):
+        total = self.shape[0] * self.shape[1]
+        return (total - self.numbers_non_zero()) / total if total > 0 else 0
@@ -0,0 +1,63 @@
+import numpy as np
+from scipy.sparse import bsr_matrix
+from python.src.matrix.dtypes import dtype_name
+from python.src.matrix.sparse import workloads
+from python.src.matrix.sparse.matrix_bsr import check_block_size
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+class SparseMatrixBSRSciPy:
+
+    def __init__(self, scipy_matrix):
+        self.matrix = scipy_matrix
+        self.shape = scipy_matrix.shape
+        self.block_size = scipy_matrix.blocksize[0]
+
+    @classmethod
+    def from_csr(cls, matrix, block_size):
+        check_block_size(matrix.shape, block_size)
+        if not isinstance(matrix, SparseMatrixSciPy):
+            matrix = SparseMatrixSciPy._from_arrays(matrix.values, matrix.col_index, matrix.row_ptr, matrix.shape, matrix.dtype)
+        return cls(matrix.matrix.tobsr(blocksize=(block_size, block_size)))
+
+    @classmethod
+    def from_dense(cls, dense_matrix, block_size):
+        dense_matrix = np.asarray(dense_matrix)
+        check_block_size(dense_matrix.shape, block_size)
+        return cls(bsr_matrix(dense_matrix, blocksize=(block_size, block_size)))
+
+    @classmethod
+    def random(cls, n, block_size=4, sparsity=0.9, dtype=np.float64, seed=None):
+        arrays = workloads.block_sparse(n, block_size, sparsity, dtype_name(dtype), seed)
+        return cls.from_csr(SparseMatrixSciPy._from_arrays(*arrays, (n, n), dtype), block_size)
+
+    @property
+    def dtype(self):
+        return self.matrix.dtype
+
+    def multiply(self, other):
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
+        if self.block_size != other.block_size:
+            raise ValueError(f"Incompatible Block Sizes: {self.block_size} × {other.block_size}")
+
+        result_matrix = self.matrix @ other.matrix
+        return SparseMatrixBSRSciPy(result_matrix.tobsr(blocksize=(self.block_size, self.block_size)))
+
+    def to_dense(self):
+        return self.matrix.toarray()
+
+    def to_csr(self):
+        matrix = self.matrix.tocsr()
+        matrix.eliminate_zeros()
+        return SparseMatrixSciPy(matrix)
+
+    def numbers_blocks(self):
+        return len(self.matrix.data)
+
+    def numbers_non_zero(self):
+        return self.matrix.nnz
+
+    def get_sparsity(self):
+        total = self.shape[0] * self.shape[1]
+        return (total - self.numbers_non_zero()) / total if total > 0 else 0
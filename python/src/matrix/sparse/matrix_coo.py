@@ -0,0 +1,120 @@
+from bisect import bisect_left
+from itertools import accumulate, chain, islice, repeat
+from operator import eq, le, sub
+from python.src.matrix.sparse.matrix_csc import SparseMatrixCSC
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+
+
+def expand_ptr(ptr, n):
+    # Compressed pointers back to one index per entry: index i repeated ptr[i + 1] - ptr[i] times.
+    return list(chain.from_iterable(map(repeat, range(n), map(sub, ptr[1:n + 1], ptr[:n]))))
+
+
+def counting_order(index, n, order):
+    # Stable counting sort of the positions in order by index[position], with the pointers
+    # of each index value's run.
+    counts = [0] * (n + 1)
+    for i in index:
+        counts[i + 1] += 1
+    ptr = list(accumulate(counts))
+
+    next_free = ptr[:-1]
+    sorted_order = [0] * len(index)
+    for position in order:
+        i = index[position]
+        sorted_order[next_free[i]] = position
+        next_free[i] += 1
+
+    return ptr, sorted_order
+
+
+def merge_duplicates(ptr, minor, values):
+    # Sums repeated minor indices within each major index; they are adjacent once sorted.
+    merged_ptr, merged_minor, merged_values = [0], [], []
+    for start, end in zip(ptr, islice(ptr, 1, None)):
+        last = -1
+        for j, value in zip(minor[start:end], values[start:end]):
+            if j == last:
+                merged_values[-1] += value
+            else:
+                merged_minor.append(j)
+                merged_values.append(value)
+                last = j
+        merged_ptr.append(len(merged_minor))
+    return merged_ptr, merged_minor, merged_values
+
+
+def compress_entries(major, minor, values, n_major, n_minor):
+    # Pointers, minor indices and values ordered by major index and, within each, by minor
+    # index (the outer product bisects on them); duplicate entries are summed. Input already
+    # in that order (e.g. row-major entries for CSR) is copied; otherwise a counting sort by
+    # minor index is followed by a stable one by major index.
+    keys = [i * n_minor + j for i, j in zip(major, minor)]
+    if all(map(le, keys, islice(keys, 1, None))):
+        ptr, sorted_minor, sorted_values = [bisect_left(major, i) for i in range(n_major + 1)], list(minor), list(values)
+    else:
+        _, by_minor = counting_order(minor, n_minor, range(len(minor)))
+        ptr, order = counting_order(major, n_major, by_minor)
+        keys = list(map(keys.__getitem__, order))
+        sorted_minor = list(map(minor.__getitem__, order))
+        sorted_values = list(map(values.__getitem__, order))
+
+    if any(map(eq, keys, islice(keys, 1, None))):
+        return merge_duplicates(ptr, sorted_minor, sorted_values)
+    return ptr, sorted_minor, sorted_values
+
+
+class SparseMatrixCOO:
+
+    __slots__ = ('values', 'row_index', 'col_index', 'shape')
+
+    def __init__(self, values, row_index, col_index, shape):
+        self.values = values
+        self.row_index = row_index
+        self.col_index = col_index
+        self.shape = shape
+
+    @classmethod
+    def from_csr(cls, csr):
+        return cls(list(csr.values), expand_ptr(csr.row_ptr, csr.shape[0]), list(csr.col_index), csr.shape)
+
+    @classmethod
+    def from_csc(cls, csc):
+        return cls(list(csc.values), list(csc.row_index), expand_ptr(csc.col_ptr, csc.shape[1]), csc.shape)
+
+    @classmethod
+    def from_dense(cls, dense_matrix):
+        return cls.from_csr(SparseMatrixCSR.from_dense(dense_matrix))
+
+    @classmethod
+    def random(cls, n, sparsity=0.9, dtype='float64', seed=None):
+        return cls.from_csr(SparseMatrixCSR.random(n, sparsity, dtype=dtype, seed=seed))
+
+    def multiply(self, other, mask=None, formulation=None):
+        from python.src.matrix.sparse.formats import multiply
+        return multiply(self, other, mask, formulation)
+
+    def to_csr(self):
+        row_ptr, col_index, values = compress_entries(self.row_index, self.col_index, self.values, *self.shape)
+        return SparseMatrixCSR(values, col_index, row_ptr, self.shape)
+
+    def to_csc(self):
+        col_ptr, row_index, values = compress_entries(self.col_index, self.row_index, self.values, self.shape[1], self.shape[0])
+        return SparseMatrixCSC(values, row_index, col_ptr, self.shape)
+
+    def to_dense(self):
+        n_rows, n_cols = self.shape
+        dense = [[0] * n_cols for _ in range(n_rows)]
+
+        # Duplicate entries add up, as in every conversion and product.
+        for i, j, value in zip(self.row_index, self.col_index, self.values):
+            dense[i][j] += value
+
+        return dense
+
+    def numbers_non_zero(self):
+        return len(self.values)
+
+    def get_sparsity(self):
+        total = self.shape[0] * self.shape[1]
+        return (total - self.numbers_non_zero()) / total if total > 0 else 0
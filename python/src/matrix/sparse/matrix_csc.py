@@ -0,0 +1,54 @@
+from python.src.matrix.sparse.generators import random_csr
+from python.src.matrix.sparse.gram import column_lists
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+
+
+class SparseMatrixCSC:
+
+    __slots__ = ('values', 'row_index', 'col_ptr', 'shape')
+
+    def __init__(self, values, row_index, col_ptr, shape):
+        self.values = values
+        self.row_index = row_index
+        self.col_ptr = col_ptr
+        self.shape = shape
+
+    @classmethod
+    def from_csr(cls, csr):
+        col_ptr, row_index, values = column_lists(csr.row_ptr, csr.col_index, csr.values, *csr.shape)
+        return cls(values, row_index, col_ptr, csr.shape)
+
+    @classmethod
+    def from_dense(cls, dense_matrix):
+        return cls.from_csr(SparseMatrixCSR.from_dense(dense_matrix))
+
+    @classmethod
+    def random(cls, n, sparsity=0.9, dtype='float64', seed=None):
+        # The CSR arrays of a random matrix are the CSC arrays of its transpose.
+        return cls(*random_csr(n, n, sparsity, dtype, seed), (n, n))
+
+    def multiply(self, other, mask=None, formulation=None):
+        from python.src.matrix.sparse.formats import multiply
+        return multiply(self, other, mask, formulation)
+
+    def to_csr(self):
+        # The same counting sort as from_csr, run on the transpose.
+        row_ptr, col_index, values = column_lists(self.col_ptr, self.row_index, self.values, self.shape[1], self.shape[0])
+        return SparseMatrixCSR(values, col_index, row_ptr, self.shape)
+
+    def to_dense(self):
+        n_rows, n_cols = self.shape
+        dense = [[0] * n_cols for _ in range(n_rows)]
+
+        for j in range(n_cols):
+            for idx in range(self.col_ptr[j], self.col_ptr[j + 1]):
+                dense[self.row_index[idx]][j] = self.values[idx]
+
+        return dense
+
+    def numbers_non_zero(self):
+        return len(self.values)
+
+    def get_sparsity(self):
+        total = self.shape[0] * self.shape[1]
+        return (total - self.numbers_non_zero()) / total if total > 0 else 0
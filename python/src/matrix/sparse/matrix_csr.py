@@ -1,22 +1,45 @@
-import random
+from array import array
+from operator import mul
+from python.src.matrix.dense.matrix import DenseMatrix
+from python.src.matrix.dtypes import ARRAY_TYPECODES, checked_product, dtype_name, is_integer, storage_typecode
+from python.src.matrix.sparse import workloads
+from python.src.matrix.sparse.estimate import estimate_rows
+from python.src.matrix.sparse.generators import random_csr
+from python.src.matrix.sparse.gram import column_lists, gram_upper_rows, mirror_upper
+from python.src.matrix.sparse.masked import check_filters, filtered_rows
+from python.src.matrix.sparse.parallel import multiply_parallel
+from python.src.matrix.sparse.spgemm import adaptive_rows, default_plan_cache, gustavson_rows
+
+
+# Up to this many right-hand sides, SpMM runs one C-level SpMV per column;
+# wider blocks use the row-vectorised kernel.
+SPMM_COLUMN_THRESHOLD = 8
 
 
 class SparseMatrixCSR:
     
+    __slots__ = ('values', 'col_index', 'row_ptr', 'shape', '_pattern')
+    
     def __init__(self, values, col_index, row_ptr, shape):
         self.values = values
         self.col_index = col_index
         self.row_ptr = row_ptr
         self.shape = shape
+        self._pattern = None  # memoised by spgemm.pattern_key
+    
+    @staticmethod
+    def _empty_storage(compact, dtype='float64'):
+        if compact:
+            return array(ARRAY_TYPECODES[dtype_name(dtype)]), array('i'), array('i', [0])
+        return [], [], [0]
     
     @classmethod
-    def from_dense(cls, dense_matrix):
-        if not dense_matrix or not dense_matrix[0]:
-            return cls([], [], [0], (0, 0))
+    def from_dense(cls, dense_matrix, compact=False, dtype=None):
+        values, col_index, row_ptr = cls._empty_storage(compact, dtype)
+        cast = (int if is_integer(dtype) else float) if dtype is not None else None
         
-        values = []
-        col_index = []
-        row_ptr = [0]
+        if not dense_matrix or not dense_matrix[0]:
+            return cls(values, col_index, row_ptr, (0, 0))
         
         n_rows = len(dense_matrix)
         n_cols = len(dense_matrix[0])
@@ -24,61 +47,164 @@ class SparseMatrixCSR:
         for i in range(n_rows):
             for j in range(n_cols):
                 if dense_matrix[i][j] != 0:
-                    values.append(dense_matrix[i][j])
+                    values.append(cast(dense_matrix[i][j]) if cast else dense_matrix[i][j])
                     col_index.append(j)
             row_ptr.append(len(values))
         
         return cls(values, col_index, row_ptr, (n_rows, n_cols))
     
     @classmethod
-    def random(cls, n, sparsity=0.9):
-        values = []
-        col_index = []
-        row_ptr = [0]
-        
-        for i in range(n):
-            for j in range(n):
-                if random.random() > sparsity:
-                    values.append(random.random())
-                    col_index.append(j)
-            row_ptr.append(len(values))
+    def _from_arrays(cls, values, col_index, row_ptr, shape, compact=False, dtype='float64'):
+        if compact:
+            storage_values, storage_col_index, _ = cls._empty_storage(True, dtype)
+            storage_values.extend(values)
+            storage_col_index.extend(col_index)
+            return cls(storage_values, storage_col_index, array('i', row_ptr), shape)
         
-        return cls(values, col_index, row_ptr, (n, n))
+        return cls(values, col_index, row_ptr, shape)
+    
+    @classmethod
+    def random(cls, n, sparsity=0.9, compact=False, dtype='float64', seed=None):
+        return cls._from_arrays(*random_csr(n, n, sparsity, dtype, seed), (n, n), compact, dtype)
     
-    def multiply(self, other):
+    @classmethod
+    def structured(cls, structure, n, sparsity=0.9, compact=False, dtype='float64', seed=None):
+        return cls._from_arrays(*workloads.generate(structure, n, sparsity, dtype, seed), (n, n), compact, dtype)
+    
+    @checked_product
+    def multiply(self, other, mask=None, complement=False, threshold=None, top_k=None):
+        # mask keeps only C entries in its pattern (outside it with complement=True);
+        # threshold drops |c| < threshold and top_k keeps the largest |c| per row.
         if self.shape[1] != other.shape[0]:
             raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
         
+        if not isinstance(other, SparseMatrixCSR):
+            # CSC and COO operands: the format-aware multiply picks the formulation.
+            from python.src.matrix.sparse import formats
+            if complement or threshold is not None or top_k is not None:
+                other = formats.convert(other, 'csr')
+                mask = formats.convert(mask, 'csr') if mask is not None else None
+            else:
+                return formats.multiply(self, other, mask)
+        
         n_rows = self.shape[0]
         n_cols = other.shape[1]
+        check_filters((n_rows, n_cols), mask, complement, top_k)
         
-        result_dict = {}
+        values, col_index, row_ptr = self._empty_storage(self.is_compact(), self.dtype)
         
-        for i in range(n_rows):
-            for idx_a in range(self.row_ptr[i], self.row_ptr[i + 1]):
-                k = self.col_index[idx_a]
-                a_val = self.values[idx_a]
-                
-                for idx_b in range(other.row_ptr[k], other.row_ptr[k + 1]):
-                    j = other.col_index[idx_b]
-                    b_val = other.values[idx_b]
-                    
-                    if (i, j) not in result_dict:
-                        result_dict[(i, j)] = 0
-                    result_dict[(i, j)] += a_val * b_val
-        
-        values = []
-        col_index = []
-        row_ptr = [0]
+        if mask is None and threshold is None and top_k is None:
+            adaptive_rows(self.row_ptr, self.col_index, self.values, other.row_ptr, other.col_index, other.values, n_cols,
+                          0, n_rows, values, col_index, row_ptr)
+        else:
+            filtered_rows(self.row_ptr, self.col_index, self.values, other.row_ptr, other.col_index, other.values, n_cols,
+                          mask.row_ptr if mask is not None else None, mask.col_index if mask is not None else None,
+                          complement, threshold, top_k, 0, n_rows, values, col_index, row_ptr)
+        
+        return SparseMatrixCSR(values, col_index, row_ptr, (n_rows, n_cols))
+    
+    def estimate_multiply(self, other, samples=0, seed=None):
+        # Per-row flops and stored entries of self × other, without multiplying;
+        # samples > 0 refines the upper bound with the exact count of that many rows.
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
+        
+        return estimate_rows(self.row_ptr, self.col_index, other.row_ptr, other.col_index, self.shape[0], other.shape[1],
+                             samples, seed)
+    
+    @checked_product
+    def multiply_parallel(self, other, workers=None, chunks=None):
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
+        
+        values, col_index, row_ptr = self._empty_storage(self.is_compact(), self.dtype)
+        multiply_parallel(self, other, values, col_index, row_ptr, workers, chunks)
+        return SparseMatrixCSR(values, col_index, row_ptr, (self.shape[0], other.shape[1]))
+    
+    @checked_product
+    def multiply_planned(self, other, cache=None):
+        plan = (default_plan_cache if cache is None else cache).get(self, other)
+        return plan.execute(self, other)
+    
+    @checked_product
+    def multiply_transpose(self, other):
+        if self.shape[1] != other.shape[1]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}ᵀ")
+        if other is self:
+            return self.gram()
+        
+        # other's column lists are the CSR arrays of other.T, so the Gustavson kernel runs unchanged.
+        col_ptr, row_index, col_values = column_lists(other.row_ptr, other.col_index, other.values, *other.shape)
+        values, col_index, row_ptr = self._empty_storage(self.is_compact(), self.dtype)
+        
+        gustavson_rows(self.row_ptr, self.col_index, self.values, col_ptr, row_index, col_values, other.shape[0],
+                       0, self.shape[0], values, col_index, row_ptr)
+        
+        return SparseMatrixCSR(values, col_index, row_ptr, (self.shape[0], other.shape[0]))
+    
+    @checked_product
+    def gram(self, upper=False):
+        # A @ A.T computing only j >= i, about half the products of multiply_transpose;
+        # upper=True keeps the result in that symmetric-compressed (upper-triangle) form.
+        n_rows, n_cols = self.shape
+        columns = column_lists(self.row_ptr, self.col_index, self.values, n_rows, n_cols)
+        values, col_index, row_ptr = self._empty_storage(self.is_compact(), self.dtype)
+        
+        if upper:
+            gram_upper_rows(self.row_ptr, self.col_index, self.values, *columns, n_rows, values, col_index, row_ptr)
+        else:
+            upper_values, upper_col_index, upper_row_ptr = [], [], [0]
+            gram_upper_rows(self.row_ptr, self.col_index, self.values, *columns, n_rows,
+                            upper_values, upper_col_index, upper_row_ptr)
+            mirror_upper(upper_row_ptr, upper_col_index, upper_values, n_rows, values, col_index, row_ptr)
+        
+        return SparseMatrixCSR(values, col_index, row_ptr, (n_rows, n_rows))
+    
+    def matvec(self, x):
+        if len(x) != self.shape[1]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × ({len(x)},)")
+        
+        values, col_index, row_ptr = self.values, self.col_index, self.row_ptr
+        gather = x.__getitem__
+        
+        return [sum(map(mul, values[row_ptr[i]:row_ptr[i + 1]], map(gather, col_index[row_ptr[i]:row_ptr[i + 1]])))
+                for i in range(self.shape[0])]
+    
+    def multiply_dense(self, other):
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
+        
+        n_rows = self.shape[0]
+        n_cols = other.shape[1]
+        
+        if n_cols <= SPMM_COLUMN_THRESHOLD:
+            columns = [self.matvec(column) for column in zip(*other.data)]
+            return DenseMatrix([list(row) for row in zip(*columns)] if columns else [[] for _ in range(n_rows)])
+        
+        B_rows = other.data
+        C = []
         
         for i in range(n_rows):
-            row_elements = sorted([(j, val) for (row, j), val in result_dict.items() if row == i])
-            for j, val in row_elements:
-                values.append(val)
-                col_index.append(j)
-            row_ptr.append(len(values))
+            c_row = [0] * n_cols
+            for idx in range(self.row_ptr[i], self.row_ptr[i + 1]):
+                a_val = self.values[idx]
+                c_row = [c + a_val * b for c, b in zip(c_row, B_rows[self.col_index[idx]])]
+            C.append(c_row)
         
-        return SparseMatrixCSR(values, col_index, row_ptr, (n_rows, n_cols))
+        return DenseMatrix(C)
+    
+    @property
+    def dtype(self):
+        if self.is_compact():
+            return next(name for name, code in ARRAY_TYPECODES.items() if code == storage_typecode(self.values))
+        return 'int64' if self.values and isinstance(self.values[0], int) else 'float64'
+    
+    def is_compact(self):
+        return isinstance(self.values, (array, memoryview))
+    
+    def to_compact(self, dtype=None):
+        typecode = ARRAY_TYPECODES[dtype_name(dtype or self.dtype)]
+        return SparseMatrixCSR(array(typecode, self.values), array('i', self.col_index), array('i', self.row_ptr), self.shape)
     
     def to_dense(self):
         n_rows, n_cols = self.shape
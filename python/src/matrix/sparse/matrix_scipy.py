@@ -1,5 +1,14 @@
 import numpy as np
 from scipy.sparse import csr_matrix
+from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+from python.src.matrix.dtypes import dtype_name
+from python.src.matrix.sparse import workloads
+from python.src.matrix.sparse.generators import random_csr
+from python.src.matrix.sparse.interop import as_storage, csr_arrays
+from python.src.matrix.sparse.masked import check_filters
+from python.src.matrix.sparse.masked_scipy import multiply_filtered
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.parallel_scipy import multiply_parallel, upper_triangle_csr
 
 
 class SparseMatrixSciPy:
@@ -9,20 +18,83 @@ class SparseMatrixSciPy:
         self.shape = scipy_matrix.shape
     
     @classmethod
-    def from_dense(cls, dense_matrix):
-        return cls(csr_matrix(dense_matrix))
+    def from_dense(cls, dense_matrix, dtype=None):
+        return cls(csr_matrix(dense_matrix, dtype=dtype))
     
     @classmethod
-    def random(cls, n, sparsity=0.9):
-        density = 1 - sparsity
-        random_matrix = np.random.rand(n, n)
-        mask = np.random.rand(n, n) < density
-        sparse_data = random_matrix * mask
-        return cls(csr_matrix(sparse_data))
-    
-    def multiply(self, other):
-        result_matrix = self.matrix @ other.matrix
-        return SparseMatrixSciPy(result_matrix)
+    def _from_arrays(cls, values, col_index, row_ptr, shape, dtype=np.float64):
+        index_dtype = np.int32 if max(len(col_index), *shape) < 2 ** 31 else np.int64
+        
+        return cls(csr_matrix((np.array(values, dtype=dtype), np.array(col_index, dtype=index_dtype),
+                               np.array(row_ptr, dtype=index_dtype)), shape=shape))
+    
+    @classmethod
+    def from_csr(cls, csr, dtype=None, copy=False):
+        # Compact (array-backed) CSR storage is shared, not copied, unless copy=True
+        # or a different dtype is requested; list storage is converted in O(nnz).
+        return cls(csr_matrix(csr_arrays(csr, dtype), shape=csr.shape, copy=copy))
+    
+    @classmethod
+    def random(cls, n, sparsity=0.9, dtype=np.float64, seed=None):
+        return cls._from_arrays(*random_csr(n, n, sparsity, dtype_name(dtype), seed), (n, n), dtype)
+    
+    @classmethod
+    def structured(cls, structure, n, sparsity=0.9, dtype=np.float64, seed=None):
+        return cls._from_arrays(*workloads.generate(structure, n, sparsity, dtype_name(dtype), seed), (n, n), dtype)
+    
+    def multiply_parallel(self, other, workers=None, chunk_rows=None):
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
+        return SparseMatrixSciPy(multiply_parallel(self.matrix, other.matrix, workers, chunk_rows))
+    
+    def multiply_transpose(self, other):
+        if self.shape[1] != other.shape[1]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}ᵀ")
+        if other is self:
+            return self.gram()
+        return SparseMatrixSciPy((self.matrix @ other.matrix.T).tocsr())
+    
+    def gram(self, upper=False):
+        # SciPy's C++ SpGEMM over the free CSC view of A.T outran vectorised half-product
+        # kernels (expand-and-sum over column pairs was ~2x slower at mc2depi scale), so the
+        # full product is computed and upper=True only stores its upper triangle.
+        product = (self.matrix @ self.matrix.T).tocsr()
+        return SparseMatrixSciPy(upper_triangle_csr(product) if upper else product)
+    
+    def matvec(self, x):
+        if len(x) != self.shape[1]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × ({len(x)},)")
+        return self.matrix @ np.asarray(x)
+    
+    def multiply_dense(self, other):
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
+        return DenseMatrixNumPy(self.matrix @ other.data, copy=False)
+    
+    @property
+    def dtype(self):
+        return self.matrix.dtype
+    
+    def multiply(self, other, mask=None, complement=False, threshold=None, top_k=None):
+        # Same filters as SparseMatrixCSR.multiply, applied to row panels as SciPy produces them.
+        if mask is None and threshold is None and top_k is None and not complement:
+            result_matrix = self.matrix @ other.matrix
+            return SparseMatrixSciPy(result_matrix)
+        
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {self.shape} × {other.shape}")
+        check_filters((self.shape[0], other.shape[1]), mask, complement, top_k)
+        
+        return SparseMatrixSciPy(multiply_filtered(self.matrix, other.matrix, mask.matrix if mask is not None else None,
+                                                   complement, threshold, top_k))
+    
+    def to_csr_pure(self, copy=False):
+        # Memoryviews over the SciPy buffers, or array.array copies with copy=True.
+        matrix = self.matrix.tocsr()
+        if not matrix.has_sorted_indices:
+            matrix = matrix.sorted_indices()
+        return SparseMatrixCSR(as_storage(matrix.data, copy), as_storage(matrix.indices, copy),
+                               as_storage(matrix.indptr, copy), matrix.shape)
     
     def to_dense(self):
         return self.matrix.toarray()
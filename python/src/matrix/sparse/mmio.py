@@ -0,0 +1,275 @@
+import io
+import json
+import os
+import tempfile
+from collections import namedtuple
+import numpy as np
+from scipy.io import mmread
+from scipy.sparse import csr_matrix
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+CHUNK_BYTES = 1 << 22
+
+# Files up to this size are parsed whole by SciPy's compiled reader; larger ones stream.
+IN_MEMORY_BYTES = 1 << 28
+
+CACHE_VERSION = 1
+
+CACHE_ARRAYS = ('data', 'indices', 'indptr')
+
+FIELD_DTYPES = {'real': np.float64, 'double': np.float64, 'integer': np.int64, 'pattern': np.float64}
+
+SYMMETRIES = ('general', 'symmetric', 'skew-symmetric')
+
+MatrixMarketHeader = namedtuple('MatrixMarketHeader', ['shape', 'nnz', 'field', 'symmetry', 'data_offset'])
+
+
+def read_header(path):
+    with open(path, 'rb') as f:
+        banner = f.readline().decode().lower().split()
+        if len(banner) != 5 or banner[0] != '%%matrixmarket' or banner[1] != 'matrix':
+            raise ValueError(f"Not a Matrix Market matrix file: {path}")
+
+        layout, field, symmetry = banner[2:]
+        if layout != 'coordinate':
+            raise ValueError(f"Unsupported Matrix Market layout: {layout} (expected coordinate)")
+        if field not in FIELD_DTYPES:
+            raise ValueError(f"Unsupported Matrix Market field: {field} (expected one of {tuple(FIELD_DTYPES)})")
+        if symmetry not in SYMMETRIES:
+            raise ValueError(f"Unsupported Matrix Market symmetry: {symmetry} (expected one of {SYMMETRIES})")
+
+        line = f.readline()
+        while line.startswith(b'%') or not line.strip():
+            line = f.readline()
+        n_rows, n_cols, nnz = (int(token) for token in line.split())
+
+        return MatrixMarketHeader((n_rows, n_cols), nnz, field, symmetry, f.tell())
+
+
+def iter_entries(path, header, chunk_bytes=CHUNK_BYTES, with_values=True):
+    # Yields (rows, cols, values) for chunks of whole lines, 0-based, with the mirrored
+    # half of symmetric matrices included; memory is bounded by chunk_bytes, not nnz.
+    # Without values only the index columns are parsed and values is None.
+    columns = (0, 1, 2) if with_values and header.field != 'pattern' else (0, 1)
+    dtype = FIELD_DTYPES[header.field]
+
+    with open(path, 'rb') as f:
+        f.seek(header.data_offset)
+        remainder = b''
+        while True:
+            block = f.read(chunk_bytes)
+            if not block and not remainder.strip():
+                break
+
+            # Parse up to the last full line and carry the partial one into the next block.
+            buffer = remainder + block
+            end = len(buffer) if not block else buffer.rfind(b'\n') + 1
+            buffer, remainder = buffer[:end], buffer[end:]
+            if not buffer.strip():
+                continue
+
+            # float64 holds indices and integer values exactly up to 2**53.
+            tokens = np.loadtxt(io.BytesIO(buffer), comments='%', usecols=columns, ndmin=2)
+            rows = tokens[:, 0].astype(np.int64) - 1
+            cols = tokens[:, 1].astype(np.int64) - 1
+            values = None
+            if with_values:
+                values = np.ones(len(rows), dtype=dtype) if len(columns) == 2 else tokens[:, 2].astype(dtype)
+
+            if header.symmetry != 'general':
+                mirrored = rows != cols
+                rows, cols = np.concatenate((rows, cols[mirrored])), np.concatenate((cols, rows[mirrored]))
+                if with_values:
+                    sign = -1 if header.symmetry == 'skew-symmetric' else 1
+                    values = np.concatenate((values, sign * values[mirrored]))
+
+            yield rows, cols, values
+
+
+def _allocate(directory, name, dtype, length):
+    if directory is None:
+        return np.empty(length, dtype=dtype)
+    # Length-0 memmaps are not allowed, so empty arrays live in memory.
+    if length == 0:
+        np.empty(0, dtype=dtype).tofile(os.path.join(directory, f"{name}.bin"))
+        return np.empty(0, dtype=dtype)
+    return np.memmap(os.path.join(directory, f"{name}.bin"), dtype=dtype, mode='w+', shape=(length,))
+
+
+def _index_dtype(nnz, shape):
+    return np.int32 if max(nnz, *shape) < 2 ** 31 else np.int64
+
+
+def read_in_memory(path, header):
+    # mmread's parser is several times faster than chunked loadtxt, at the cost of holding
+    # the whole COO matrix; duplicates are kept as separate entries, as when streaming.
+    coo = mmread(path).tocoo()
+    order = np.argsort(coo.row, kind='stable')
+    index_dtype = _index_dtype(coo.nnz, header.shape)
+
+    indptr = np.zeros(header.shape[0] + 1, dtype=index_dtype)
+    np.cumsum(np.bincount(coo.row, minlength=header.shape[0]), out=indptr[1:])
+    return coo.data[order].astype(FIELD_DTYPES[header.field]), coo.col[order].astype(index_dtype), indptr
+
+
+def read_streaming(path, header, chunk_bytes, directory):
+    # The text is parsed once: each chunk's entries are counted per row and spilled to a
+    # temporary binary file, which the second pass scatters into the rows' slots. With a
+    # directory, the spill and the output memmaps are written there.
+    n_rows = header.shape[0]
+    entry = np.dtype([('row', np.int64), ('col', np.int64), ('value', FIELD_DTYPES[header.field])])
+
+    with tempfile.TemporaryFile(dir=directory) as spill:
+        counts = np.zeros(n_rows, dtype=np.int64)
+        chunk_lengths = []
+        for rows, cols, values in iter_entries(path, header, chunk_bytes):
+            counts += np.bincount(rows, minlength=n_rows)
+            entries = np.empty(len(rows), dtype=entry)
+            entries['row'], entries['col'], entries['value'] = rows, cols, values
+            entries.tofile(spill)
+            chunk_lengths.append(len(rows))
+
+        nnz = int(counts.sum())
+        index_dtype = _index_dtype(nnz, header.shape)
+
+        indptr = _allocate(directory, 'indptr', index_dtype, n_rows + 1)
+        indptr[0] = 0
+        np.cumsum(counts, out=indptr[1:])
+        indices = _allocate(directory, 'indices', index_dtype, nnz)
+        data = _allocate(directory, 'data', FIELD_DTYPES[header.field], nnz)
+
+        spill.seek(0)
+        next_free = np.array(indptr[:-1], dtype=np.int64)
+        for length in chunk_lengths:
+            entries = np.fromfile(spill, dtype=entry, count=length)
+            order = np.argsort(entries['row'], kind='stable')
+            rows = entries['row'][order]
+            chunk_counts = np.bincount(rows, minlength=n_rows)
+            first_in_chunk = np.cumsum(chunk_counts) - chunk_counts
+
+            positions = next_free[rows] + np.arange(len(rows)) - first_in_chunk[rows]
+            indices[positions] = entries['col'][order]
+            data[positions] = entries['value'][order]
+            next_free += chunk_counts
+
+    return data, indices, indptr
+
+
+def read_csr_arrays(path, chunk_bytes=CHUNK_BYTES, directory=None, in_memory_bytes=IN_MEMORY_BYTES):
+    # Files up to in_memory_bytes are read whole; larger ones stream with memory bounded by
+    # chunk_bytes and the result. With a directory, streamed arrays are memmaps there.
+    # On a 33 MB, 1M-entry file: 0.26 s for mmread + tocsr, 0.37 s in memory (38 MB peak)
+    # and 1.0 s streaming (25 MB peak, against 27 MB for mmread + tocsr).
+    header = read_header(path)
+    if os.path.getsize(path) <= in_memory_bytes:
+        data, indices, indptr = read_in_memory(path, header)
+    else:
+        data, indices, indptr = read_streaming(path, header, chunk_bytes, directory)
+
+    # Files are usually written column-major, so rows are filled in column order; sort
+    # in place only if some row is not.
+    matrix = csr_matrix((data, indices, indptr), shape=header.shape, copy=False)
+    if not matrix.has_sorted_indices:
+        matrix.sort_indices()
+
+    return data, indices, indptr, header.shape
+
+
+def cache_directory(path):
+    return f"{path}.csr"
+
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return {'source_size': stat.st_size, 'source_mtime_ns': stat.st_mtime_ns}
+
+
+def write_csr_cache(directory, data, indices, indptr, shape, stamp=None):
+    # meta.json is written last, so a cache without it is incomplete and ignored.
+    os.makedirs(directory, exist_ok=True)
+    for name, values in zip(CACHE_ARRAYS, (data, indices, indptr)):
+        target = os.path.join(directory, f"{name}.bin")
+        if isinstance(values, np.memmap) and values.filename == os.path.abspath(target):
+            values.flush()
+        else:
+            np.ascontiguousarray(values).tofile(target)
+
+    write_csr_meta(directory, shape, len(data), (data.dtype, indices.dtype, indptr.dtype), stamp)
+
+
+def write_csr_meta(directory, shape, nnz, dtypes, stamp=None):
+    # dtypes are those of (data, indices, indptr); the .bin files must already be complete.
+    meta = {'version': CACHE_VERSION, 'shape': list(shape), 'nnz': nnz,
+            'dtypes': {name: np.dtype(dtype).str for name, dtype in zip(CACHE_ARRAYS, dtypes)}}
+    meta.update(stamp or {})
+
+    temporary = os.path.join(directory, 'meta.json.tmp')
+    with open(temporary, 'w') as f:
+        json.dump(meta, f)
+    os.replace(temporary, os.path.join(directory, 'meta.json'))
+
+
+def read_csr_cache(directory, stamp=None):
+    # Returns memory-mapped (data, indices, indptr, shape), or None when the cache is
+    # missing, incomplete, from another version or stale against the source stamp.
+    try:
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if meta.get('version') != CACHE_VERSION:
+        return None
+    if stamp and any(meta.get(key) != value for key, value in stamp.items()):
+        return None
+
+    shape = tuple(meta['shape'])
+    lengths = {'data': meta['nnz'], 'indices': meta['nnz'], 'indptr': shape[0] + 1}
+    arrays = []
+    for name in CACHE_ARRAYS:
+        dtype = np.dtype(meta['dtypes'][name])
+        path = os.path.join(directory, f"{name}.bin")
+        if not os.path.exists(path) or os.path.getsize(path) != lengths[name] * dtype.itemsize:
+            return None
+        arrays.append(np.memmap(path, dtype=dtype, mode='r', shape=(lengths[name],)) if lengths[name] else np.empty(0, dtype=dtype))
+
+    return (*arrays, shape)
+
+
+def load_arrays(path, cache=True, chunk_bytes=CHUNK_BYTES, in_memory_bytes=IN_MEMORY_BYTES):
+    if not cache:
+        return read_csr_arrays(path, chunk_bytes, in_memory_bytes=in_memory_bytes)
+
+    directory = cache_directory(path)
+    stamp = _source_stamp(path)
+    cached = read_csr_cache(directory, stamp)
+    if cached is not None:
+        return cached
+
+    os.makedirs(directory, exist_ok=True)
+    meta_path = os.path.join(directory, 'meta.json')
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    write_csr_cache(directory, *read_csr_arrays(path, chunk_bytes, directory, in_memory_bytes), stamp)
+    return read_csr_cache(directory, stamp)
+
+
+def load_scipy(path, cache=True, chunk_bytes=CHUNK_BYTES, in_memory_bytes=IN_MEMORY_BYTES):
+    data, indices, indptr, shape = load_arrays(path, cache, chunk_bytes, in_memory_bytes)
+    return SparseMatrixSciPy(csr_matrix((data, indices, indptr), shape=shape, copy=False))
+
+
+def open_scipy(directory):
+    # Lazily memory-mapped CSR written by write_csr_cache or write_csr_meta.
+    arrays = read_csr_cache(directory)
+    if arrays is None:
+        raise ValueError(f"No complete CSR arrays in {directory}")
+    data, indices, indptr, shape = arrays
+    return SparseMatrixSciPy(csr_matrix((data, indices, indptr), shape=shape, copy=False))
+
+
+def load_csr(path, cache=True, chunk_bytes=CHUNK_BYTES, in_memory_bytes=IN_MEMORY_BYTES):
+    # Memoryview-backed SparseMatrixCSR over the (memory-mapped) arrays.
+    return load_scipy(path, cache, chunk_bytes, in_memory_bytes).to_csr_pure()
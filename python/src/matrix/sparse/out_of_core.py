@@ -0,0 +1,128 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+from python.src.matrix.sparse.mmio import CACHE_ARRAYS, open_scipy, write_csr_meta
+from python.src.matrix.sparse.parallel_scipy import panel_rows, row_flops
+
+
+# The panel being written and the panel being computed are alive at the same time.
+PANELS_IN_FLIGHT = 2
+
+NARROW_CHUNK = 1 << 22
+
+
+def index_dtype_for(n):
+    return np.int32 if n < 2 ** 31 else np.int64
+
+
+def _narrow_index_file(path):
+    wide = np.memmap(path, dtype=np.int64, mode='r') if os.path.getsize(path) else np.empty(0, dtype=np.int64)
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        for start in range(0, len(wide), NARROW_CHUNK):
+            wide[start:start + NARROW_CHUNK].astype(np.int32).tofile(f)
+    del wide
+    os.replace(temporary, path)
+
+
+def multiply_out_of_core(A, B, directory, memory_budget_mb=256):
+    n_rows, n_inner = A.shape
+    n_cols = B.shape[1]
+    if n_inner != B.shape[0]:
+        raise ValueError(f"Incompatible Dimensions: {A.shape} × {B.shape}")
+
+    A = A.tocsr()
+    B = B.tocsr()
+    dtype = np.result_type(A.dtype, B.dtype)
+
+    # Row flops, capped at the row width, bound each output row's nnz; the index dtype
+    # is chosen from that bound so panels can be appended without knowing the total.
+    row_entries = np.minimum(row_flops(A.indptr, A.indices, B.indptr), n_cols)
+    index_dtype = index_dtype_for(max(int(row_entries.sum()), n_rows, n_cols))
+    entry_bytes = dtype.itemsize + np.dtype(index_dtype).itemsize
+
+    # Per panel: its output, its slice of A and its indptr. SciPy's kernel also keeps
+    # two length-n_cols work arrays, reserved once.
+    budget_bytes = memory_budget_mb * 1024 * 1024
+    panel_budget = max(0, budget_bytes - n_cols * entry_bytes) // PANELS_IN_FLIGHT
+    row_bytes = (row_entries + np.diff(A.indptr)) * entry_bytes + np.dtype(index_dtype).itemsize
+    panels = panel_rows(row_bytes, panel_budget)
+
+    os.makedirs(directory, exist_ok=True)
+    meta_path = os.path.join(directory, 'meta.json')
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    files = {name: open(os.path.join(directory, f"{name}.bin"), 'wb') for name in CACHE_ARRAYS}
+
+    def write(product, offset):
+        start = time.perf_counter()
+        product.data.astype(dtype, copy=False).tofile(files['data'])
+        product.indices.astype(index_dtype, copy=False).tofile(files['indices'])
+        (product.indptr[1:].astype(index_dtype) + offset).tofile(files['indptr'])
+        return time.perf_counter() - start
+
+    nnz = 0
+    max_panel_nnz = 0
+    write_seconds = 0.0
+
+    start = time.perf_counter()
+
+    try:
+        np.zeros(1, dtype=index_dtype).tofile(files['indptr'])
+
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending = None
+            for row_start, row_end in panels:
+                product = A[row_start:row_end] @ B
+                product.sort_indices()
+
+                if pending is not None:
+                    write_seconds += pending.result()
+                pending = writer.submit(write, product, nnz)
+
+                nnz += product.nnz
+                max_panel_nnz = max(max_panel_nnz, product.nnz)
+                del product
+
+            if pending is not None:
+                write_seconds += pending.result()
+    finally:
+        for f in files.values():
+            f.close()
+
+    # SciPy downcasts int64 indices that fit int32 with an in-memory copy, which would
+    # defeat lazy reads, so an overestimated bound is corrected on disk in chunks.
+    if index_dtype == np.int64 and index_dtype_for(max(nnz, n_rows, n_cols)) == np.int32:
+        write_start = time.perf_counter()
+        for name in ('indices', 'indptr'):
+            _narrow_index_file(os.path.join(directory, f"{name}.bin"))
+        index_dtype = np.int32
+        write_seconds += time.perf_counter() - write_start
+
+    write_csr_meta(directory, (n_rows, n_cols), nnz, (dtype, index_dtype, index_dtype))
+
+    elapsed = time.perf_counter() - start
+    bytes_written = nnz * (dtype.itemsize + np.dtype(index_dtype).itemsize) + (n_rows + 1) * np.dtype(index_dtype).itemsize
+
+    return {
+        'seconds': elapsed,
+        'panels': len(panels),
+        'nnz': nnz,
+        'max_panel_nnz': max_panel_nnz,
+        'panel_budget_mb': panel_budget / (1024 * 1024),
+        'bytes_written': bytes_written,
+        'write_seconds': write_seconds,
+        'write_gbps': bytes_written / write_seconds / 1e9 if write_seconds > 0 else 0.0,
+    }
+
+
+def multiply(A, B, directory, memory_budget_mb=256):
+    # SparseMatrixSciPy or SparseMatrixCSR operands; the product is a SparseMatrixSciPy
+    # memory-mapped from directory, so rows are paged in only when read.
+    A_matrix = A.matrix if isinstance(A, SparseMatrixSciPy) else SparseMatrixSciPy.from_csr(A).matrix
+    B_matrix = B.matrix if isinstance(B, SparseMatrixSciPy) else SparseMatrixSciPy.from_csr(B).matrix
+    multiply_out_of_core(A_matrix, B_matrix, directory, memory_budget_mb)
+    return open_scipy(directory)
@@ -0,0 +1,104 @@
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from multiprocessing.util import Finalize
+from python.src.matrix.shared import attach_shared_array, release_shared_arrays, share_array
+from python.src.matrix.sparse.estimate import row_flops
+from python.src.matrix.sparse.spgemm import gustavson_rows
+
+
+_worker = {}
+
+_OPERANDS = ('A_row_ptr', 'A_col_index', 'A_values', 'B_row_ptr', 'B_col_index', 'B_values')
+
+
+def _init_worker(specs, n_cols, value_typecode):
+    # The kernels index the shared segments through cast memoryviews; nothing is copied.
+    shms = []
+    for key, (name, typecode, length) in zip(_OPERANDS, specs):
+        shm = attach_shared_array(name)
+        shms.append(shm)
+        _worker[key] = shm.buf.cast(typecode)[:length]
+
+    _worker['shms'] = shms
+    _worker['n_cols'] = n_cols
+    _worker['value_typecode'] = value_typecode
+    Finalize(None, _release_worker, exitpriority=10)
+
+
+def _release_worker():
+    for key in _OPERANDS:
+        _worker.pop(key).release()
+    for shm in _worker.pop('shms'):
+        shm.close()
+
+
+def _multiply_rows(row_start, row_end):
+    values = array(_worker['value_typecode'])
+    col_index = array('i')
+    row_ptr = array('q', [0])
+
+    gustavson_rows(_worker['A_row_ptr'], _worker['A_col_index'], _worker['A_values'],
+                   _worker['B_row_ptr'], _worker['B_col_index'], _worker['B_values'], _worker['n_cols'],
+                   row_start, row_end, values, col_index, row_ptr)
+
+    # Offsets are relative to this chunk; the parent shifts them while stitching.
+    return values, col_index, row_ptr
+
+
+def balanced_row_chunks(flops, chunks):
+    # Each row costs its flops plus a constant for the per-row bookkeeping.
+    n_rows = len(flops)
+    if n_rows == 0:
+        return []
+
+    prefix = list(accumulate(f + 1 for f in flops))
+    total = prefix[-1]
+
+    bounds = [0]
+    for c in range(1, chunks):
+        end = bisect_left(prefix, total * c / chunks) + 1
+        if bounds[-1] < end < n_rows:
+            bounds.append(end)
+    bounds.append(n_rows)
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def stitch(parts, values, col_index, row_ptr):
+    # Chunks are contiguous row ranges with sorted rows, so concatenation keeps CSR order.
+    for part_values, part_col_index, part_row_ptr in parts:
+        offset = len(values)
+        values.extend(part_values.tolist())
+        col_index.extend(part_col_index)
+        row_ptr.extend(offset + p for p in part_row_ptr[1:])
+
+
+def multiply_parallel(A, B, values, col_index, row_ptr, workers=None, chunks=None):
+    workers = workers or os.cpu_count() or 1
+    chunks = chunks or workers * 4
+    n_rows = A.shape[0]
+    n_cols = B.shape[1]
+
+    value_typecode = 'q' if A.dtype.startswith('int') and B.dtype.startswith('int') else 'd'
+    operands = [('q', A.row_ptr), ('i', A.col_index), (value_typecode, A.values),
+                ('q', B.row_ptr), ('i', B.col_index), (value_typecode, B.values)]
+
+    ranges = balanced_row_chunks(row_flops(A.row_ptr, A.col_index, B.row_ptr, n_rows), chunks)
+
+    shms = []
+    try:
+        for typecode, operand in operands:
+            shms.append(share_array(typecode, operand))
+        specs = [(shm.name, typecode, len(operand)) for shm, (typecode, operand) in zip(shms, operands)]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(specs, n_cols, value_typecode)) as pool:
+            futures = [pool.submit(_multiply_rows, start, end) for start, end in ranges]
+            parts = [future.result() for future in futures]
+    finally:
+        release_shared_arrays(shms)
+
+    stitch(parts, values, col_index, row_ptr)
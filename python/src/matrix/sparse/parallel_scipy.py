@@ -0,0 +1,115 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.sparse import csr_matrix
+from python.src.matrix.shared import attach_shared_array, create_shared_array, release_shared_arrays
+from python.src.matrix.sparse.parallel import balanced_row_chunks
+
+
+_worker = {}
+
+
+def _share(values):
+    shm = create_shared_array('b', values.nbytes)
+    np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+    return shm, (shm.name, values.dtype.str, values.shape)
+
+
+def _attach(spec):
+    name, dtype, shape = spec
+    shm = attach_shared_array(name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _attach_csr(specs, shape):
+    shms, arrays = zip(*(_attach(spec) for spec in specs))
+    _worker.setdefault('shms', []).extend(shms)
+    return csr_matrix(arrays, shape=shape, copy=False)
+
+
+def _init_worker(a_specs, a_shape, b_specs, b_shape):
+    _worker['A'] = _attach_csr(a_specs, a_shape)
+    _worker['B'] = _attach_csr(b_specs, b_shape)
+
+
+def _multiply_panel(row_start, row_end):
+    panel = _worker['A'][row_start:row_end] @ _worker['B']
+    return panel.data, panel.indices, panel.indptr
+
+
+def row_flops(A_indptr, A_indices, B_indptr):
+    products = np.concatenate(([0], np.cumsum(np.diff(B_indptr)[A_indices])))
+    return products[A_indptr[1:]] - products[A_indptr[:-1]]
+
+
+def panel_rows(row_costs, budget):
+    # Greedy contiguous row panels whose estimated cost fits the budget; a row that
+    # exceeds it on its own becomes a one-row panel.
+    n_rows = len(row_costs)
+    cumulative = np.concatenate(([0], np.cumsum(row_costs)))
+    panels = []
+    start = 0
+    while start < n_rows:
+        end = int(np.searchsorted(cumulative, cumulative[start] + max(1, budget), side='right')) - 1
+        end = min(max(end, start + 1), n_rows)
+        panels.append((start, end))
+        start = end
+    return panels
+
+
+def upper_triangle_csr(matrix):
+    # Entries with column >= row of a SciPy CSR matrix, masked in place of scipy.sparse.triu,
+    # which round-trips through COO.
+    n_rows = matrix.shape[0]
+    rows = np.repeat(np.arange(n_rows, dtype=matrix.indices.dtype), np.diff(matrix.indptr))
+    keep = matrix.indices >= rows
+    indptr = np.zeros(n_rows + 1, dtype=matrix.indptr.dtype)
+    np.cumsum(np.bincount(rows[keep], minlength=n_rows), out=indptr[1:])
+    return csr_matrix((matrix.data[keep], matrix.indices[keep], indptr), shape=matrix.shape)
+
+
+def row_chunks(A, B, workers, chunk_rows=None):
+    n_rows = A.shape[0]
+    if chunk_rows is not None:
+        return [(start, min(start + chunk_rows, n_rows)) for start in range(0, n_rows, chunk_rows)]
+
+    return balanced_row_chunks(row_flops(A.indptr, A.indices, B.indptr).tolist(), workers * 4)
+
+
+def stitch(panels, shape):
+    data = np.concatenate([panel[0] for panel in panels]) if panels else np.empty(0)
+    indices = np.concatenate([panel[1] for panel in panels]) if panels else np.empty(0, dtype=np.int32)
+
+    offsets = np.cumsum([0] + [panel[2][-1] for panel in panels])
+    # Like SciPy's get_index_dtype: both nnz and the largest column index must fit.
+    index_dtype = np.int64 if max(offsets[-1], shape[1] - 1) >= 2 ** 31 else np.int32
+    indptr = np.concatenate([np.zeros(1, dtype=index_dtype)] +
+                            [panel[2][1:].astype(index_dtype) + offset for panel, offset in zip(panels, offsets)])
+
+    return csr_matrix((data, indices.astype(index_dtype, copy=False), indptr), shape=shape)
+
+
+def multiply_parallel(A, B, workers=None, chunk_rows=None):
+    workers = workers or os.cpu_count() or 1
+    A = A.tocsr()
+    B = B.tocsr()
+
+    shms = []
+    try:
+        specs = []
+        for matrix in (A, B):
+            matrix_specs = []
+            for values in (matrix.data, matrix.indices, matrix.indptr):
+                shm, spec = _share(values)
+                shms.append(shm)
+                matrix_specs.append(spec)
+            specs.append(matrix_specs)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(specs[0], A.shape, specs[1], B.shape)) as pool:
+            futures = [pool.submit(_multiply_panel, start, end) for start, end in row_chunks(A, B, workers, chunk_rows)]
+            panels = [future.result() for future in futures]
+    finally:
+        release_shared_arrays(shms)
+
+    return stitch(panels, (A.shape[0], B.shape[1]))
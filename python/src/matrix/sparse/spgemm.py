@@ -0,0 +1,340 @@
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from itertools import compress, islice, repeat
+from operator import add, ge, le, mul, ne, sub
+from python.src.matrix.dtypes import storage_typecode
+from python.src.matrix.sparse.estimate import row_flops, sampled_ratio
+
+
+def pattern_key(matrix):
+    # A digest of the sparsity pattern, computed once and memoised on the matrix for as
+    # long as it holds the same index arrays; patterns are not modified in place.
+    cached = matrix._pattern
+    if cached is not None and cached[0] is matrix.row_ptr and cached[1] is matrix.col_index:
+        return cached[2]
+
+    digest = blake2b(array('q', matrix.row_ptr).tobytes(), digest_size=16)
+    digest.update(array('q', matrix.col_index).tobytes())
+    key = (matrix.shape, len(matrix.col_index), digest.digest())
+    matrix._pattern = (matrix.row_ptr, matrix.col_index, key)
+    return key
+
+
+MERGE = 'merge'
+HASH = 'hash'
+SORTED_ARRAY = 'sorted-array'
+DENSE_ARRAY = 'dense-array'
+
+# Below this width the accumulator arrays stay in cache and a dict is never faster.
+HASH_MIN_COLS = 1 << 15
+# Rows expected to fill at most this fraction of a wide row use a dict.
+HASH_MAX_FILL = 1 / 64
+# Rows expected to fill at least this fraction are read back by scanning every column.
+DENSE_MIN_FILL = 1 / 2
+# Rows counted exactly to correct the flop bound before choosing dense rows.
+DENSE_SAMPLES = 32
+# Shorter B rows are not worth checking B's column order for merging.
+MERGE_MIN_ROW_LENGTH = 4
+
+
+def merge_row(A_col_index, A_values, B_row_ptr, B_col_index, B_values, a_start, a_end, values, col_index):
+    # At most one term of A: the row is B's row k scaled, already in column order.
+    if a_start < a_end:
+        k = A_col_index[a_start]
+        a_val = A_values[a_start]
+        b_start, b_end = B_row_ptr[k], B_row_ptr[k + 1]
+        values.extend([a_val * b_val for b_val in B_values[b_start:b_end]])
+        col_index.extend(B_col_index[b_start:b_end])
+
+
+def gustavson_rows(A_row_ptr, A_col_index, A_values, B_row_ptr, B_col_index, B_values, n_cols,
+                   row_start, row_end, values, col_index, row_ptr, accumulator=None, marker=None, merge=False):
+    # marker holds the last row that touched each column, so the arrays can be shared
+    # across calls over different rows. merge=True needs B's rows in column order.
+    accumulator = accumulator if accumulator is not None else [0] * n_cols
+    marker = marker if marker is not None else [-1] * n_cols
+
+    for i in range(row_start, row_end):
+        a_start, a_end = A_row_ptr[i], A_row_ptr[i + 1]
+        if merge and a_end - a_start <= 1:
+            merge_row(A_col_index, A_values, B_row_ptr, B_col_index, B_values, a_start, a_end, values, col_index)
+            row_ptr.append(len(values))
+            continue
+
+        occupied = []
+
+        for idx_a in range(a_start, a_end):
+            k = A_col_index[idx_a]
+            a_val = A_values[idx_a]
+
+            for idx_b in range(B_row_ptr[k], B_row_ptr[k + 1]):
+                j = B_col_index[idx_b]
+
+                if marker[j] != i:
+                    marker[j] = i
+                    accumulator[j] = a_val * B_values[idx_b]
+                    occupied.append(j)
+                else:
+                    accumulator[j] += a_val * B_values[idx_b]
+
+        occupied.sort()
+        for j in occupied:
+            values.append(accumulator[j])
+            col_index.append(j)
+        row_ptr.append(len(values))
+
+
+def hash_rows(A_row_ptr, A_col_index, A_values, B_row_ptr, B_col_index, B_values, n_cols,
+              row_start, row_end, values, col_index, row_ptr, accumulator=None, marker=None, merge=False):
+    for i in range(row_start, row_end):
+        a_start, a_end = A_row_ptr[i], A_row_ptr[i + 1]
+        if merge and a_end - a_start <= 1:
+            merge_row(A_col_index, A_values, B_row_ptr, B_col_index, B_values, a_start, a_end, values, col_index)
+            row_ptr.append(len(values))
+            continue
+
+        sums = {}
+
+        for idx_a in range(a_start, a_end):
+            k = A_col_index[idx_a]
+            a_val = A_values[idx_a]
+
+            for idx_b in range(B_row_ptr[k], B_row_ptr[k + 1]):
+                j = B_col_index[idx_b]
+
+                if j in sums:
+                    sums[j] += a_val * B_values[idx_b]
+                else:
+                    sums[j] = a_val * B_values[idx_b]
+
+        for j in sorted(sums):
+            values.append(sums[j])
+            col_index.append(j)
+        row_ptr.append(len(values))
+
+
+def dense_array_rows(A_row_ptr, A_col_index, A_values, B_row_ptr, B_col_index, B_values, n_cols,
+                     row_start, row_end, values, col_index, row_ptr, accumulator, marker, merge=False):
+    # Gustavson without the list of touched columns: the row is read back by scanning.
+    for i in range(row_start, row_end):
+        a_start, a_end = A_row_ptr[i], A_row_ptr[i + 1]
+        if merge and a_end - a_start <= 1:
+            merge_row(A_col_index, A_values, B_row_ptr, B_col_index, B_values, a_start, a_end, values, col_index)
+            row_ptr.append(len(values))
+            continue
+
+        for idx_a in range(a_start, a_end):
+            k = A_col_index[idx_a]
+            a_val = A_values[idx_a]
+
+            for idx_b in range(B_row_ptr[k], B_row_ptr[k + 1]):
+                j = B_col_index[idx_b]
+
+                if marker[j] != i:
+                    marker[j] = i
+                    accumulator[j] = a_val * B_values[idx_b]
+                else:
+                    accumulator[j] += a_val * B_values[idx_b]
+
+        for j in range(n_cols):
+            if marker[j] == i:
+                values.append(accumulator[j])
+                col_index.append(j)
+        row_ptr.append(len(values))
+
+
+ROW_KERNELS = {
+    HASH: hash_rows,
+    SORTED_ARRAY: gustavson_rows,
+    DENSE_ARRAY: dense_array_rows,
+}
+
+
+def rows_sorted(row_ptr, col_index):
+    # Strictly increasing columns within rows: a column may only drop where a row starts.
+    drops = set(compress(range(1, len(col_index)), map(ge, col_index, islice(col_index, 1, None))))
+    return drops <= set(row_ptr)
+
+
+def accumulator_limits(n_cols):
+    hash_limit = n_cols * HASH_MAX_FILL if n_cols >= HASH_MIN_COLS else -1
+    return hash_limit, n_cols * DENSE_MIN_FILL
+
+
+def accumulator_runs(nnz, n_cols, row_start, row_end, ratio=1.0):
+    # Consecutive rows with the same accumulator, found without a Python loop per row.
+    # ratio scales nnz, so a flop list can be passed with its sampled ratio.
+    hash_limit, dense_limit = accumulator_limits(n_cols)
+    is_hash = map(le, islice(nnz, row_start, row_end), repeat(hash_limit / ratio))
+    is_dense = map(ge, islice(nnz, row_start, row_end), repeat(dense_limit / ratio))
+    labels = list(map(add, is_hash, map(mul, is_dense, repeat(2))))
+
+    bounds = [0, *compress(range(1, len(labels)), map(ne, labels, islice(labels, 1, None))), len(labels)]
+    kernels = (SORTED_ARRAY, HASH, DENSE_ARRAY)
+    return [(kernels[labels[start]], row_start + start, row_start + end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def plan_accumulators(A_row_ptr, A_col_index, B_row_ptr, B_col_index, n_cols, row_start, row_end, nnz=None):
+    # Runs of rows per accumulator, chosen from nnz (the estimated stored entries of each
+    # row) or, without it, from the flop bound corrected by a sampled ratio before any
+    # row is read back densely. Also whether rows with at most one term of A are merged,
+    # which needs B's rows sorted and long enough to repay checking that.
+    hash_limit, dense_limit = accumulator_limits(n_cols)
+    a_lengths = list(map(sub, A_row_ptr[row_start + 1:row_end + 1], A_row_ptr[row_start:row_end]))
+    merge = (min(a_lengths, default=2) <= 1 and len(B_col_index) >= MERGE_MIN_ROW_LENGTH * (len(B_row_ptr) - 1)
+             and rows_sorted(B_row_ptr, B_col_index))
+
+    if nnz is not None:
+        return accumulator_runs(nnz, n_cols, row_start, row_end), merge
+
+    # Only a wide B or a possibly dense row can move a row off the sorted array.
+    max_b = max(map(sub, B_row_ptr[1:], B_row_ptr[:-1]), default=0)
+    if hash_limit < 0 and max(a_lengths, default=0) * max_b < dense_limit:
+        return [(SORTED_ARRAY, row_start, row_end)], merge
+
+    flops = row_flops(A_row_ptr, A_col_index, B_row_ptr, row_end)
+    ratio = 1.0
+    if max(flops[row_start:], default=0) >= dense_limit:
+        ratio, _ = sampled_ratio(A_row_ptr, A_col_index, B_row_ptr, B_col_index, flops, DENSE_SAMPLES, seed=0)
+    return accumulator_runs(flops, n_cols, row_start, row_end, ratio), merge
+
+
+def choose_accumulators(A_row_ptr, A_col_index, B_row_ptr, B_col_index, n_cols, nnz=None):
+    # The accumulator adaptive_rows uses for each row:
+    # merge: at most one term of A, so the row is B's row scaled.
+    # hash: few entries in a wide row; a dict touches only those columns.
+    # sorted-array: Gustavson's dense accumulator, reading back the sorted touched columns.
+    # dense-array: the same accumulator read back by scanning every column.
+    n_rows = len(A_row_ptr) - 1
+    runs, merge = plan_accumulators(A_row_ptr, A_col_index, B_row_ptr, B_col_index, n_cols, 0, n_rows, nnz)
+
+    strategies = []
+    for strategy, start, end in runs:
+        strategies.extend([strategy] * (end - start))
+    if merge:
+        for i in range(n_rows):
+            if A_row_ptr[i + 1] - A_row_ptr[i] <= 1:
+                strategies[i] = MERGE
+    return strategies
+
+
+def adaptive_rows(A_row_ptr, A_col_index, A_values, B_row_ptr, B_col_index, B_values, n_cols,
+                  row_start, row_end, values, col_index, row_ptr, nnz=None):
+    # Gustavson's row-by-row product with the accumulator picked per run of rows.
+    # The shared arrays are only allocated when some run uses them.
+    runs, merge = plan_accumulators(A_row_ptr, A_col_index, B_row_ptr, B_col_index, n_cols, row_start, row_end, nnz)
+    uses_arrays = any(strategy != HASH for strategy, _, _ in runs)
+    accumulator = [0] * n_cols if uses_arrays else None
+    marker = [-1] * n_cols if uses_arrays else None
+
+    for strategy, start, end in runs:
+        ROW_KERNELS[strategy](A_row_ptr, A_col_index, A_values, B_row_ptr, B_col_index, B_values, n_cols,
+                              start, end, values, col_index, row_ptr, accumulator, marker, merge)
+
+
+def symbolic_multiply(A_row_ptr, A_col_index, B_row_ptr, B_col_index, n_rows):
+    row_ptr = [0]
+    col_index = []
+
+    for i in range(n_rows):
+        columns = set()
+        for k in A_col_index[A_row_ptr[i]:A_row_ptr[i + 1]]:
+            columns.update(B_col_index[B_row_ptr[k]:B_row_ptr[k + 1]])
+        col_index.extend(sorted(columns))
+        row_ptr.append(len(col_index))
+
+    return row_ptr, col_index
+
+
+class SpGEMMPlan:
+
+    __slots__ = ('shape', 'row_ptr', 'col_index', 'pattern_a', 'pattern_b')
+
+    def __init__(self, row_ptr, col_index, shape, pattern_a, pattern_b):
+        self.row_ptr = row_ptr
+        self.col_index = col_index
+        self.shape = shape
+        self.pattern_a = pattern_a
+        self.pattern_b = pattern_b
+
+    @classmethod
+    def build(cls, A, B):
+        if A.shape[1] != B.shape[0]:
+            raise ValueError(f"Incompatible Dimensions: {A.shape} × {B.shape}")
+
+        row_ptr, col_index = symbolic_multiply(A.row_ptr, A.col_index, B.row_ptr, B.col_index, A.shape[0])
+        return cls(row_ptr, col_index, (A.shape[0], B.shape[1]), pattern_key(A), pattern_key(B))
+
+    def numbers_non_zero(self):
+        return len(self.col_index)
+
+    def numeric(self, A, B):
+        if pattern_key(A) != self.pattern_a or pattern_key(B) != self.pattern_b:
+            raise ValueError(f"Plan for {self.shape} does not match operands {A.shape} × {B.shape}")
+
+        row_ptr = self.row_ptr
+        col_index = self.col_index
+        # Allocated per call: plans are shared through the plan cache, possibly across threads.
+        accumulator = [0] * self.shape[1]
+        A_row_ptr, A_col_index, A_values = A.row_ptr, A.col_index, A.values
+        B_row_ptr, B_col_index, B_values = B.row_ptr, B.col_index, B.values
+
+        values = []
+
+        for i in range(self.shape[0]):
+            a_start, a_end = A_row_ptr[i], A_row_ptr[i + 1]
+            for k, a_val in zip(A_col_index[a_start:a_end], A_values[a_start:a_end]):
+                b_start, b_end = B_row_ptr[k], B_row_ptr[k + 1]
+                for j, b_val in zip(B_col_index[b_start:b_end], B_values[b_start:b_end]):
+                    accumulator[j] += a_val * b_val
+
+            row = col_index[row_ptr[i]:row_ptr[i + 1]]
+            values.extend([accumulator[j] for j in row])
+            for j in row:
+                accumulator[j] = 0
+
+        return values
+
+    def execute(self, A, B):
+        values = self.numeric(A, B)
+
+        if A.is_compact():
+            return type(A)(array(storage_typecode(A.values), values), array('i', self.col_index), array('i', self.row_ptr), self.shape)
+        return type(A)(values, list(self.col_index), list(self.row_ptr), self.shape)
+
+
+class PlanCache:
+
+    def __init__(self, max_plans=16):
+        self.max_plans = max_plans
+        self.plans = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, A, B):
+        key = (pattern_key(A), pattern_key(B))
+
+        plan = self.plans.get(key)
+        if plan is not None:
+            self.plans.move_to_end(key)
+            self.hits += 1
+            return plan
+
+        self.misses += 1
+        plan = SpGEMMPlan.build(A, B)
+        self.plans[key] = plan
+        if len(self.plans) > self.max_plans:
+            self.plans.popitem(last=False)
+        return plan
+
+    def clear(self):
+        self.plans.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.plans)
+
+
+default_plan_cache = PlanCache()
@@ -0,0 +1,180 @@
+import itertools
+import math
+import random
+from python.src.matrix.dtypes import is_integer, random_value_func
+from python.src.matrix.sparse.generators import random_csr
+
+
+STRUCTURES = ('uniform', 'banded', 'block-diagonal', 'power-law', 'stencil-2d', 'stencil-3d', 'permuted-banded')
+
+FIXED_DENSITY_STRUCTURES = ('stencil-2d', 'stencil-3d')
+
+
+def banded(n, bandwidth, dtype='float64', seed=None):
+    value = random_value_func(dtype, random.Random(seed))
+    values, col_index, row_ptr = [], [], [0]
+
+    for i in range(n):
+        for j in range(max(0, i - bandwidth), min(n, i + bandwidth + 1)):
+            values.append(value())
+            col_index.append(j)
+        row_ptr.append(len(values))
+
+    return values, col_index, row_ptr
+
+
+def block_diagonal(n, block_size, dtype='float64', seed=None):
+    value = random_value_func(dtype, random.Random(seed))
+    values, col_index, row_ptr = [], [], [0]
+
+    for i in range(n):
+        start = i - i % block_size
+        for j in range(start, min(n, start + block_size)):
+            values.append(value())
+            col_index.append(j)
+        row_ptr.append(len(values))
+
+    return values, col_index, row_ptr
+
+
+def block_sparse(n, block_size, sparsity=0.9, dtype='float64', seed=None):
+    # Dense block_size × block_size blocks on a uniformly random block pattern (FEM-style).
+    rng = random.Random(seed)
+    value = random_value_func(dtype, rng)
+    n_blocks = -(-n // block_size)
+    _, block_col_index, block_row_ptr = random_csr(n_blocks, n_blocks, sparsity, dtype, rng.randrange(2 ** 32))
+
+    values, col_index, row_ptr = [], [], [0]
+
+    for i in range(n):
+        I = i // block_size
+        for J in block_col_index[block_row_ptr[I]:block_row_ptr[I + 1]]:
+            for j in range(J * block_size, min(n, (J + 1) * block_size)):
+                values.append(value())
+                col_index.append(j)
+        row_ptr.append(len(values))
+
+    return values, col_index, row_ptr
+
+
+def power_law(n, average_degree, exponent=2.1, dtype='float64', seed=None):
+    # Row degrees follow a Pareto tail (graph-like skew) rescaled to the requested mean.
+    rng = random.Random(seed)
+    value = random_value_func(dtype, rng)
+
+    raw = [rng.paretovariate(exponent - 1) for _ in range(n)]
+    target = average_degree * n
+    scale = target / sum(raw) if raw else 0
+
+    # Clipping the tail to n columns loses mass, so refine the scale a few times.
+    for _ in range(8):
+        degrees = [min(n, max(1, round(x * scale))) for x in raw]
+        total = sum(degrees)
+        if not total or abs(total - target) <= 0.01 * target:
+            break
+        scale *= target / total
+
+    values, col_index, row_ptr = [], [], [0]
+
+    for degree in degrees:
+        col_index.extend(sorted(rng.sample(range(n), degree)))
+        values.extend(value() for _ in range(degree))
+        row_ptr.append(len(values))
+
+    return values, col_index, row_ptr
+
+
+def grid_dims(n, dims):
+    # The most points a near-cubic grid (every extent at least floor(n ** (1 / dims)))
+    # can hold without exceeding n, so prime n does not degenerate into a 1 × n line.
+    side = max(1, round(n ** (1 / dims)))
+    while side > 1 and side ** dims > n:
+        side -= 1
+    while (side + 1) ** dims <= n:
+        side += 1
+
+    best = None
+    for leading in itertools.product(range(side, n // side ** (dims - 1) + 1), repeat=dims - 1):
+        points = math.prod(leading)
+        if points * side > n:
+            continue
+        shape = leading + (n // points,)
+        key = (n - math.prod(shape), max(shape), shape)
+        if best is None or key < best:
+            best = key
+    return best[2]
+
+
+def stencil(n, dims=2, dtype='float64'):
+    # (2*dims + 1)-point Laplacian on grid_dims(n, dims); rows past the grid are isolated
+    # nodes with only the diagonal.
+    shape = grid_dims(n, dims)
+    points = math.prod(shape)
+    cast = int if is_integer(dtype) else float
+
+    strides = []
+    stride = 1
+    for extent in reversed(shape):
+        strides.insert(0, stride)
+        stride *= extent
+
+    values, col_index, row_ptr = [], [], [0]
+
+    for i in range(n):
+        neighbours = []
+        if i < points:
+            coordinates = [(i // s) % extent for s, extent in zip(strides, shape)]
+            for c, s, extent in zip(coordinates, strides, shape):
+                if c > 0:
+                    neighbours.append(i - s)
+                if c < extent - 1:
+                    neighbours.append(i + s)
+
+        for j in sorted(neighbours + [i]):
+            values.append(cast(2 * dims if j == i else -1))
+            col_index.append(j)
+        row_ptr.append(len(values))
+
+    return values, col_index, row_ptr
+
+
+def permute(values, col_index, row_ptr, seed=None):
+    # Symmetric permutation P A P^T: keeps the degree distribution, destroys locality.
+    n = len(row_ptr) - 1
+    order = list(range(n))
+    random.Random(seed).shuffle(order)
+    new_index = [0] * n
+    for new, old in enumerate(order):
+        new_index[old] = new
+
+    permuted_values, permuted_col_index, permuted_row_ptr = [], [], [0]
+    for old in order:
+        row = sorted(zip((new_index[j] for j in col_index[row_ptr[old]:row_ptr[old + 1]]),
+                         values[row_ptr[old]:row_ptr[old + 1]]))
+        permuted_col_index.extend(j for j, _ in row)
+        permuted_values.extend(v for _, v in row)
+        permuted_row_ptr.append(len(permuted_values))
+
+    return permuted_values, permuted_col_index, permuted_row_ptr
+
+
+def generate(structure, n, sparsity=0.9, dtype='float64', seed=None):
+    # Structure parameters are chosen so that the density is close to 1 - sparsity;
+    # stencils have a fixed number of non-zeros per row and ignore it.
+    non_zeros_per_row = max(1, round(n * (1 - sparsity)))
+
+    if structure == 'uniform':
+        return random_csr(n, n, sparsity, dtype, seed)
+    if structure == 'banded':
+        return banded(n, (non_zeros_per_row - 1) // 2, dtype, seed)
+    if structure == 'block-diagonal':
+        return block_diagonal(n, non_zeros_per_row, dtype, seed)
+    if structure == 'power-law':
+        return power_law(n, non_zeros_per_row, dtype=dtype, seed=seed)
+    if structure == 'stencil-2d':
+        return stencil(n, 2, dtype)
+    if structure == 'stencil-3d':
+        return stencil(n, 3, dtype)
+    if structure == 'permuted-banded':
+        return permute(*banded(n, (non_zeros_per_row - 1) // 2, dtype, seed), seed=seed)
+    raise ValueError(f"Unknown structure: {structure} (expected one of {STRUCTURES})")
@@ -0,0 +1,95 @@
+import os
+import json
+import tempfile
+import unittest
+from python.src.matrix.dense.autotune import Autotuner, DEFAULTS, SEARCH_SPACE, host_key, size_bucket, tuned_value, CACHE_ENV
+from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+
+
+class TestAutotuner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, "autotune.json")
+        self.previous = os.environ.get(CACHE_ENV)
+        os.environ[CACHE_ENV] = self.cache_path
+
+    def tearDown(self):
+        if self.previous is None:
+            os.environ.pop(CACHE_ENV, None)
+        else:
+            os.environ[CACHE_ENV] = self.previous
+        self.tmp.cleanup()
+
+    def test_size_bucket(self):
+        self.assertEqual(size_bucket(64), 64)
+        self.assertEqual(size_bucket(65), 128)
+        self.assertEqual(size_bucket(1100), 2048)
+
+    def test_store_and_lookup_persist(self):
+        tuner = Autotuner(self.cache_path)
+        tuner.store('DenseMatrix', 'block_size', 300, 64)
+
+        reloaded = Autotuner(self.cache_path)
+        self.assertEqual(reloaded.lookup('DenseMatrix', 'block_size', 400), 64)
+        self.assertIsNone(reloaded.lookup('DenseMatrix', 'block_size', 600))
+
+        with open(self.cache_path) as f:
+            self.assertEqual(json.load(f)[host_key()]['DenseMatrix']['block_size'], {'512': 64})
+
+    def test_small_sizes_use_defaults(self):
+        tuner = Autotuner(self.cache_path)
+        self.assertEqual(tuner.get('DenseMatrix', 'block_size', 8), DEFAULTS['block_size'])
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_short_candidates_from_neighbour_bucket(self):
+        tuner = Autotuner(self.cache_path)
+        self.assertEqual(tuner.short_candidates('DenseMatrixNumPy', 'cutoff', 512), SEARCH_SPACE['cutoff'])
+
+        tuner.store('DenseMatrixNumPy', 'cutoff', 256, 64)
+        self.assertEqual(tuner.short_candidates('DenseMatrixNumPy', 'cutoff', 512), [32, 64, 128])
+
+    def test_missing_bucket_uses_default(self):
+        self.assertEqual(tuned_value('DenseMatrixNumPy', 'block_size', 64), DEFAULTS['block_size'])
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_missing_bucket_triggers_tuning_when_asked(self):
+        value = tuned_value('DenseMatrixNumPy', 'block_size', 64, tune=True)
+
+        self.assertIn(value, SEARCH_SPACE['block_size'])
+        self.assertEqual(Autotuner(self.cache_path).lookup('DenseMatrixNumPy', 'block_size', 64), value)
+
+    def test_stored_under_probe_bucket(self):
+        tuner = Autotuner(self.cache_path)
+        best = tuner.tune('DenseMatrixNumPy', 'block_size', 1024, [16, 32], probe_size=64)
+
+        self.assertEqual(tuner.lookup('DenseMatrixNumPy', 'block_size', 64), best)
+        self.assertIsNone(tuner.lookup('DenseMatrixNumPy', 'block_size', 1024))
+
+    def test_large_sizes_read_probe_bucket(self):
+        tuner = Autotuner(self.cache_path)
+        tuner.store('DenseMatrix', 'block_size', 256, 128)
+
+        self.assertEqual(tuner.get('DenseMatrix', 'block_size', 1024), 128)
+        self.assertEqual(tuner.get('DenseMatrix', 'block_size', 128), DEFAULTS['block_size'])
+
+    def test_winograd_tuned_separately(self):
+        tuner = Autotuner(self.cache_path)
+        tuner.warm('DenseMatrix', [64], ['winograd_cutoff'])
+
+        self.assertIsNotNone(tuner.lookup('DenseMatrix', 'winograd_cutoff', 64))
+        self.assertIsNone(tuner.lookup('DenseMatrix', 'cutoff', 64))
+
+    def test_multiply_uses_tuned_value(self):
+        Autotuner(self.cache_path).store('DenseMatrixNumPy', 'block_size', 64, 16)
+        A = DenseMatrixNumPy.random(64)
+        B = DenseMatrixNumPy.random(64)
+
+        result = A.multiply_tiled(B)
+        expected = A.multiply_matmul(B)
+
+        self.assertTrue(((result.data - expected.data) ** 2).sum() < 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
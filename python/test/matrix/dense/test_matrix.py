@@ -24,6 +24,27 @@ class TestDenseMatrix(unittest.TestCase):
                 result = self.A.multiply_tiled(self.B, block_size)
                 self.assertEqual(result.data, self.expected_data)
 
+    def test_multiply_tiled_micro_kernel(self):
+        n = 11
+        A_list, B_list = generate_matrices(n)
+        A = DenseMatrix(A_list)
+        B = DenseMatrix(B_list)
+
+        expected = A.multiply_standard(B)
+
+        for block_size, register_block in [(4, (4, 4)), (8, (2, 4)), (11, (3, 5))]:
+            with self.subTest(block_size=block_size, register_block=register_block):
+                result = A.multiply_tiled(B, block_size, register_block)
+                for i in range(n):
+                    for j in range(n):
+                        self.assertAlmostEqual(result.data[i][j], expected.data[i][j], places=10)
+
+    def test_multiply_recursive(self):
+        for morton in [False, True]:
+            with self.subTest(morton=morton):
+                result = self.A.multiply_recursive(self.B, leaf=1, morton=morton)
+                self.assertEqual(result.data, self.expected_data)
+
     def test_multiply_strassen(self):
         result = self.A.multiply_strassen(self.B)
         self.assertEqual(result.data, self.expected_data)
@@ -39,6 +60,26 @@ class TestDenseMatrix(unittest.TestCase):
             for j in range(3):
                 self.assertAlmostEqual(result_strassen.data[i][j], result_standard.data[i][j], places=10)
 
+    def test_multiply_winograd(self):
+        result = self.A.multiply_winograd(self.B)
+        self.assertEqual(result.data, self.expected_data)
+
+    def test_strassen_cutoffs(self):
+        n = 13
+        A_list, B_list = generate_matrices(n)
+        A = DenseMatrix(A_list)
+        B = DenseMatrix(B_list)
+
+        expected = A.multiply_standard(B)
+
+        for cutoff in [1, 2, 4, 8]:
+            for winograd in [False, True]:
+                with self.subTest(cutoff=cutoff, winograd=winograd):
+                    result = A.multiply_strassen(B, cutoff=cutoff, winograd=winograd)
+                    for i in range(n):
+                        for j in range(n):
+                            self.assertAlmostEqual(result.data[i][j], expected.data[i][j], places=10)
+
     def test_algorithms_equivalence(self):
         n = 8
         A_list, B_list = generate_matrices(n)
@@ -56,12 +97,36 @@ class TestDenseMatrix(unittest.TestCase):
                 self.assertAlmostEqual(result_standard.data[i][j], result_tiled.data[i][j], places=10)
                 self.assertAlmostEqual(result_standard.data[i][j], result_strassen.data[i][j], places=10)
 
+    def test_multiply_parallel(self):
+        result = self.A.multiply_parallel(self.B, workers=2)
+        self.assertEqual(result.data, self.expected_data)
+
+    def test_multiply_parallel_blocks(self):
+        n = 17
+        A_list, B_list = generate_matrices(n)
+        A = DenseMatrix(A_list)
+        B = DenseMatrix(B_list)
+
+        expected = A.multiply_row_oriented(B)
+
+        for block_rows in [1, 5, 17]:
+            with self.subTest(block_rows=block_rows):
+                result = A.multiply_parallel(B, workers=2, block_rows=block_rows)
+                for i in range(n):
+                    for j in range(n):
+                        self.assertAlmostEqual(result.data[i][j], expected.data[i][j], places=10)
+
     def test_random(self):
         A = DenseMatrix.random(10)
         B = DenseMatrix.random(10)
         C = A.multiply_standard(B)
         self.assertEqual(C.shape, (10, 10))
 
+    def test_random_dtypes(self):
+        self.assertTrue(all(isinstance(value, int) for row in DenseMatrix.random(4, 'int32').data for value in row))
+        with self.assertRaises(ValueError):
+            DenseMatrix.random(4, 'float32')
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,92 @@
+import unittest
+from python.src.matrix.dense.matrix import DenseMatrix
+from python.src.matrix.dense.matrix_array import DenseMatrixArray
+from python.src.matrix.dense.utils import generate_matrices
+
+
+class TestDenseMatrixArray(unittest.TestCase):
+
+    def setUp(self):
+        self.A = DenseMatrixArray.from_dense([[1, 2], [3, 4]])
+        self.B = DenseMatrixArray.from_dense([[5, 6], [7, 8]])
+        self.expected_data = [[19, 22], [43, 50]]
+
+    def test_from_dense_to_dense(self):
+        self.assertEqual(self.A.shape, (2, 2))
+        self.assertEqual(self.A.data.typecode, 'd')
+        self.assertEqual(self.A.to_dense(), [[1, 2], [3, 4]])
+
+    def test_multiply_standard(self):
+        result = self.A.multiply_standard(self.B)
+        self.assertEqual(result.to_dense(), self.expected_data)
+
+    def test_multiply_row_oriented(self):
+        result = self.A.multiply_row_oriented(self.B)
+        self.assertEqual(result.to_dense(), self.expected_data)
+
+    def test_multiply_tiled(self):
+        for block_size in [1, 2, 4]:
+            with self.subTest(block_size=block_size):
+                result = self.A.multiply_tiled(self.B, block_size)
+                self.assertEqual(result.to_dense(), self.expected_data)
+
+    def test_multiply_strassen(self):
+        result = self.A.multiply_strassen(self.B)
+        self.assertEqual(result.to_dense(), self.expected_data)
+
+    def test_matches_list_layout(self):
+        n = 70
+        A_list, B_list = generate_matrices(n)
+        expected = DenseMatrix(A_list).multiply_row_oriented(DenseMatrix(B_list)).data
+
+        A = DenseMatrixArray.from_dense(A_list)
+        B = DenseMatrixArray.from_dense(B_list)
+
+        for result in [A.multiply_standard(B), A.multiply_tiled(B, 32), A.multiply_strassen(B, 64), A.multiply_winograd(B, 16)]:
+            data = result.to_dense()
+            for i in range(n):
+                for j in range(n):
+                    self.assertAlmostEqual(data[i][j], expected[i][j], places=10)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.A.extra = 1
+
+    def test_random(self):
+        A = DenseMatrixArray.random(10)
+        B = DenseMatrixArray.random(10)
+        C = A.multiply_standard(B)
+        self.assertEqual(C.shape, (10, 10))
+        self.assertEqual(len(C.data), 100)
+
+
+    def test_dtypes(self):
+        for dtype, typecode in [('float32', 'f'), ('int64', 'q'), ('int32', 'i')]:
+            with self.subTest(dtype=dtype):
+                A = DenseMatrixArray.from_dense([[1, 2], [3, 4]], dtype)
+                B = DenseMatrixArray.from_dense([[5, 6], [7, 8]], dtype)
+
+                for result in [A.multiply_standard(B), A.multiply_tiled(B, 1), A.multiply_strassen(B, 1)]:
+                    self.assertEqual(result.data.typecode, typecode)
+                    self.assertEqual(result.dtype, dtype)
+                    self.assertEqual(result.to_dense(), self.expected_data)
+
+    def test_int32_overflow(self):
+        A = DenseMatrixArray.from_dense([[50000, 0], [0, 1]], 'int32')
+
+        for product in [A.multiply_standard, A.multiply_row_oriented, A.multiply_tiled, A.multiply_strassen]:
+            with self.subTest(product=product.__name__):
+                with self.assertRaises(ValueError):
+                    product(A)
+
+    def test_random_integer(self):
+        A = DenseMatrixArray.random(10, 'int32')
+        self.assertEqual(A.data.typecode, 'i')
+        self.assertTrue(all(1 <= value <= 9 for value in A.data))
+
+    def test_unsupported_dtype(self):
+        with self.assertRaises(ValueError):
+            DenseMatrixArray.random(4, 'float16')
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,7 +1,8 @@
 import unittest
 import numpy as np
 from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
-from python.src.matrix.dense.utils import generate_matrices_numpy
+from python.src.matrix.dense.strassen_numpy import workspace_for
+from python.src.matrix.dense.utils import generate_matrices_numpy, relative_error
 
 
 class TestDenseMatrixNumPy(unittest.TestCase):
@@ -25,10 +26,50 @@ class TestDenseMatrixNumPy(unittest.TestCase):
                 result = self.A.multiply_tiled(self.B, block_size)
                 np.testing.assert_array_almost_equal(result.data, self.expected)
 
+    def test_multiply_recursive(self):
+        for morton in [False, True]:
+            with self.subTest(morton=morton):
+                result = self.A.multiply_recursive(self.B, leaf=1, morton=morton)
+                np.testing.assert_array_almost_equal(result.data, self.expected)
+
     def test_multiply_strassen(self):
         result = self.A.multiply_strassen(self.B)
         np.testing.assert_array_almost_equal(result.data, self.expected)
 
+    def test_multiply_tiled_threads(self):
+        A_np, B_np = generate_matrices_numpy(37)
+        A = DenseMatrixNumPy(A_np)
+        B = DenseMatrixNumPy(B_np)
+
+        expected = A_np @ B_np
+
+        for block_size in [5, 16, 37]:
+            for workers in [1, 3]:
+                with self.subTest(block_size=block_size, workers=workers):
+                    result = A.multiply_tiled(B, block_size, workers=workers)
+                    np.testing.assert_array_almost_equal(result.data, expected, decimal=10)
+
+    def test_multiply_strassen_workspace(self):
+        A_np, B_np = generate_matrices_numpy(45)
+        A = DenseMatrixNumPy(A_np)
+        B = DenseMatrixNumPy(B_np)
+
+        expected = A_np @ B_np
+
+        for cutoff in [4, 8, 64]:
+            for workers in [1, 4]:
+                with self.subTest(cutoff=cutoff, workers=workers):
+                    result = A.multiply_strassen(B, cutoff=cutoff, workers=workers)
+                    self.assertEqual(result.shape, (45, 45))
+                    np.testing.assert_array_almost_equal(result.data, expected, decimal=10)
+
+    def test_strassen_workspace_reused(self):
+        for workers in [1, 4]:
+            with self.subTest(workers=workers):
+                workspace = workspace_for(64, 2, np.float64, workers)
+                self.assertIs(workspace_for(64, 2, np.float64, workers), workspace)
+                self.assertIsNot(workspace_for(64, 2, np.float32, workers), workspace)
+
     def test_strassen_any_size(self):
         A = DenseMatrixNumPy([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
         B = DenseMatrixNumPy([[9, 8, 7], [6, 5, 4], [3, 2, 1]])
@@ -60,5 +101,51 @@ class TestDenseMatrixNumPy(unittest.TestCase):
         self.assertEqual(C.shape, (10, 10))
 
 
+    def test_random_dtype(self):
+        for dtype in [np.float64, np.float32, np.int64, np.int32]:
+            with self.subTest(dtype=dtype):
+                A = DenseMatrixNumPy.random(16, dtype)
+                B = DenseMatrixNumPy.random(16, dtype)
+                self.assertEqual(A.dtype, dtype)
+                self.assertEqual(A.multiply_matmul(B).dtype, dtype)
+                self.assertEqual(A.multiply_tiled(B, 4).dtype, dtype)
+                self.assertEqual(A.multiply_strassen(B, 4).dtype, dtype)
+
+    def test_mixed_precision(self):
+        A = DenseMatrixNumPy.random(96)
+        B = DenseMatrixNumPy.random(96)
+        expected = A.data @ B.data
+
+        for mode in ['accumulate', 'refine']:
+            with self.subTest(mode=mode):
+                result = A.multiply_mixed_precision(B, mode, block_size=32)
+                self.assertEqual(result.dtype, np.float64)
+                self.assertLess(relative_error(result.data, expected), 1e-6)
+
+        with self.assertRaises(ValueError):
+            A.multiply_mixed_precision(B, 'half')
+
+    def test_gram(self):
+        for dtype in [np.float64, np.float32, np.int64]:
+            with self.subTest(dtype=dtype):
+                A = DenseMatrixNumPy(np.arange(35).reshape(7, 5) % 4, dtype=dtype)
+                expected = A.data @ A.data.T
+
+                np.testing.assert_array_almost_equal(A.gram().data, expected)
+                upper = A.gram(upper=True)
+                self.assertEqual(upper.dtype, dtype)
+                self.assertTrue(upper.data.flags.c_contiguous)
+                np.testing.assert_array_almost_equal(upper.data, np.triu(expected))
+
+    def test_multiply_transpose(self):
+        A = DenseMatrixNumPy.random(12)
+        B = DenseMatrixNumPy(np.random.rand(8, 12))
+
+        np.testing.assert_array_almost_equal(A.multiply_transpose(B).data, A.data @ B.data.T)
+        np.testing.assert_array_almost_equal(A.multiply_transpose(A).data, A.data @ A.data.T)
+        with self.assertRaises(ValueError):
+            A.multiply_transpose(DenseMatrixNumPy(np.ones((3, 4))))
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
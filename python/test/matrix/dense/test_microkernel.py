@@ -0,0 +1,37 @@
+import unittest
+from python.src.matrix.dense.microkernel import generate_kernel_source, get_kernel, multiply_tiled_micro
+
+
+class TestMicroKernel(unittest.TestCase):
+
+    def test_generated_source_is_unrolled(self):
+        source = generate_kernel_source(2, 3)
+
+        self.assertIn("def kernel_2x3(A, B, C, i, j, k_start, k_end):", source)
+        self.assertIn("c1_2 += a * b2", source)
+        self.assertEqual(source.count("+= a * b"), 6)
+
+    def test_kernels_are_cached_by_shape(self):
+        self.assertIs(get_kernel(4, 4), get_kernel(4, 4))
+        self.assertIsNot(get_kernel(4, 4), get_kernel(4, 3))
+
+    def test_kernel_accumulates_into_c(self):
+        A = [[1, 2], [3, 4]]
+        B = [[5, 6], [7, 8]]
+        C = [[1, 1], [1, 1]]
+
+        get_kernel(2, 2)(A, B, C, 0, 0, 0, 2)
+
+        self.assertEqual(C, [[20, 23], [44, 51]])
+
+    def test_multiply_tiled_micro(self):
+        A = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        B = [[9, 8, 7], [6, 5, 4], [3, 2, 1]]
+
+        C = multiply_tiled_micro(A, B, 3, 2, (2, 2))
+
+        self.assertEqual(C, [[30, 24, 18], [84, 69, 54], [138, 114, 90]])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
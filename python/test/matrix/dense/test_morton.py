@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from python.src.matrix.dense.morton import morton_index, morton_layout, to_morton, from_morton, multiply_recursive, multiply_recursive_morton
+from python.src.matrix.dense.morton_numpy import to_morton_numpy, from_morton_numpy, multiply_recursive_numpy, multiply_recursive_morton_numpy
+from python.src.matrix.dense.utils import generate_matrices
+
+
+class TestMorton(unittest.TestCase):
+
+    def test_morton_index(self):
+        self.assertEqual([morton_index(r, c) for r in range(2) for c in range(2)], [0, 1, 2, 3])
+        self.assertEqual(morton_index(2, 0), 8)
+        self.assertEqual(morton_index(3, 3), 15)
+
+    def test_layout_padding(self):
+        self.assertEqual(morton_layout(100, 32), (100, 2, 25))
+        self.assertEqual(morton_layout(20, 32), (20, 0, 20))
+
+    def test_quadrants_are_contiguous(self):
+        rows = [[i * 4 + j for j in range(4)] for i in range(4)]
+        flat = to_morton(rows, 4, 1)
+        self.assertEqual(flat[:4], [0, 1, 4, 5])
+        self.assertEqual(flat[4:8], [2, 3, 6, 7])
+        self.assertEqual(flat[8:12], [8, 9, 12, 13])
+
+    def test_round_trip(self):
+        for n in [1, 7, 33]:
+            with self.subTest(n=n):
+                A, _ = generate_matrices(n)
+                self.assertEqual(from_morton(to_morton(A, n, 4), n, 4), A)
+                np.testing.assert_array_equal(from_morton_numpy(to_morton_numpy(np.array(A), 4), n, 4), np.array(A))
+                np.testing.assert_array_equal(to_morton_numpy(np.array(A), 4), np.array(to_morton(A, n, 4)))
+
+    def test_recursive_multiply(self):
+        for n in [1, 9, 40]:
+            A, B = generate_matrices(n)
+            expected = np.array(A) @ np.array(B)
+            with self.subTest(n=n):
+                np.testing.assert_array_almost_equal(multiply_recursive(A, B, n, 4), expected, decimal=10)
+                np.testing.assert_array_almost_equal(multiply_recursive_morton(A, B, n, 4), expected, decimal=10)
+                np.testing.assert_array_almost_equal(multiply_recursive_numpy(np.array(A), np.array(B), 4), expected, decimal=10)
+                np.testing.assert_array_almost_equal(multiply_recursive_morton_numpy(np.array(A), np.array(B), 4), expected, decimal=10)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
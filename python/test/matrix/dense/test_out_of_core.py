@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+from python.src.matrix.dense.out_of_core import create_random_memmap, multiply_out_of_core, tile_size_for_budget
+
+
+class TestOutOfCore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_tile_size_for_budget(self):
+        tile = tile_size_for_budget(1, 8)
+        self.assertLessEqual(6 * tile * tile * 8, 1024 * 1024)
+        self.assertGreater(6 * (tile + 1) * (tile + 1) * 8, 1024 * 1024)
+
+    def test_open_memmap(self):
+        A = DenseMatrixNumPy.open(self.path("a.bin"), (4, 4), mode='w+')
+        A.data[:] = np.eye(4)
+        A.data.flush()
+
+        reopened = DenseMatrixNumPy.open(self.path("a.bin"), (4, 4), mode='r')
+        self.assertTrue(reopened.is_memmap())
+        np.testing.assert_array_equal(reopened.data, np.eye(4))
+
+    def test_multiply_matches_in_memory(self):
+        n = 50
+        create_random_memmap(self.path("a.bin"), n, seed=1, chunk_rows=7)
+        create_random_memmap(self.path("b.bin"), n, seed=2, chunk_rows=7)
+        A = DenseMatrixNumPy.open(self.path("a.bin"), (n, n), mode='r')
+        B = DenseMatrixNumPy.open(self.path("b.bin"), (n, n), mode='r')
+
+        expected = np.asarray(A.data) @ np.asarray(B.data)
+
+        for tile in [7, 16, 50]:
+            with self.subTest(tile=tile):
+                C, stats = A.multiply_out_of_core(B, self.path(f"c{tile}.bin"), tile=tile)
+                self.assertTrue(C.is_memmap())
+                self.assertEqual(stats['tile'], tile)
+                np.testing.assert_array_almost_equal(C.data, expected, decimal=10)
+
+    def test_stats(self):
+        A = np.random.rand(20, 30)
+        B = np.random.rand(30, 10)
+        C = np.empty((20, 10))
+
+        stats = multiply_out_of_core(A, B, C, tile=8)
+
+        np.testing.assert_array_almost_equal(C, A @ B, decimal=10)
+        self.assertEqual(stats['tile'], 8)
+        self.assertEqual(stats['bytes_written'], C.nbytes)
+        self.assertGreater(stats['gflops'], 0)
+        self.assertGreater(stats['io_gbps'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,42 @@
+import unittest
+from python.src.matrix.dense.strassen import padded_size, strassen_multiply
+from python.src.matrix.dense.utils import generate_matrices
+
+
+def reference_multiply(A, B):
+    n = len(A)
+    return [[sum(A[i][k] * B[k][j] for k in range(n)) for j in range(n)] for i in range(n)]
+
+
+class TestStrassen(unittest.TestCase):
+
+    def test_padded_size(self):
+        self.assertEqual(padded_size(3, 64), (3, 0))
+        self.assertEqual(padded_size(64, 64), (64, 0))
+        self.assertEqual(padded_size(128, 64), (128, 1))
+        self.assertEqual(padded_size(1100, 64), (1120, 5))
+        self.assertEqual(padded_size(1024, 64), (1024, 4))
+
+    def test_variants_match_reference(self):
+        for n in [1, 5, 16, 23, 40]:
+            A, B = generate_matrices(n)
+            expected = reference_multiply(A, B)
+            for winograd in [False, True]:
+                with self.subTest(n=n, winograd=winograd):
+                    C = strassen_multiply(A, B, n, cutoff=4, winograd=winograd)
+                    for i in range(n):
+                        for j in range(n):
+                            self.assertAlmostEqual(C[i][j], expected[i][j], places=10)
+
+    def test_integer_inputs(self):
+        A = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        B = [[9, 8, 7], [6, 5, 4], [3, 2, 1]]
+        expected = reference_multiply(A, B)
+
+        for winograd in [False, True]:
+            with self.subTest(winograd=winograd):
+                self.assertEqual(strassen_multiply(A, B, 3, cutoff=1, winograd=winograd), expected)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
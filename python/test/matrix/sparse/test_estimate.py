@@ -0,0 +1,76 @@
+import unittest
+from python.src.matrix.sparse.estimate import estimate_rows, row_flops, sampled_ratio
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+
+
+class TestSparseEstimate(unittest.TestCase):
+    
+    def setUp(self):
+        self.A = SparseMatrixCSR.from_dense([[1, 1, 0], [0, 0, 1], [0, 0, 0]])
+        self.B = SparseMatrixCSR.from_dense([[1, 1, 1], [0, 1, 0], [1, 0, 0]])
+    
+    def test_row_flops(self):
+        self.assertEqual(row_flops(self.A.row_ptr, self.A.col_index, self.B.row_ptr, 3), [4, 1, 0])
+    
+    def test_upper_bound(self):
+        estimate = self.A.estimate_multiply(self.B)
+        
+        self.assertEqual(estimate.flops, [4, 1, 0])
+        self.assertEqual(estimate.nnz_upper, [3, 1, 0])
+        self.assertEqual(estimate.nnz, estimate.nnz_upper)
+        self.assertEqual(estimate.sampled_rows, 0)
+    
+    def test_bound_holds(self):
+        for structure in ['uniform', 'power-law', 'banded', 'block-diagonal']:
+            with self.subTest(structure=structure):
+                A = SparseMatrixCSR.structured(structure, 120, 0.9, seed=1)
+                B = SparseMatrixCSR.structured(structure, 120, 0.9, seed=2)
+                C = A.multiply(B)
+                
+                estimate = A.estimate_multiply(B)
+                for i in range(120):
+                    self.assertLessEqual(C.row_ptr[i + 1] - C.row_ptr[i], estimate.nnz_upper[i])
+    
+    def test_sampling(self):
+        A = SparseMatrixCSR.structured('block-diagonal', 200, 0.9, seed=1)
+        B = SparseMatrixCSR.structured('block-diagonal', 200, 0.9, seed=2)
+        C = A.multiply(B)
+        
+        estimate = A.estimate_multiply(B, samples=20, seed=3)
+        
+        self.assertEqual(estimate.sampled_rows, 20)
+        self.assertEqual(estimate, A.estimate_multiply(B, samples=20, seed=3))
+        self.assertLessEqual(sum(estimate.nnz), sum(estimate.nnz_upper))
+        # Block rows repeat the same columns, so sampling gets much closer than the bound.
+        self.assertLess(abs(sum(estimate.nnz) - C.numbers_non_zero()),
+                        abs(sum(estimate.nnz_upper) - C.numbers_non_zero()))
+        for i in range(200):
+            self.assertLessEqual(estimate.nnz[i], estimate.nnz_upper[i])
+    
+    def test_sampled_ratio(self):
+        flops = row_flops(self.A.row_ptr, self.A.col_index, self.B.row_ptr, 3)
+        ratio, exact = sampled_ratio(self.A.row_ptr, self.A.col_index, self.B.row_ptr, self.B.col_index, flops, 10)
+        
+        self.assertEqual(exact, {0: 3, 1: 1})
+        self.assertAlmostEqual(ratio, 4 / 5)
+        self.assertEqual(sampled_ratio(self.A.row_ptr, self.A.col_index, self.B.row_ptr, self.B.col_index, flops, 0), (1.0, {}))
+    
+    def test_estimate_rows_caps_at_width(self):
+        A = SparseMatrixCSR.from_dense([[1, 1, 1], [0, 0, 0]])
+        B = SparseMatrixCSR.from_dense([[1, 1], [1, 1], [0, 1]])
+        
+        estimate = estimate_rows(A.row_ptr, A.col_index, B.row_ptr, B.col_index, 2, 2)
+        self.assertEqual(estimate.flops, [5, 0])
+        self.assertEqual(estimate.nnz_upper, [2, 0])
+        
+        sampled = estimate_rows(A.row_ptr, A.col_index, B.row_ptr, B.col_index, 2, 2, samples=1, seed=0)
+        self.assertEqual(sampled.nnz, [2, 0])
+        self.assertEqual(sampled.sampled_rows, 1)
+    
+    def test_incompatible(self):
+        with self.assertRaises(ValueError):
+            self.A.estimate_multiply(SparseMatrixCSR.from_dense([[1, 2]]))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
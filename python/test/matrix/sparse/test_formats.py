@@ -0,0 +1,215 @@
+import unittest
+import numpy as np
+from python.src.matrix.sparse import formats
+from python.src.matrix.sparse.formulations import INNER, OUTER, ROW_WISE, inner_rows, outer_rows
+from python.src.matrix.sparse.generators import random_csr
+from python.src.matrix.sparse.matrix_coo import SparseMatrixCOO
+from python.src.matrix.sparse.matrix_csc import SparseMatrixCSC
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+
+
+FORMATS = ['csr', 'csc', 'coo']
+
+
+def random_matrix(n_rows, n_cols, sparsity, seed):
+    return SparseMatrixCSR(*random_csr(n_rows, n_cols, sparsity, seed=seed), (n_rows, n_cols))
+
+
+class TestSparseFormats(unittest.TestCase):
+
+    def setUp(self):
+        self.dense = [[1, 0, 2, 0], [0, 0, 3, 0], [4, 5, 0, 6]]
+        self.csr = SparseMatrixCSR.from_dense(self.dense)
+
+    def test_csc_layout(self):
+        A = SparseMatrixCSC.from_csr(self.csr)
+
+        self.assertEqual(A.col_ptr, [0, 2, 3, 5, 6])
+        self.assertEqual(A.row_index, [0, 2, 2, 0, 1, 2])
+        self.assertEqual(A.values, [1, 4, 5, 2, 3, 6])
+        self.assertEqual(A.to_dense(), self.dense)
+
+    def test_coo_layout(self):
+        A = SparseMatrixCOO.from_csr(self.csr)
+
+        self.assertEqual(A.row_index, [0, 0, 1, 2, 2, 2])
+        self.assertEqual(A.col_index, [0, 2, 2, 0, 1, 3])
+        self.assertEqual(A.to_dense(), self.dense)
+
+    def test_round_trips(self):
+        csr = random_matrix(30, 20, 0.8, seed=1)
+
+        for source in FORMATS:
+            for target in FORMATS:
+                with self.subTest(source=source, target=target):
+                    converted = formats.convert(formats.convert(csr, source), target)
+                    self.assertEqual(formats.sparse_format(converted), target)
+                    self.assertEqual(converted.shape, (30, 20))
+                    self.assertEqual(converted.numbers_non_zero(), csr.numbers_non_zero())
+                    self.assertEqual(converted.to_dense(), csr.to_dense())
+
+        back = formats.convert(formats.convert(csr, 'csc'), 'csr')
+        self.assertEqual(back.row_ptr, csr.row_ptr)
+        self.assertEqual(back.col_index, csr.col_index)
+
+    def test_unordered_coo(self):
+        A = SparseMatrixCOO([6, 1, 3, 2], [2, 0, 1, 0], [3, 0, 2, 2], (3, 4))
+
+        csr = A.to_csr()
+        self.assertEqual(csr.row_ptr, [0, 2, 3, 4])
+        self.assertEqual(csr.col_index, [0, 2, 2, 3])
+        self.assertEqual(A.to_csc().col_ptr, [0, 1, 1, 3, 4])
+        self.assertEqual(csr.to_dense(), A.to_dense())
+
+    def test_duplicate_coo_entries_add_up(self):
+        A = SparseMatrixCOO([1.0, 2.0, 4.0], [0, 0, 1], [0, 0, 0], (2, 1))
+        B = SparseMatrixCSR.from_dense([[1.0]])
+
+        self.assertEqual(A.to_dense(), [[3.0], [4.0]])
+        self.assertEqual(A.to_csr().values, [3.0, 4.0])
+        self.assertEqual(A.to_csc().row_index, [0, 1])
+        for formulation in [ROW_WISE, INNER, OUTER]:
+            with self.subTest(formulation=formulation):
+                self.assertEqual(formats.multiply(A, B, formulation=formulation).to_dense(), [[3.0], [4.0]])
+
+        values, col_index, row_ptr = [], [], [0]
+        inner_rows([0, 2], [0, 0], [1.0, 2.0], [0, 1], [0], [1.0], 1, 1, 0, 1, values, col_index, row_ptr)
+        self.assertEqual(values, [3.0])
+
+    def test_random(self):
+        for cls in [SparseMatrixCSC, SparseMatrixCOO]:
+            with self.subTest(cls=cls.__name__):
+                A = cls.random(50, 0.9, seed=2)
+                self.assertEqual(A.shape, (50, 50))
+                self.assertGreater(A.numbers_non_zero(), 0)
+                self.assertAlmostEqual(A.get_sparsity(), 1 - A.numbers_non_zero() / 2500)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            formats.convert([[1]], 'csr')
+        with self.assertRaises(ValueError):
+            formats.convert(self.csr, 'bsr')
+
+
+class TestFormulations(unittest.TestCase):
+
+    def setUp(self):
+        self.A = random_matrix(40, 30, 0.8, seed=1)
+        self.B = random_matrix(30, 50, 0.8, seed=2)
+        self.mask = random_matrix(40, 50, 0.9, seed=3)
+        self.expected = np.array(self.A.to_dense()) @ np.array(self.B.to_dense())
+
+    def test_kernels(self):
+        A_csc, B_csc = SparseMatrixCSC.from_csr(self.A), SparseMatrixCSC.from_csr(self.B)
+
+        values, col_index, row_ptr = [], [], [0]
+        inner_rows(self.A.row_ptr, self.A.col_index, self.A.values, B_csc.col_ptr, B_csc.row_index, B_csc.values, 30, 50,
+                   0, 40, values, col_index, row_ptr)
+        np.testing.assert_array_almost_equal(np.array(SparseMatrixCSR(values, col_index, row_ptr, (40, 50)).to_dense()),
+                                             self.expected, decimal=12)
+
+        for panel_rows in [1, 7, 1024]:
+            with self.subTest(panel_rows=panel_rows):
+                values, col_index, row_ptr = [], [], [0]
+                outer_rows(A_csc.col_ptr, A_csc.row_index, A_csc.values, self.B.row_ptr, self.B.col_index, self.B.values,
+                           30, 40, 50, values, col_index, row_ptr, panel_rows)
+                C = SparseMatrixCSR(values, col_index, row_ptr, (40, 50))
+                expected = self.A.multiply(self.B)
+                self.assertEqual(C.row_ptr, expected.row_ptr)
+                self.assertEqual(C.col_index, expected.col_index)
+                np.testing.assert_array_almost_equal(C.values, expected.values, decimal=12)
+
+    def test_outer_unordered_coo(self):
+        # Reversed entries over several row panels: the CSC rows must come out sorted.
+        csr = random_matrix(2100, 40, 0.5, seed=4)
+        coo = SparseMatrixCOO.from_csr(csr)
+        A = SparseMatrixCOO(coo.values[::-1], coo.row_index[::-1], coo.col_index[::-1], coo.shape)
+        B = random_matrix(40, 40, 0.5, seed=5)
+
+        csc = A.to_csc()
+        for j in range(40):
+            rows = csc.row_index[csc.col_ptr[j]:csc.col_ptr[j + 1]]
+            self.assertEqual(rows, sorted(rows))
+
+        C = formats.multiply(A, B, formulation=OUTER)
+        expected = csr.multiply(B)
+        self.assertEqual(C.row_ptr, expected.row_ptr)
+        self.assertEqual(C.col_index, expected.col_index)
+        np.testing.assert_array_almost_equal(C.values, expected.values, decimal=12)
+
+    def test_formulations_match_dense(self):
+        for a_format in FORMATS:
+            for b_format in FORMATS:
+                A, B = formats.convert(self.A, a_format), formats.convert(self.B, b_format)
+                for formulation in [None, ROW_WISE, INNER, OUTER]:
+                    with self.subTest(a_format=a_format, b_format=b_format, formulation=formulation):
+                        C = formats.multiply(A, B, formulation=formulation)
+                        self.assertIsInstance(C, SparseMatrixCSR)
+                        np.testing.assert_array_almost_equal(np.array(C.to_dense()), self.expected, decimal=12)
+
+    def test_masked(self):
+        expected = self.expected * (np.array(self.mask.to_dense()) != 0)
+
+        for b_format in FORMATS:
+            for formulation in [None, ROW_WISE, INNER]:
+                with self.subTest(b_format=b_format, formulation=formulation):
+                    mask = formats.convert(self.mask, b_format)
+                    C = formats.multiply(self.A, formats.convert(self.B, b_format), mask=mask, formulation=formulation)
+                    np.testing.assert_array_almost_equal(np.array(C.to_dense()), expected, decimal=12)
+
+    def test_methods_accept_any_format(self):
+        for a_format in FORMATS:
+            for b_format in FORMATS:
+                with self.subTest(a_format=a_format, b_format=b_format):
+                    C = formats.convert(self.A, a_format).multiply(formats.convert(self.B, b_format))
+                    np.testing.assert_array_almost_equal(np.array(C.to_dense()), self.expected, decimal=12)
+
+        C = self.A.multiply(SparseMatrixCOO.from_csr(self.B), top_k=2)
+        np.testing.assert_array_equal(C.row_ptr, self.A.multiply(self.B, top_k=2).row_ptr)
+
+    def test_choose_formulation(self):
+        square = formats.choose_formulation(random_matrix(200, 200, 0.99, seed=1), random_matrix(200, 200, 0.99, seed=2))
+        self.assertEqual(square.formulation, ROW_WISE)
+
+        # A sparse mask over a product of many flops: only the masked dots are computed.
+        A = random_matrix(300, 8, 0.5, seed=1)
+        B = SparseMatrixCSC.from_csr(random_matrix(8, 300, 0.5, seed=2))
+        masked = formats.choose_formulation(A, B, random_matrix(300, 300, 0.99, seed=3))
+        self.assertEqual(masked.formulation, INNER)
+        self.assertNotIn(OUTER, masked.costs)
+
+        # Short-fat × tall-skinny: few dots, each a long C-level sum.
+        A = random_matrix(8, 20000, 0.5, seed=1)
+        B = SparseMatrixCSC.from_csr(random_matrix(20000, 8, 0.5, seed=2))
+        self.assertEqual(formats.choose_formulation(A, B).formulation, INNER)
+
+        # A few rows of a CSC matrix with a wide inner dimension: outer skips converting A.
+        A = SparseMatrixCSC.from_csr(random_matrix(10, 5000, 0.99, seed=1))
+        self.assertEqual(formats.choose_formulation(A, random_matrix(5000, 100, 0.99, seed=2)).formulation, OUTER)
+
+        # COO operands pay the same sort to reach either format, so it does not favour outer.
+        A = SparseMatrixCOO.from_csr(random_matrix(2100, 40, 0.5, seed=1))
+        B = SparseMatrixCOO.from_csr(random_matrix(40, 40, 0.5, seed=2))
+        self.assertEqual(formats.choose_formulation(A, B).formulation, ROW_WISE)
+
+    def test_report(self):
+        C, decision = formats.multiply(self.A, SparseMatrixCSC.from_csr(self.B), formulation=INNER, report=True)
+
+        self.assertEqual(decision.formulation, INNER)
+        self.assertEqual(set(decision.costs), {ROW_WISE, INNER, OUTER})
+        self.assertEqual(decision.profile.flops, sum(self.A.estimate_multiply(self.B).flops))
+        self.assertEqual(decision.profile.dots, 40 * 50)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            formats.multiply(self.A, self.A)
+        with self.assertRaises(ValueError):
+            formats.multiply(self.A, self.B, formulation='diagonal')
+        with self.assertRaises(ValueError):
+            formats.multiply(self.A, self.B, mask=self.mask, formulation=OUTER)
+        with self.assertRaises(ValueError):
+            formats.multiply(self.A, self.B, mask=self.B)
+
+
+if __name__ == '__main__':
+    unittest.main()
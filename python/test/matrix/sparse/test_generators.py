@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+from python.src.matrix.sparse.generators import random_csr
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+class TestRandomCSR(unittest.TestCase):
+    
+    def test_structure(self):
+        values, col_index, row_ptr = random_csr(200, 150, 0.9, seed=1)
+        
+        self.assertEqual(len(row_ptr), 201)
+        self.assertEqual(row_ptr[-1], len(values))
+        self.assertEqual(len(col_index), len(values))
+        for i in range(200):
+            row = col_index[row_ptr[i]:row_ptr[i + 1]]
+            self.assertEqual(row, sorted(set(row)))
+            self.assertTrue(all(0 <= j < 150 for j in row))
+    
+    def test_density(self):
+        for sparsity in [0.5, 0.9, 0.99]:
+            with self.subTest(sparsity=sparsity):
+                values, _, _ = random_csr(400, sparsity=sparsity, seed=2)
+                self.assertAlmostEqual(1 - len(values) / 400 ** 2, sparsity, delta=0.01)
+    
+    def test_extremes(self):
+        values, _, row_ptr = random_csr(10, sparsity=0.0, seed=3)
+        self.assertEqual(len(values), 100)
+        self.assertEqual(row_ptr, list(range(0, 101, 10)))
+        
+        values, _, row_ptr = random_csr(10, sparsity=1.0, seed=3)
+        self.assertEqual(values, [])
+        self.assertEqual(row_ptr, [0] * 11)
+        
+        with self.assertRaises(ValueError):
+            random_csr(10, sparsity=1.5)
+    
+    def test_seeded(self):
+        self.assertEqual(random_csr(100, seed=4), random_csr(100, seed=4))
+        self.assertNotEqual(random_csr(100, seed=4), random_csr(100, seed=5))
+    
+    def test_pure_and_scipy_identical(self):
+        for dtype in ['float64', 'int32']:
+            with self.subTest(dtype=dtype):
+                A = SparseMatrixCSR.random(120, 0.9, dtype=dtype, seed=6)
+                B = SparseMatrixSciPy.random(120, 0.9, dtype, seed=6)
+                
+                self.assertEqual(list(B.matrix.indptr), A.row_ptr)
+                self.assertEqual(list(B.matrix.indices), A.col_index)
+                np.testing.assert_array_equal(B.to_dense(), np.array(A.to_dense()))
+    
+    def test_compact(self):
+        A = SparseMatrixCSR.random(80, 0.9, seed=7)
+        C = SparseMatrixCSR.random(80, 0.9, compact=True, seed=7)
+        
+        self.assertTrue(C.is_compact())
+        self.assertEqual(list(C.col_index), A.col_index)
+        self.assertEqual(list(C.row_ptr), A.row_ptr)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
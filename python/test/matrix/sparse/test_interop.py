@@ -0,0 +1,101 @@
+import unittest
+from array import array
+import numpy as np
+from scipy.sparse import csr_matrix
+from python.src.matrix.sparse.interop import as_numpy, as_storage, csr_arrays
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+class TestInterop(unittest.TestCase):
+
+    def test_as_numpy_wraps_buffers(self):
+        storage = array('d', [1.0, 2.0, 3.0])
+        wrapped = as_numpy(storage)
+
+        wrapped[0] = 5.0
+        self.assertEqual(storage[0], 5.0)
+        self.assertEqual(as_numpy(array('i', [1, 2])).dtype, np.int32)
+        self.assertEqual(as_numpy([1, 2], np.int64).dtype, np.int64)
+
+    def test_as_storage(self):
+        values = np.array([1, 2, 3], dtype=np.int64)
+
+        view = as_storage(values)
+        self.assertEqual(view.format, 'q')
+        values[1] = 7
+        self.assertEqual(view.tolist(), [1, 7, 3])
+
+        copy = as_storage(values, copy=True)
+        self.assertIsInstance(copy, array)
+        values[1] = 9
+        self.assertEqual(copy.tolist(), [1, 7, 3])
+
+    def test_from_csr_zero_copy(self):
+        csr = SparseMatrixCSR.random(60, 0.9, compact=True, seed=1)
+
+        scipy = SparseMatrixSciPy.from_csr(csr)
+
+        for storage, wrapped in zip((csr.values, csr.col_index, csr.row_ptr), csr_arrays(csr)):
+            self.assertTrue(np.shares_memory(as_numpy(storage), wrapped))
+        self.assertTrue(np.shares_memory(scipy.matrix.data, as_numpy(csr.values)))
+        self.assertTrue(np.shares_memory(scipy.matrix.indices, as_numpy(csr.col_index)))
+        np.testing.assert_array_equal(scipy.to_dense(), np.array(csr.to_dense()))
+
+        copied = SparseMatrixSciPy.from_csr(csr, copy=True)
+        self.assertFalse(np.shares_memory(copied.matrix.data, as_numpy(csr.values)))
+
+    def test_from_csr_lists_and_dtypes(self):
+        csr = SparseMatrixCSR.random(40, 0.8, seed=2)
+
+        np.testing.assert_array_equal(SparseMatrixSciPy.from_csr(csr).to_dense(), np.array(csr.to_dense()))
+        self.assertEqual(SparseMatrixSciPy.from_csr(csr, 'float32').dtype, np.float32)
+        self.assertEqual(SparseMatrixSciPy.from_csr(csr.to_compact('float32')).dtype, np.float32)
+
+    def test_to_csr_pure_zero_copy(self):
+        for dtype in [np.float64, np.float32, np.int64]:
+            with self.subTest(dtype=dtype):
+                scipy = SparseMatrixSciPy.random(50, 0.9, dtype, seed=3)
+
+                csr = scipy.to_csr_pure()
+                self.assertTrue(csr.is_compact())
+                self.assertEqual(csr.dtype, np.dtype(dtype).name)
+                self.assertTrue(np.shares_memory(as_numpy(csr.values), scipy.matrix.data))
+                np.testing.assert_array_equal(np.array(csr.to_dense()), scipy.to_dense())
+
+                copied = scipy.to_csr_pure(copy=True)
+                self.assertIsInstance(copied.values, array)
+                self.assertFalse(np.shares_memory(as_numpy(copied.values), scipy.matrix.data))
+
+    def test_memoryview_storage_kernels(self):
+        A = SparseMatrixSciPy.random(40, 0.85, seed=4)
+        B = SparseMatrixSciPy.random(40, 0.85, seed=5)
+        expected = A.to_dense() @ B.to_dense()
+        A_pure, B_pure = A.to_csr_pure(), B.to_csr_pure()
+
+        for result in [A_pure.multiply(B_pure), A_pure.multiply_planned(B_pure), A_pure.to_compact().multiply(B_pure)]:
+            self.assertIsInstance(result.values, array)
+            np.testing.assert_array_almost_equal(np.array(result.to_dense()), expected, decimal=12)
+
+        np.testing.assert_array_almost_equal(A_pure.matvec([1.0] * 40), A.to_dense().sum(axis=1), decimal=12)
+
+    def test_unsorted_indices(self):
+        matrix = csr_matrix((np.array([1.0, 2.0]), np.array([2, 0], dtype=np.int32), np.array([0, 2, 2], dtype=np.int32)), shape=(2, 3))
+        matrix.has_sorted_indices = False
+
+        csr = SparseMatrixSciPy(matrix).to_csr_pure()
+
+        self.assertEqual(csr.col_index.tolist(), [0, 2])
+        self.assertEqual(csr.to_dense(), [[2.0, 0, 1.0], [0, 0, 0]])
+
+    def test_shared_storage_cannot_resize(self):
+        csr = SparseMatrixCSR.random(20, 0.8, compact=True, seed=6)
+        scipy = SparseMatrixSciPy.from_csr(csr)
+
+        with self.assertRaises(BufferError):
+            csr.values.append(1.0)
+        self.assertEqual(scipy.numbers_non_zero(), csr.numbers_non_zero())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import numpy as np
+from python.src.matrix.sparse.matrix_bsr import SparseMatrixBSR, block_columns, block_product, block_rows
+from python.src.matrix.sparse.matrix_bsr_numpy import SparseMatrixBSRNumPy
+from python.src.matrix.sparse.matrix_bsr_scipy import SparseMatrixBSRSciPy
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+BSR_CLASSES = [SparseMatrixBSR, SparseMatrixBSRNumPy, SparseMatrixBSRSciPy]
+
+
+def from_csr(cls, csr, block_size):
+    if cls is SparseMatrixBSR:
+        return cls.from_csr(csr, block_size)
+    return cls.from_csr(SparseMatrixSciPy._from_arrays(csr.values, csr.col_index, csr.row_ptr, csr.shape), block_size)
+
+
+class TestMatrixBSR(unittest.TestCase):
+
+    def test_block_product(self):
+        A, B = [1, 2, 0, 3], [4, 5, 6, 7]
+        
+        self.assertEqual(block_rows(A, 2), [[1, 2], [0, 3]])
+        self.assertEqual(block_columns(B, 2), [[4, 6], [5, 7]])
+        self.assertEqual(block_product(block_rows(A, 2), block_columns(B, 2)), [16, 19, 18, 21])
+
+    def test_from_dense(self):
+        dense = [[1, 2, 0, 0], [0, 3, 0, 0], [0, 0, 0, 0], [4, 0, 0, 5]]
+
+        for cls in BSR_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                A = cls.from_dense(dense, 2)
+                self.assertEqual(A.numbers_blocks(), 3)
+                self.assertEqual(A.numbers_non_zero(), 12)
+                np.testing.assert_array_equal(np.array(A.to_dense()), np.array(dense))
+
+        A = SparseMatrixBSR.from_dense(dense, 2)
+        self.assertEqual(A.block_col_index, [0, 0, 1])
+        self.assertEqual(A.block_row_ptr, [0, 1, 3])
+        self.assertEqual(A.blocks[0], [1, 2, 0, 3])
+
+    def test_csr_round_trip(self):
+        csr = SparseMatrixCSR.random(24, 0.8, seed=1)
+
+        for cls in BSR_CLASSES:
+            for block_size in [1, 3, 4]:
+                with self.subTest(cls=cls.__name__, block_size=block_size):
+                    A = from_csr(cls, csr, block_size)
+                    np.testing.assert_array_equal(np.array(A.to_csr().to_dense()), np.array(csr.to_dense()))
+                    self.assertEqual(A.to_csr().numbers_non_zero(), csr.numbers_non_zero())
+
+    def test_multiply_matches_dense(self):
+        for structure_block in [2, 4]:
+            A_csr = SparseMatrixCSR.random(32, 0.7, seed=2)
+            B_csr = SparseMatrixBSR.random(32, structure_block, 0.7, seed=3).to_csr()
+            expected = np.array(A_csr.to_dense()) @ np.array(B_csr.to_dense())
+
+            for cls in BSR_CLASSES:
+                for block_size in [1, 2, 4, 8]:
+                    with self.subTest(cls=cls.__name__, structure_block=structure_block, block_size=block_size):
+                        result = from_csr(cls, A_csr, block_size).multiply(from_csr(cls, B_csr, block_size))
+                        self.assertEqual(result.shape, (32, 32))
+                        self.assertEqual(result.block_size, block_size)
+                        np.testing.assert_array_almost_equal(np.array(result.to_dense()), expected, decimal=12)
+
+    def test_numpy_batches(self):
+        A = SparseMatrixBSRNumPy.random(64, 4, 0.6, seed=4)
+        B = SparseMatrixBSRNumPy.random(64, 4, 0.6, seed=5)
+
+        expected = A.multiply(B)
+        for batch_products in [1, 7, 50]:
+            with self.subTest(batch_products=batch_products):
+                result = A.multiply(B, batch_products)
+                np.testing.assert_array_equal(result.block_row_ptr, expected.block_row_ptr)
+                np.testing.assert_array_equal(result.block_col_index, expected.block_col_index)
+                np.testing.assert_array_almost_equal(result.blocks, expected.blocks, decimal=12)
+
+    def test_random_is_block_structured(self):
+        for cls in BSR_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                A = cls.random(64, 4, 0.9, seed=6)
+                self.assertEqual(A.to_csr().numbers_non_zero(), A.numbers_non_zero())
+
+        np.testing.assert_array_equal(SparseMatrixBSRNumPy.random(64, 4, 0.9, seed=7).to_dense(),
+                                      np.array(SparseMatrixBSR.random(64, 4, 0.9, seed=7).to_dense()))
+
+    def test_empty_product(self):
+        for cls in BSR_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                A = cls.from_dense([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]], 2)
+                B = cls.from_dense([[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], 2)
+                result = A.multiply(B)
+                self.assertEqual(result.numbers_blocks(), 0)
+                np.testing.assert_array_equal(np.array(result.to_dense()), np.zeros((4, 4)))
+
+    def test_all_zero_csr(self):
+        csr = SparseMatrixCSR.from_dense([[0, 0], [0, 0]])
+
+        for cls in BSR_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                A = cls.from_csr(csr, 2)
+                self.assertEqual(A.numbers_blocks(), 0)
+                np.testing.assert_array_equal(np.array(A.to_dense()), np.zeros((2, 2)))
+
+    def test_errors(self):
+        csr = SparseMatrixCSR.random(6, 0.5, seed=8)
+
+        for cls in BSR_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                with self.assertRaises(ValueError):
+                    from_csr(cls, csr, 4)
+                with self.assertRaises(ValueError):
+                    from_csr(cls, csr, 2).multiply(from_csr(cls, csr, 3))
+                with self.assertRaises(ValueError):
+                    cls.random(8, 2, seed=9).multiply(cls.random(4, 2, seed=9))
+
+
+if __name__ == '__main__':
+    unittest.main()
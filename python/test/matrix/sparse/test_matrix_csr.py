@@ -1,4 +1,5 @@
 import unittest
+from python.src.matrix.dense.matrix import DenseMatrix
 from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
 
 
@@ -42,6 +43,193 @@ class TestSparseMatrixCSR(unittest.TestCase):
         self.assertEqual(C.shape, (50, 50))
         self.assertGreater(C.numbers_non_zero(), 0)
 
+    
+    def test_multiply_matches_dense(self):
+        A = SparseMatrixCSR.random(30, sparsity=0.7)
+        B = SparseMatrixCSR.random(30, sparsity=0.7)
+        
+        C = A.multiply(B).to_dense()
+        A_dense = A.to_dense()
+        B_dense = B.to_dense()
+        
+        for i in range(30):
+            for j in range(30):
+                expected = sum(A_dense[i][k] * B_dense[k][j] for k in range(30))
+                self.assertAlmostEqual(C[i][j], expected, places=10)
+    
+    def test_multiply_sorted_columns(self):
+        A = SparseMatrixCSR.from_dense([[1, 0, 2], [0, 0, 0]])
+        B = SparseMatrixCSR.from_dense([[0, 0, 3, 1], [0, 0, 0, 0], [5, 0, 0, 2]])
+        
+        C = A.multiply(B)
+        
+        self.assertEqual(C.shape, (2, 4))
+        self.assertEqual(C.col_index, [0, 2, 3])
+        self.assertEqual(C.values, [10, 3, 5])
+        self.assertEqual(C.row_ptr, [0, 3, 3])
+    
+    def test_compact_storage(self):
+        A = SparseMatrixCSR.from_dense([[0, 5, 0], [0, 0, 8], [1, 0, 0]], compact=True)
+        B = SparseMatrixCSR.from_dense([[0, 0, 2], [3, 0, 0], [0, 4, 0]], compact=True)
+        
+        self.assertTrue(A.is_compact())
+        self.assertEqual(A.values.typecode, 'd')
+        self.assertEqual(A.col_index.typecode, 'i')
+        
+        C = A.multiply(B)
+        
+        self.assertTrue(C.is_compact())
+        self.assertEqual(list(C.values), [15, 32, 2])
+        self.assertEqual(list(C.col_index), [0, 1, 2])
+        self.assertEqual(list(C.row_ptr), [0, 1, 2, 3])
+        self.assertEqual(C.to_dense(), [[15, 0, 0], [0, 32, 0], [0, 0, 2]])
+    
+    def test_compact_matches_list_storage(self):
+        A = SparseMatrixCSR.random(40, sparsity=0.8)
+        B = SparseMatrixCSR.random(40, sparsity=0.8)
+        
+        C = A.multiply(B)
+        C_compact = A.to_compact().multiply(B.to_compact())
+        
+        self.assertEqual(list(C_compact.col_index), C.col_index)
+        self.assertEqual(list(C_compact.row_ptr), C.row_ptr)
+        for value, expected in zip(C_compact.values, C.values):
+            self.assertAlmostEqual(value, expected, places=10)
+    
+    def test_random_compact(self):
+        A = SparseMatrixCSR.random(100, sparsity=0.9, compact=True)
+        
+        self.assertTrue(A.is_compact())
+        self.assertEqual(len(A.row_ptr), 101)
+        self.assertGreater(A.get_sparsity(), 0.8)
+    
+    def test_compact_dtype(self):
+        A = SparseMatrixCSR.from_dense([[0, 5, 0], [0, 0, 8], [1, 0, 0]], compact=True, dtype='int32')
+        B = SparseMatrixCSR.from_dense([[0, 0, 2], [3, 0, 0], [0, 4, 0]], compact=True, dtype='int32')
+        
+        C = A.multiply(B)
+        
+        self.assertEqual(C.values.typecode, 'i')
+        self.assertEqual(C.dtype, 'int32')
+        self.assertEqual(C.to_dense(), [[15, 0, 0], [0, 32, 0], [0, 0, 2]])
+    
+    def test_compact_int32_overflow(self):
+        A = SparseMatrixCSR.from_dense([[50000, 0], [0, 1]]).to_compact('int32')
+        
+        for product in [A.multiply, A.multiply_planned, A.multiply_transpose, lambda _: A.gram()]:
+            with self.assertRaises(ValueError):
+                product(A)
+        self.assertEqual(A.to_compact('int64').multiply(A.to_compact('int64')).to_dense(), [[2500000000, 0], [0, 1]])
+    
+    def test_random_float32(self):
+        A = SparseMatrixCSR.random(50, sparsity=0.9, compact=True, dtype='float32')
+        
+        self.assertEqual(A.values.typecode, 'f')
+        self.assertEqual(A.dtype, 'float32')
+    
+    def test_matvec(self):
+        A = SparseMatrixCSR.from_dense([[0, 5, 0], [0, 0, 8], [1, 0, 2]])
+        
+        self.assertEqual(A.matvec([1, 2, 3]), [10, 24, 7])
+        self.assertEqual(A.to_compact().matvec([1, 2, 3]), [10, 24, 7])
+        with self.assertRaises(ValueError):
+            A.matvec([1, 2])
+    
+    def test_multiply_dense(self):
+        A = SparseMatrixCSR.random(40, sparsity=0.8, seed=1)
+        dense = A.to_dense()
+        
+        for n_cols in [1, 3, 20]:
+            with self.subTest(n_cols=n_cols):
+                B = DenseMatrix([[i + j for j in range(n_cols)] for i in range(40)])
+                C = A.multiply_dense(B)
+                
+                self.assertEqual(C.shape, (40, n_cols))
+                for i in range(40):
+                    for j in range(n_cols):
+                        expected = sum(dense[i][k] * B.data[k][j] for k in range(40))
+                        self.assertAlmostEqual(C.data[i][j], expected, places=9)
+        
+        with self.assertRaises(ValueError):
+            A.multiply_dense(DenseMatrix([[1, 2]]))
+    
+    def test_gram(self):
+        A = SparseMatrixCSR.from_dense([[1, 0, 2], [0, 3, 0], [4, 0, 5], [0, 0, 0]])
+        
+        self.assertEqual(A.gram().to_dense(), [[5, 0, 14, 0], [0, 9, 0, 0], [14, 0, 41, 0], [0, 0, 0, 0]])
+        self.assertEqual(A.gram(upper=True).to_dense(), [[5, 0, 14, 0], [0, 9, 0, 0], [0, 0, 41, 0], [0, 0, 0, 0]])
+        self.assertEqual(A.gram(upper=True).numbers_non_zero(), 4)
+    
+    def test_gram_matches_multiply(self):
+        A = SparseMatrixCSR.random(50, sparsity=0.85, seed=2)
+        A_T = SparseMatrixCSR.from_dense([list(column) for column in zip(*A.to_dense())])
+        expected = A.multiply(A_T)
+        
+        for compact in [False, True]:
+            with self.subTest(compact=compact):
+                matrix = A.to_compact() if compact else A
+                G = matrix.gram()
+                
+                self.assertEqual(G.is_compact(), compact)
+                self.assertEqual(list(G.row_ptr), list(expected.row_ptr))
+                self.assertEqual(list(G.col_index), list(expected.col_index))
+                for value, expected_value in zip(G.values, expected.values):
+                    self.assertAlmostEqual(value, expected_value, places=9)
+                
+                U = matrix.gram(upper=True)
+                for i in range(50):
+                    self.assertTrue(all(j >= i for j in U.col_index[U.row_ptr[i]:U.row_ptr[i + 1]]))
+    
+    def test_multiply_transpose(self):
+        A = SparseMatrixCSR.from_dense([[1, 0, 2], [0, 3, 0]])
+        B = SparseMatrixCSR.from_dense([[0, 1, 1], [2, 0, 0], [0, 0, 3]])
+        
+        self.assertEqual(A.multiply_transpose(B).to_dense(), [[2, 2, 6], [3, 0, 0]])
+        self.assertEqual(A.multiply_transpose(A).to_dense(), A.gram().to_dense())
+        with self.assertRaises(ValueError):
+            A.multiply_transpose(SparseMatrixCSR.from_dense([[1, 2]]))
+    
+    def test_multiply_masked(self):
+        A = SparseMatrixCSR.from_dense([[1, 2, 0], [0, 1, 3], [4, 0, 1]])
+        B = SparseMatrixCSR.from_dense([[1, 0, 2], [0, 3, 1], [5, 0, 1]])
+        mask = SparseMatrixCSR.from_dense([[1, 0, 1], [0, 0, 0], [0, 1, 1]])
+        # Full product: [[1, 6, 4], [15, 3, 4], [9, 0, 9]]
+        
+        self.assertEqual(A.multiply(B, mask=mask).to_dense(), [[1, 0, 4], [0, 0, 0], [0, 0, 9]])
+        self.assertEqual(A.multiply(B, mask=mask, complement=True).to_dense(), [[0, 6, 0], [15, 3, 4], [9, 0, 0]])
+        self.assertEqual(A.multiply(B, threshold=5).to_dense(), [[0, 6, 0], [15, 0, 0], [9, 0, 9]])
+        self.assertEqual(A.multiply(B, top_k=1).to_dense(), [[0, 6, 0], [15, 0, 0], [9, 0, 0]])
+        self.assertEqual(A.multiply(B, mask=mask, complement=True, top_k=2).to_dense(), [[0, 6, 0], [15, 0, 4], [9, 0, 0]])
+    
+    def test_multiply_masked_matches_filtered_product(self):
+        A = SparseMatrixCSR.random(40, sparsity=0.85, seed=5)
+        B = SparseMatrixCSR.random(40, sparsity=0.85, seed=6)
+        mask = SparseMatrixCSR.random(40, sparsity=0.7, seed=7)
+        full = A.multiply(B).to_dense()
+        in_mask = mask.to_dense()
+        
+        for complement in [False, True]:
+            with self.subTest(complement=complement):
+                C = A.multiply(B, mask=mask, complement=complement, threshold=0.5)
+                expected = [[value if (in_mask[i][j] != 0) != complement and abs(value) >= 0.5 else 0
+                             for j, value in enumerate(row)] for i, row in enumerate(full)]
+                
+                for row, expected_row in zip(C.to_dense(), expected):
+                    for value, expected_value in zip(row, expected_row):
+                        self.assertAlmostEqual(value, expected_value, places=9)
+                for i in range(40):
+                    columns = list(C.col_index[C.row_ptr[i]:C.row_ptr[i + 1]])
+                    self.assertEqual(columns, sorted(columns))
+    
+    def test_multiply_masked_invalid(self):
+        A = SparseMatrixCSR.random(5, sparsity=0.5, seed=1)
+        
+        with self.assertRaises(ValueError):
+            A.multiply(A, mask=SparseMatrixCSR.random(4, sparsity=0.5, seed=1))
+        with self.assertRaises(ValueError):
+            A.multiply(A, complement=True)
+        with self.assertRaises(ValueError):
+            A.multiply(A, top_k=0)
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
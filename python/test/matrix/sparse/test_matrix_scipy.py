@@ -1,5 +1,7 @@
 import unittest
 import numpy as np
+from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+from python.src.matrix.sparse.masked_scipy import multiply_filtered
 from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
 
 
@@ -57,6 +59,90 @@ class TestSparseMatrixSciPy(unittest.TestCase):
         self.assertEqual(C.shape, (50, 50))
         self.assertGreater(C.numbers_non_zero(), 0)
 
+    
+    def test_random_dtype(self):
+        for dtype in [np.float64, np.float32, np.int64]:
+            with self.subTest(dtype=dtype):
+                A = SparseMatrixSciPy.random(50, 0.9, dtype)
+                B = SparseMatrixSciPy.random(50, 0.9, dtype)
+                
+                self.assertEqual(A.dtype, dtype)
+                self.assertEqual(A.multiply(B).dtype, dtype)
+    
+    def test_matvec(self):
+        A = SparseMatrixSciPy.from_dense([[0, 5, 0], [0, 0, 8], [1, 0, 2]])
+        
+        np.testing.assert_array_equal(A.matvec([1, 2, 3]), [10, 24, 7])
+        with self.assertRaises(ValueError):
+            A.matvec([1, 2])
+    
+    def test_multiply_dense(self):
+        A = SparseMatrixSciPy.random(40, 0.8, seed=1)
+        B = DenseMatrixNumPy(np.random.rand(40, 7))
+        
+        C = A.multiply_dense(B)
+        
+        self.assertIsInstance(C, DenseMatrixNumPy)
+        np.testing.assert_array_almost_equal(C.data, A.to_dense() @ B.data, decimal=12)
+    
+    def test_gram(self):
+        A = SparseMatrixSciPy.random(60, 0.9, seed=2)
+        expected = A.to_dense() @ A.to_dense().T
+        
+        np.testing.assert_array_almost_equal(A.gram().to_dense(), expected, decimal=12)
+        upper = A.gram(upper=True)
+        np.testing.assert_array_almost_equal(upper.to_dense(), np.triu(expected), decimal=12)
+        self.assertEqual(upper.numbers_non_zero(), np.count_nonzero(np.triu(A.gram().to_dense())))
+    
+    def test_multiply_transpose(self):
+        A = SparseMatrixSciPy.random(30, 0.8, seed=3)
+        B = SparseMatrixSciPy.from_dense(np.random.rand(20, 30))
+        
+        np.testing.assert_array_almost_equal(A.multiply_transpose(B).to_dense(), A.to_dense() @ B.to_dense().T, decimal=12)
+        with self.assertRaises(ValueError):
+            A.multiply_transpose(SparseMatrixSciPy.random(20, 0.8, seed=4))
+    
+    def test_multiply_masked(self):
+        A = SparseMatrixSciPy.random(60, 0.85, seed=5)
+        B = SparseMatrixSciPy.random(60, 0.85, seed=6)
+        mask = SparseMatrixSciPy.random(60, 0.7, seed=7)
+        full = A.to_dense() @ B.to_dense()
+        in_mask = mask.to_dense() != 0
+        
+        expected = {
+            'mask': (dict(mask=mask), np.where(in_mask, full, 0)),
+            'complement': (dict(mask=mask, complement=True), np.where(in_mask, 0, full)),
+            'threshold': (dict(threshold=1.0), np.where(np.abs(full) >= 1.0, full, 0)),
+        }
+        for name, (filters, expected_dense) in expected.items():
+            with self.subTest(filters=name):
+                C = A.multiply(B, **filters)
+                
+                np.testing.assert_array_almost_equal(C.to_dense(), expected_dense, decimal=12)
+                self.assertTrue(C.matrix.has_sorted_indices)
+    
+    def test_multiply_top_k(self):
+        A = SparseMatrixSciPy.from_dense(np.array([[1, 2, 0], [0, 1, 3], [4, 0, 1]]))
+        B = SparseMatrixSciPy.from_dense(np.array([[1, 0, 2], [0, 3, 1], [5, 0, 1]]))
+        mask = SparseMatrixSciPy.from_dense(np.array([[1, 0, 1], [0, 0, 0], [0, 1, 1]]))
+        
+        np.testing.assert_array_equal(A.multiply(B, top_k=1).to_dense(), [[0, 6, 0], [15, 0, 0], [9, 0, 0]])
+        np.testing.assert_array_equal(A.multiply(B, mask=mask, complement=True, top_k=2).to_dense(),
+                                      [[0, 6, 0], [15, 0, 4], [9, 0, 0]])
+    
+    def test_multiply_filtered_panels(self):
+        # Small panels must give the same result as a single panel.
+        A = SparseMatrixSciPy.random(50, 0.8, seed=8)
+        mask = SparseMatrixSciPy.random(50, 0.8, seed=9)
+        expected = A.multiply(A, mask=mask, top_k=3).matrix
+        
+        C = multiply_filtered(A.matrix, A.matrix, mask.matrix, top_k=3, panel_flops=40)
+        
+        np.testing.assert_array_equal(C.indptr, expected.indptr)
+        np.testing.assert_array_equal(C.indices, expected.indices)
+        np.testing.assert_array_almost_equal(C.data, expected.data, decimal=12)
+        with self.assertRaises(ValueError):
+            A.multiply(A, mask=SparseMatrixSciPy.random(40, 0.8, seed=1))
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,146 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from scipy.io import mmread, mmwrite
+from scipy.sparse import coo_matrix, csr_matrix
+from python.src.matrix.sparse import mmio
+
+
+class TestMatrixMarket(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'matrix.mtx')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, matrix, **kwargs):
+        mmwrite(self.path, matrix, **kwargs)
+        return csr_matrix(mmread(self.path))
+
+    def write_text(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def assert_matches(self, loaded, expected):
+        self.assertTrue(loaded.matrix.has_sorted_indices)
+        self.assertEqual(loaded.shape, expected.shape)
+        np.testing.assert_array_equal(loaded.to_dense(), expected.toarray())
+
+    def test_fields_and_symmetries(self):
+        rng = np.random.default_rng(0)
+        lower = coo_matrix(np.tril(rng.random((30, 30)) * (rng.random((30, 30)) > 0.8)))
+        strictly_lower = coo_matrix(np.tril(lower.toarray(), -1))
+        integers = coo_matrix(rng.integers(-5, 5, (25, 35)) * (rng.random((25, 35)) > 0.8))
+        cases = {
+            'general': (coo_matrix(rng.random((40, 25)) * (rng.random((40, 25)) > 0.9)), {}),
+            'symmetric': (lower + lower.T - coo_matrix(np.diag(lower.diagonal())), {'symmetry': 'symmetric'}),
+            'skew-symmetric': (strictly_lower - strictly_lower.T, {'symmetry': 'skew-symmetric'}),
+            'integer': (integers, {'field': 'integer'}),
+            'pattern': (integers, {'field': 'pattern'}),
+        }
+
+        for name, (matrix, kwargs) in cases.items():
+            with self.subTest(case=name):
+                expected = self.write(matrix, **kwargs)
+                self.assertEqual(mmio.read_header(self.path).symmetry, kwargs.get('symmetry', 'general'))
+                for cache in [False, True]:
+                    for in_memory_bytes in [0, mmio.IN_MEMORY_BYTES]:
+                        loaded = mmio.load_scipy(self.path, cache=cache, chunk_bytes=64, in_memory_bytes=in_memory_bytes)
+                        self.assert_matches(loaded, expected)
+                        self.assertEqual(loaded.dtype, mmio.FIELD_DTYPES[mmio.read_header(self.path).field])
+
+        self.assertEqual(mmio.load_scipy(self.path, cache=False).dtype, np.float64)
+
+    def test_unsorted_rows(self):
+        self.write_text("%%MatrixMarket matrix coordinate real general\n% comment\n2 3 3\n"
+                        "1 3 1.0\n2 2 5.0\n1 1 2.0\n")
+
+        for in_memory_bytes in [0, mmio.IN_MEMORY_BYTES]:
+            with self.subTest(in_memory_bytes=in_memory_bytes):
+                data, indices, indptr, shape = mmio.read_csr_arrays(self.path, in_memory_bytes=in_memory_bytes)
+
+                self.assertEqual(shape, (2, 3))
+                self.assertEqual(indptr.tolist(), [0, 2, 3])
+                self.assertEqual(indices.tolist(), [0, 2, 1])
+                self.assertEqual(data.tolist(), [2.0, 1.0, 5.0])
+                self.assertEqual(indices.dtype, np.int32)
+
+    def test_duplicates_kept(self):
+        self.write_text("%%MatrixMarket matrix coordinate real general\n2 2 3\n1 1 1.0\n2 2 4.0\n1 1 2.0\n")
+
+        for in_memory_bytes in [0, mmio.IN_MEMORY_BYTES]:
+            with self.subTest(in_memory_bytes=in_memory_bytes):
+                data, indices, indptr, _ = mmio.read_csr_arrays(self.path, in_memory_bytes=in_memory_bytes)
+                self.assertEqual(indptr.tolist(), [0, 2, 3])
+                self.assertEqual(sorted(data[:2].tolist()), [1.0, 2.0])
+
+    def test_empty_rows_and_matrix(self):
+        self.write_text("%%MatrixMarket matrix coordinate real general\n4 4 1\n3 2 7.5\n")
+        self.assertEqual(mmio.load_scipy(self.path).to_dense()[2, 1], 7.5)
+
+        self.write_text("%%MatrixMarket matrix coordinate real general\n3 3 0\n")
+        self.assertEqual(mmio.load_scipy(self.path).numbers_non_zero(), 0)
+        self.assertEqual(mmio.load_scipy(self.path, cache=False, in_memory_bytes=0).numbers_non_zero(), 0)
+        self.assertEqual(mmio.load_scipy(self.path).numbers_non_zero(), 0)
+
+    def test_cache_reuse_and_invalidation(self):
+        rng = np.random.default_rng(1)
+        first = self.write(coo_matrix(rng.random((50, 50)) * (rng.random((50, 50)) > 0.9)))
+        directory = mmio.cache_directory(self.path)
+
+        self.assert_matches(mmio.load_scipy(self.path), first)
+        self.assertTrue(os.path.exists(os.path.join(directory, 'meta.json')))
+
+        cached = mmio.load_arrays(self.path)
+        for values in cached[:3]:
+            self.assertIsInstance(values, np.memmap)
+            self.assertFalse(values.flags.writeable)
+
+        second = self.write(coo_matrix(rng.random((50, 50)) * (rng.random((50, 50)) > 0.9)))
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNone(mmio.read_csr_cache(directory, mmio._source_stamp(self.path)))
+        self.assert_matches(mmio.load_scipy(self.path), second)
+        self.assertIsNotNone(mmio.read_csr_cache(directory, mmio._source_stamp(self.path)))
+
+    def test_incomplete_cache_is_ignored(self):
+        self.write(coo_matrix(np.eye(5)))
+        directory = mmio.cache_directory(self.path)
+        mmio.load_scipy(self.path)
+        stamp = mmio._source_stamp(self.path)
+
+        with open(os.path.join(directory, 'data.bin'), 'ab') as f:
+            f.write(b'\0')
+        self.assertIsNone(mmio.read_csr_cache(directory, stamp))
+
+        os.remove(os.path.join(directory, 'meta.json'))
+        self.assertIsNone(mmio.read_csr_cache(directory, stamp))
+        np.testing.assert_array_equal(mmio.load_scipy(self.path).to_dense(), np.eye(5))
+
+    def test_load_csr(self):
+        rng = np.random.default_rng(2)
+        expected = self.write(coo_matrix(rng.random((30, 20)) * (rng.random((30, 20)) > 0.85)))
+
+        csr = mmio.load_csr(self.path)
+
+        self.assertTrue(csr.is_compact())
+        self.assertEqual(csr.dtype, 'float64')
+        self.assertEqual(csr.shape, (30, 20))
+        np.testing.assert_array_equal(np.array(csr.to_dense()), expected.toarray())
+
+    def test_header_errors(self):
+        for text in ["not a matrix market file\n",
+                     "%%MatrixMarket matrix array real general\n2 2\n1\n2\n3\n4\n",
+                     "%%MatrixMarket matrix coordinate complex general\n1 1 1\n1 1 1 0\n",
+                     "%%MatrixMarket matrix coordinate real hermitian\n1 1 1\n1 1 1\n"]:
+            with self.subTest(text=text.splitlines()[0]):
+                self.write_text(text)
+                with self.assertRaises(ValueError):
+                    mmio.load_scipy(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
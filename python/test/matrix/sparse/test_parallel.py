@@ -0,0 +1,55 @@
+import unittest
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.parallel import balanced_row_chunks, row_flops
+
+
+class TestSparseParallel(unittest.TestCase):
+    
+    def test_row_flops(self):
+        A = SparseMatrixCSR.from_dense([[1, 1, 0], [0, 0, 1], [0, 0, 0]])
+        B = SparseMatrixCSR.from_dense([[1, 1, 1], [0, 1, 0], [1, 0, 0]])
+        
+        self.assertEqual(row_flops(A.row_ptr, A.col_index, B.row_ptr, 3), [4, 1, 0])
+    
+    def test_balanced_row_chunks(self):
+        flops = [100] + [1] * 99
+        chunks = balanced_row_chunks(flops, 4)
+        
+        self.assertEqual(chunks[0], (0, 1))
+        self.assertEqual(chunks[-1][1], 100)
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+        
+        self.assertEqual(balanced_row_chunks([], 4), [])
+        self.assertEqual(balanced_row_chunks([5, 5], 8), [(0, 1), (1, 2)])
+    
+    def test_matches_sequential(self):
+        for structure in ['uniform', 'power-law', 'banded']:
+            with self.subTest(structure=structure):
+                A = SparseMatrixCSR.structured(structure, 80, 0.9, seed=1)
+                B = SparseMatrixCSR.structured(structure, 80, 0.9, seed=2)
+                
+                expected = A.multiply(B)
+                result = A.multiply_parallel(B, workers=2, chunks=5)
+                
+                self.assertEqual(result.row_ptr, expected.row_ptr)
+                self.assertEqual(result.col_index, expected.col_index)
+                self.assertEqual(result.values, expected.values)
+    
+    def test_compact_and_integer(self):
+        A = SparseMatrixCSR.random(40, 0.8, compact=True, dtype='int32', seed=3)
+        B = SparseMatrixCSR.random(40, 0.8, compact=True, dtype='int32', seed=4)
+        
+        result = A.multiply_parallel(B, workers=2)
+        
+        self.assertEqual(result.values.typecode, 'i')
+        self.assertEqual(result.to_dense(), A.multiply(B).to_dense())
+    
+    def test_incompatible_dimensions(self):
+        A = SparseMatrixCSR.random(4, 0.5, seed=5)
+        with self.assertRaises(ValueError):
+            A.multiply_parallel(SparseMatrixCSR.from_dense([[1, 2]]))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+from python.src.matrix.sparse.parallel_scipy import row_chunks, stitch
+
+
+class TestSciPyParallel(unittest.TestCase):
+    
+    def test_matches_matmul(self):
+        for structure in ['uniform', 'power-law', 'stencil-2d']:
+            with self.subTest(structure=structure):
+                A = SparseMatrixSciPy.structured(structure, 300, 0.95, seed=1)
+                B = SparseMatrixSciPy.structured(structure, 300, 0.95, seed=2)
+                
+                expected = A.multiply(B).to_dense()
+                for chunk_rows in [None, 7, 300]:
+                    result = A.multiply_parallel(B, workers=2, chunk_rows=chunk_rows)
+                    np.testing.assert_array_almost_equal(result.to_dense(), expected, decimal=12)
+    
+    def test_transposed_operand(self):
+        A = SparseMatrixSciPy.random(60, 0.9, seed=3)
+        A_T = SparseMatrixSciPy(A.matrix.T)
+        
+        result = A.multiply_parallel(A_T, workers=2)
+        
+        np.testing.assert_array_almost_equal(result.to_dense(), A.to_dense() @ A.to_dense().T, decimal=12)
+    
+    def test_row_chunks(self):
+        A = SparseMatrixSciPy.structured('power-law', 200, 0.9, seed=4).matrix
+        
+        for chunk_rows in [None, 16]:
+            chunks = row_chunks(A, A, 2, chunk_rows)
+            self.assertEqual(chunks[0][0], 0)
+            self.assertEqual(chunks[-1][1], 200)
+            for (_, end), (start, _) in zip(chunks, chunks[1:]):
+                self.assertEqual(end, start)
+        
+        self.assertEqual(len(row_chunks(A, A, 2, 16)), 13)
+    
+    def test_stitch_offsets(self):
+        A = SparseMatrixSciPy.from_dense([[1, 0], [0, 2], [3, 4]]).matrix
+        panels = [(p.data, p.indices, p.indptr) for p in (A[0:1], A[1:3])]
+        
+        result = stitch(panels, (3, 2))
+        
+        self.assertEqual(list(result.indptr), [0, 1, 2, 4])
+        np.testing.assert_array_equal(result.toarray(), A.toarray())
+    
+    def test_stitch_wide_columns(self):
+        # Few entries, but a column index past the int32 range.
+        wide = 2 ** 31 + 5
+        panels = [(np.array([1.0]), np.array([wide - 1], dtype=np.int64), np.array([0, 1], dtype=np.int64))]
+        
+        result = stitch(panels, (1, wide))
+        
+        self.assertEqual(result.indices.dtype, np.int64)
+        self.assertEqual(result.indices[0], wide - 1)
+    
+    def test_incompatible_dimensions(self):
+        with self.assertRaises(ValueError):
+            SparseMatrixSciPy.random(4, 0.5).multiply_parallel(SparseMatrixSciPy.from_dense([[1, 2]]))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from scipy.sparse import random as sparse_random
+from python.src.matrix.sparse import out_of_core
+from python.src.matrix.sparse.interop import as_numpy
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+from python.src.matrix.sparse.mmio import open_scipy
+
+
+class TestSparseOutOfCore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "C")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_panel_rows(self):
+        self.assertEqual(out_of_core.panel_rows(np.array([3, 3, 3, 3]), 6), [(0, 2), (2, 4)])
+        self.assertEqual(out_of_core.panel_rows(np.array([10, 1, 1, 10]), 5), [(0, 1), (1, 3), (3, 4)])
+        self.assertEqual(out_of_core.panel_rows(np.array([1, 1]), 0), [(0, 1), (1, 2)])
+        self.assertEqual(out_of_core.panel_rows(np.array([], dtype=np.int64), 10), [])
+
+    def test_matches_in_memory_for_any_budget(self):
+        A = sparse_random(300, 200, density=0.02, format='csr', random_state=1)
+        B = sparse_random(200, 250, density=0.02, format='csr', random_state=2)
+        expected = (A @ B).toarray()
+
+        panels = []
+        for budget_mb in [0.001, 0.05, 256]:
+            with self.subTest(budget_mb=budget_mb):
+                stats = out_of_core.multiply_out_of_core(A, B, self.directory, budget_mb)
+                result = open_scipy(self.directory)
+
+                self.assertFalse(result.matrix.data.flags.writeable)
+                self.assertTrue(result.matrix.has_sorted_indices)
+                self.assertEqual(stats['nnz'], result.numbers_non_zero())
+                np.testing.assert_array_almost_equal(result.to_dense(), expected, decimal=12)
+                panels.append(stats['panels'])
+
+        self.assertEqual(panels[-1], 1)
+        self.assertGreater(panels[0], panels[1])
+
+    def test_multiply_wrappers(self):
+        A = SparseMatrixSciPy.random(120, 0.95, seed=3)
+        B = SparseMatrixSciPy.random(120, 0.95, seed=4)
+        expected = A.to_dense() @ B.to_dense()
+
+        result = out_of_core.multiply(A, B, self.directory, memory_budget_mb=0.01)
+        np.testing.assert_array_almost_equal(result.to_dense(), expected, decimal=12)
+
+        result = out_of_core.multiply(A.to_csr_pure(), B.to_csr_pure(), self.directory, memory_budget_mb=0.01)
+        pure = result.to_csr_pure()
+        self.assertIsInstance(pure, SparseMatrixCSR)
+        self.assertTrue(np.shares_memory(as_numpy(pure.values), result.matrix.data))
+        np.testing.assert_array_almost_equal(np.array(pure.to_dense()), expected, decimal=12)
+
+    def test_empty_product(self):
+        A = SparseMatrixSciPy.from_dense(np.zeros((4, 3)))
+        B = SparseMatrixSciPy.from_dense(np.ones((3, 5)))
+
+        result = out_of_core.multiply(A, B, self.directory)
+
+        self.assertEqual(result.shape, (4, 5))
+        self.assertEqual(result.numbers_non_zero(), 0)
+
+    def test_incompatible_dimensions(self):
+        A = SparseMatrixSciPy.random(4, 0.5, seed=5)
+        B = SparseMatrixSciPy.from_dense(np.ones((3, 3)))
+
+        with self.assertRaises(ValueError):
+            out_of_core.multiply(A, B, self.directory)
+
+    def test_narrow_index_file(self):
+        path = os.path.join(self.tmp.name, "indices.bin")
+        np.arange(10, dtype=np.int64).tofile(path)
+
+        out_of_core._narrow_index_file(path)
+
+        np.testing.assert_array_equal(np.fromfile(path, dtype=np.int32), np.arange(10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse import spgemm
+from python.src.matrix.sparse.spgemm import (DENSE_ARRAY, HASH, MERGE, ROW_KERNELS, SORTED_ARRAY, PlanCache, SpGEMMPlan,
+                                             adaptive_rows, choose_accumulators, gustavson_rows, rows_sorted,
+                                             symbolic_multiply)
+
+
+class TestSpGEMMPlan(unittest.TestCase):
+    
+    def setUp(self):
+        self.A = SparseMatrixCSR.from_dense([[0, 5, 0], [0, 0, 8], [1, 0, 2]])
+        self.B = SparseMatrixCSR.from_dense([[0, 0, 2], [3, 0, 0], [0, 4, 0]])
+    
+    def test_symbolic(self):
+        row_ptr, col_index = symbolic_multiply(self.A.row_ptr, self.A.col_index, self.B.row_ptr, self.B.col_index, 3)
+        
+        self.assertEqual(row_ptr, [0, 1, 2, 4])
+        self.assertEqual(col_index, [0, 1, 1, 2])
+    
+    def test_execute_matches_multiply(self):
+        A = SparseMatrixCSR.random(60, sparsity=0.85)
+        B = SparseMatrixCSR.random(60, sparsity=0.85)
+        
+        expected = A.multiply(B)
+        result = SpGEMMPlan.build(A, B).execute(A, B)
+        
+        self.assertEqual(result.col_index, expected.col_index)
+        self.assertEqual(result.row_ptr, expected.row_ptr)
+        for value, expected_value in zip(result.values, expected.values):
+            self.assertAlmostEqual(value, expected_value, places=10)
+    
+    def test_reuse_with_new_values(self):
+        plan = SpGEMMPlan.build(self.A, self.B)
+        
+        A2 = SparseMatrixCSR([v * 2 for v in self.A.values], self.A.col_index, self.A.row_ptr, self.A.shape)
+        
+        self.assertEqual(plan.execute(self.A, self.B).to_dense(), [[15, 0, 0], [0, 32, 0], [0, 8, 2]])
+        self.assertEqual(plan.execute(A2, self.B).to_dense(), [[30, 0, 0], [0, 64, 0], [0, 16, 4]])
+    
+    def test_compact(self):
+        A = self.A.to_compact('int32')
+        B = self.B.to_compact('int32')
+        
+        C = SpGEMMPlan.build(A, B).execute(A, B)
+        
+        self.assertTrue(C.is_compact())
+        self.assertEqual(C.values.typecode, 'i')
+        self.assertEqual(C.to_dense(), [[15, 0, 0], [0, 32, 0], [0, 8, 2]])
+    
+    def test_shared_plan_across_threads(self):
+        A = SparseMatrixCSR.random(60, sparsity=0.8, dtype='int64')
+        B = SparseMatrixCSR.random(60, sparsity=0.8, dtype='int64')
+        plan = SpGEMMPlan.build(A, B)
+        expected = plan.execute(A, B).values
+        
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(4) as pool:
+                results = list(pool.map(lambda _: plan.execute(A, B).values, range(8)))
+        finally:
+            sys.setswitchinterval(interval)
+        
+        for values in results:
+            self.assertEqual(values, expected)
+    
+    def test_plan_mismatch(self):
+        plan = SpGEMMPlan.build(self.A, self.B)
+        other = SparseMatrixCSR.from_dense([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        
+        with self.assertRaises(ValueError):
+            plan.execute(other, self.B)
+    
+    def test_plan_pattern_mismatch(self):
+        plan = SpGEMMPlan.build(self.A, self.B)
+        # Same shape and number of entries, different columns.
+        moved = SparseMatrixCSR.from_dense([[5, 0, 0], [0, 0, 8], [1, 0, 2]])
+        
+        with self.assertRaises(ValueError):
+            plan.execute(moved, self.B)
+    
+    def test_pattern_key_memoised(self):
+        key = spgemm.pattern_key(self.A)
+        
+        self.assertIs(spgemm.pattern_key(self.A), key)
+        self.assertEqual(spgemm.pattern_key(SparseMatrixCSR([1] * 4, list(self.A.col_index), list(self.A.row_ptr), (3, 3))), key)
+        
+        self.A.col_index = [0, 2, 0, 2]
+        self.assertNotEqual(spgemm.pattern_key(self.A), key)
+    
+    def test_incompatible_dimensions(self):
+        with self.assertRaises(ValueError):
+            SpGEMMPlan.build(self.A, SparseMatrixCSR.from_dense([[1, 2]]))
+
+
+class TestPlanCache(unittest.TestCase):
+    
+    def test_hits_on_same_pattern(self):
+        cache = PlanCache()
+        A = SparseMatrixCSR.random(30, sparsity=0.8)
+        B = SparseMatrixCSR.random(30, sparsity=0.8)
+        
+        first = A.multiply_planned(B, cache)
+        A2 = SparseMatrixCSR([v + 1 for v in A.values], list(A.col_index), list(A.row_ptr), A.shape)
+        second = A2.multiply_planned(B, cache)
+        
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(second.col_index, first.col_index)
+        expected = A2.multiply(B)
+        for value, expected_value in zip(second.values, expected.values):
+            self.assertAlmostEqual(value, expected_value, places=10)
+    
+    def test_eviction(self):
+        cache = PlanCache(max_plans=2)
+        B = SparseMatrixCSR.random(20, sparsity=0.8)
+        
+        for _ in range(3):
+            SparseMatrixCSR.random(20, sparsity=0.8).multiply_planned(B, cache)
+        
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.misses, 3)
+
+
+class TestAdaptiveAccumulators(unittest.TestCase):
+    
+    def product(self, kernel, A, B, merge=False):
+        n_cols = B.shape[1]
+        values, col_index, row_ptr = [], [], [0]
+        kernel(A.row_ptr, A.col_index, A.values, B.row_ptr, B.col_index, B.values, n_cols,
+               0, A.shape[0], values, col_index, row_ptr, [0] * n_cols, [-1] * n_cols, merge)
+        return values, col_index, row_ptr
+    
+    def test_kernels_match_gustavson(self):
+        A = SparseMatrixCSR.structured('power-law', 80, 0.95, seed=1)
+        B = SparseMatrixCSR.random(80, 0.8, seed=2)
+        expected = self.product(gustavson_rows, A, B)
+        
+        for strategy, kernel in ROW_KERNELS.items():
+            for merge in [False, True]:
+                with self.subTest(strategy=strategy, merge=merge):
+                    self.assertEqual(self.product(kernel, A, B, merge), expected)
+    
+    def test_rows_sorted(self):
+        A = SparseMatrixCSR.random(30, 0.7, seed=1)
+        
+        self.assertTrue(rows_sorted(A.row_ptr, A.col_index))
+        self.assertTrue(rows_sorted([0, 0, 2], [0, 4]))
+        self.assertFalse(rows_sorted([0, 2, 3], [2, 1, 0]))
+        self.assertFalse(rows_sorted([0, 2], [1, 1]))
+    
+    def test_choose_accumulators(self):
+        # Rows 0-1 have one term of A over long sorted rows of B, row 2 fills the row and
+        # row 3 only touches a few columns.
+        dense_row = [1] * 8
+        A = SparseMatrixCSR.from_dense([[1, 0, 0, 0], [0, 0, 0, 2], [1, 1, 1, 1], [0, 1, 0, 1]])
+        B = SparseMatrixCSR.from_dense([dense_row, [1, 0, 0, 0, 0, 0, 0, 0], dense_row, [0, 1, 0, 0, 0, 0, 0, 0]])
+        
+        strategies = choose_accumulators(A.row_ptr, A.col_index, B.row_ptr, B.col_index, 8)
+        
+        self.assertEqual(strategies, [MERGE, MERGE, DENSE_ARRAY, SORTED_ARRAY])
+    
+    def test_choose_hash_for_wide_rows(self):
+        n_cols = spgemm.HASH_MIN_COLS
+        A = SparseMatrixCSR([1.0, 2.0, 3.0], [0, 1, 1], [0, 2, 3], (2, 2))
+        B = SparseMatrixCSR([1.0, 1.0, 1.0], [5, 9, n_cols - 1], [0, 2, 3], (2, n_cols))
+        
+        self.assertEqual(choose_accumulators(A.row_ptr, A.col_index, B.row_ptr, B.col_index, n_cols), [HASH, HASH])
+        
+        values, col_index, row_ptr = [], [], [0]
+        adaptive_rows(A.row_ptr, A.col_index, A.values, B.row_ptr, B.col_index, B.values, n_cols,
+                      0, 2, values, col_index, row_ptr)
+        
+        self.assertEqual((values, col_index, row_ptr), ([1.0, 1.0, 2.0, 3.0], [5, 9, n_cols - 1, n_cols - 1], [0, 3, 4]))
+    
+    def test_estimate_drives_choice(self):
+        A = SparseMatrixCSR.random(40, 0.8, seed=3)
+        B = SparseMatrixCSR.random(40, 0.8, seed=4)
+        
+        self.assertEqual(set(choose_accumulators(A.row_ptr, A.col_index, B.row_ptr, B.col_index, 40, nnz=[40] * 40)), {DENSE_ARRAY})
+        self.assertEqual(set(choose_accumulators(A.row_ptr, A.col_index, B.row_ptr, B.col_index, 40, nnz=[1] * 40)), {SORTED_ARRAY})
+    
+    def test_multiply_matches_gustavson(self):
+        for structure in ['uniform', 'power-law', 'banded', 'block-diagonal', 'stencil-2d']:
+            with self.subTest(structure=structure):
+                A = SparseMatrixCSR.structured(structure, 100, 0.7, seed=5)
+                B = SparseMatrixCSR.structured(structure, 100, 0.7, seed=6)
+                C = A.multiply(B)
+                
+                expected = self.product(gustavson_rows, A, B)
+                self.assertEqual((C.values, C.col_index, C.row_ptr), expected)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
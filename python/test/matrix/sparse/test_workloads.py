@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+from python.src.matrix.sparse import workloads
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+class TestWorkloads(unittest.TestCase):
+    
+    def assertValidCSR(self, values, col_index, row_ptr, n):
+        self.assertEqual(len(row_ptr), n + 1)
+        self.assertEqual(row_ptr[-1], len(values))
+        self.assertEqual(len(col_index), len(values))
+        for i in range(n):
+            row = col_index[row_ptr[i]:row_ptr[i + 1]]
+            self.assertEqual(row, sorted(set(row)))
+            self.assertTrue(all(0 <= j < n for j in row))
+    
+    def test_all_structures_valid(self):
+        for structure in workloads.STRUCTURES:
+            with self.subTest(structure=structure):
+                self.assertValidCSR(*workloads.generate(structure, 128, 0.9, seed=1), 128)
+    
+    def test_banded(self):
+        values, col_index, row_ptr = workloads.banded(10, 1, seed=2)
+        
+        self.assertEqual(col_index[row_ptr[0]:row_ptr[1]], [0, 1])
+        self.assertEqual(col_index[row_ptr[5]:row_ptr[6]], [4, 5, 6])
+        self.assertEqual(len(values), 28)
+    
+    def test_block_diagonal(self):
+        _, col_index, row_ptr = workloads.block_diagonal(10, 4, seed=3)
+        
+        self.assertEqual(col_index[row_ptr[5]:row_ptr[6]], [4, 5, 6, 7])
+        self.assertEqual(col_index[row_ptr[9]:row_ptr[10]], [8, 9])
+    
+    def test_block_sparse(self):
+        values, col_index, row_ptr = workloads.block_sparse(64, 4, 0.75, seed=4)
+        self.assertValidCSR(values, col_index, row_ptr, 64)
+        
+        for i in range(0, 64, 4):
+            rows = {tuple(col_index[row_ptr[r]:row_ptr[r + 1]]) for r in range(i, i + 4)}
+            self.assertEqual(len(rows), 1)
+            self.assertTrue(all(len(row) % 4 == 0 and row[0] % 4 == 0 for row in rows if row))
+        self.assertAlmostEqual(len(values) / 64 ** 2, 0.25, delta=0.1)
+    
+    def test_grid_dims(self):
+        self.assertEqual(workloads.grid_dims(64, 2), (8, 8))
+        self.assertEqual(workloads.grid_dims(1000, 3), (10, 10, 10))
+        for n in [128, 2048, 97]:
+            with self.subTest(n=n):
+                shape = workloads.grid_dims(n, 3)
+                self.assertLessEqual(int(np.prod(shape)), n)
+                self.assertGreaterEqual(min(shape), int(n ** (1 / 3)))
+    
+    def test_stencil_prime_size(self):
+        self.assertEqual(workloads.grid_dims(97, 2), (9, 10))
+        values, col_index, row_ptr = workloads.stencil(97, 2)
+        self.assertValidCSR(values, col_index, row_ptr, 97)
+        
+        degrees = np.diff(row_ptr)
+        self.assertEqual(max(degrees), 5)
+        self.assertTrue(all(degrees[90:] == 1))
+        self.assertEqual(col_index[row_ptr[95]:row_ptr[96]], [95])
+    
+    def test_stencil_laplacian(self):
+        values, col_index, row_ptr = workloads.stencil(16, 2)
+        A = SparseMatrixSciPy._from_arrays(values, col_index, row_ptr, (16, 16)).to_dense()
+        
+        np.testing.assert_array_equal(A, A.T)
+        self.assertEqual(A[5, 5], 4)
+        self.assertEqual(max(np.diff(row_ptr)), 5)
+        self.assertEqual(max(np.diff(workloads.stencil(64, 3)[2])), 7)
+    
+    def test_power_law_skew(self):
+        values, _, row_ptr = workloads.generate('power-law', 512, 0.95, seed=4)
+        degrees = np.diff(row_ptr)
+        
+        self.assertAlmostEqual(1 - len(values) / 512 ** 2, 0.95, delta=0.01)
+        self.assertGreater(degrees.max(), 5 * np.median(degrees))
+    
+    def test_permute_preserves_degrees(self):
+        values, col_index, row_ptr = workloads.banded(50, 3, seed=5)
+        permuted = workloads.permute(values, col_index, row_ptr, seed=6)
+        
+        self.assertValidCSR(*permuted, 50)
+        self.assertEqual(sorted(np.diff(permuted[2])), sorted(np.diff(row_ptr)))
+        self.assertEqual(sorted(permuted[0]), sorted(values))
+    
+    def test_pure_and_scipy_identical(self):
+        for structure in workloads.STRUCTURES:
+            with self.subTest(structure=structure):
+                A = SparseMatrixCSR.structured(structure, 64, 0.9, seed=7)
+                B = SparseMatrixSciPy.structured(structure, 64, 0.9, seed=7)
+                np.testing.assert_array_equal(B.to_dense(), np.array(A.to_dense()))
+    
+    def test_unknown_structure(self):
+        with self.assertRaises(ValueError):
+            workloads.generate('diagonal', 10)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
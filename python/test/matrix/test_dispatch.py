@@ -0,0 +1,133 @@
+import csv
+import os
+import tempfile
+import unittest
+import numpy as np
+from python.src.matrix.dense.matrix import DenseMatrix
+from python.src.matrix.dense.matrix_numpy import DenseMatrixNumPy
+from python.src.matrix.dispatch import (KERNELS, REPRESENTATIONS, CostModel, convert, decide, multiply,
+                                        numbers_non_zero, profile)
+from python.src.matrix.sparse.matrix_csr import SparseMatrixCSR
+from python.src.matrix.sparse.matrix_scipy import SparseMatrixSciPy
+
+
+def to_array(matrix):
+    if isinstance(matrix, DenseMatrix):
+        return np.array(matrix.data, dtype=float)
+    if isinstance(matrix, DenseMatrixNumPy):
+        return matrix.data
+    return np.array(matrix.to_dense(), dtype=float)
+
+
+class TestDispatch(unittest.TestCase):
+
+    def setUp(self):
+        self.A = SparseMatrixSciPy.random(40, 0.8, seed=1)
+        self.B = SparseMatrixSciPy.random(40, 0.8, seed=2)
+        self.expected = self.A.to_dense() @ self.B.to_dense()
+
+    def test_convert_round_trip(self):
+        for source in REPRESENTATIONS:
+            matrix = convert(self.A, source)
+            for target in REPRESENTATIONS:
+                with self.subTest(source=source, target=target):
+                    converted = convert(matrix, target)
+                    self.assertIs(type(converted), REPRESENTATIONS[target])
+                    np.testing.assert_array_equal(to_array(converted), self.A.to_dense())
+
+    def test_every_kernel_matches(self):
+        for kernel in KERNELS:
+            with self.subTest(kernel=kernel):
+                result, decision = multiply(convert(self.A, 'Dense-NumPy'), self.B, kernels=[kernel], report=True)
+                self.assertEqual(decision.kernel, kernel)
+                self.assertIs(type(result), REPRESENTATIONS[kernel])
+                np.testing.assert_array_almost_equal(to_array(result), self.expected, decimal=12)
+
+    def test_report_conversions(self):
+        A = convert(self.A, 'Dense-NumPy')
+
+        decision = decide(A, self.B, kernels=['Sparse-SciPy'])
+        self.assertEqual(decision.conversions, (('A', 'Dense-NumPy', 'Sparse-SciPy'),))
+
+        decision = decide(self.A, self.B, kernels=['Sparse-SciPy'])
+        self.assertEqual(decision.conversions, ())
+        self.assertEqual(decision.estimated_seconds, decision.candidates['Sparse-SciPy'])
+
+    def test_choice_follows_density(self):
+        sparse = decide(SparseMatrixSciPy.random(1000, 0.999, seed=3), SparseMatrixSciPy.random(1000, 0.999, seed=4))
+        self.assertEqual(sparse.kernel, 'Sparse-SciPy')
+
+        dense = decide(DenseMatrixNumPy.random(300), DenseMatrixNumPy.random(300))
+        self.assertEqual(dense.kernel, 'Dense-NumPy')
+
+        pure = decide(SparseMatrixCSR.random(200, 0.99, seed=5), SparseMatrixCSR.random(200, 0.99, seed=6),
+                      kernels=['Dense-Python', 'Sparse-CSR'])
+        self.assertEqual(pure.kernel, 'Sparse-CSR')
+
+    def test_conversion_cost_keeps_inputs(self):
+        # Prohibitive conversions keep the inputs in their own representation.
+        conversions = {(source, target): (1e3, 0.0, 0.0) for source in REPRESENTATIONS for target in REPRESENTATIONS}
+        model = CostModel(conversions=conversions)
+
+        for source in ['Dense-NumPy', 'Sparse-SciPy']:
+            with self.subTest(source=source):
+                decision = decide(convert(self.A, source), convert(self.B, source), model)
+                self.assertEqual(decision.kernel, source)
+                self.assertEqual(decision.conversions, ())
+
+    def test_profile(self):
+        A = SparseMatrixCSR.from_dense([[1, 0, 2], [0, 0, 0], [0, 3, 0]])
+        B = SparseMatrixCSR.from_dense([[1, 1, 0], [0, 0, 1], [1, 0, 0]])
+
+        p = profile(A, B)
+        self.assertEqual((p.rows, p.inner, p.cols, p.nnz_a, p.nnz_b, p.flops), (3, 3, 3, 3, 4, 4))
+        self.assertLessEqual(p.nnz_out, p.flops)
+
+        self.assertEqual(numbers_non_zero(DenseMatrix([[0, 1.5], [0.0, 2]])), 2)
+
+    def test_non_square_skips_pure_dense(self):
+        A = SparseMatrixCSR.from_dense([[1, 0, 2], [0, 3, 0]])
+        B = SparseMatrixCSR.from_dense([[1, 0], [0, 1], [1, 1]])
+
+        result, decision = multiply(A, B, kernels=['Dense-Python', 'Sparse-CSR'], report=True)
+
+        self.assertNotIn('Dense-Python', decision.candidates)
+        self.assertEqual(result.to_dense(), [[3, 2], [0, 3]])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            multiply(self.A, SparseMatrixSciPy.random(30, 0.8))
+        with self.assertRaises(ValueError):
+            multiply(self.A, self.B, kernels=['Dense-Fortran'])
+        with self.assertRaises(ValueError):
+            multiply(self.A.to_dense(), self.B)
+
+    def test_calibration_from_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            kernel_csv = os.path.join(directory, "dense_vs_sparse.csv")
+            conversion_csv = os.path.join(directory, "conversion_costs.csv")
+
+            with open(kernel_csv, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(["Size", "Sparsity", "ActualSparsity", "NonZeroElements", "Algorithm", "AvgTimeSeconds",
+                                 "AvgMemoryMB", "DType", "Structure"])
+                for n in [64, 128, 256, 512]:
+                    writer.writerow([n, 0.5, 0.5, n * n // 2, 'Dense-NumPy', 2e-10 * n ** 3, 1, 'float64', 'uniform'])
+                    writer.writerow([n, 0.5, 0.5, n * n // 2, 'Dense-NumPy', 1.0, 1, 'float32', 'uniform'])
+
+            with open(conversion_csv, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(["Source", "Target", "Rows", "Cols", "NonZeroElements", "Run", "TimeSeconds"])
+                for n in [64, 128, 256, 512]:
+                    writer.writerow(['Dense-NumPy', 'Sparse-SciPy', n, n, n, 1, 1e-3 + 1e-8 * n * n])
+
+            model = CostModel.from_csv(kernel_csv, conversion_csv)
+
+        self.assertAlmostEqual(model.kernels['Dense-NumPy'][2] / 2e-10, 1, places=6)
+        self.assertAlmostEqual(model.conversions[('Dense-NumPy', 'Sparse-SciPy')][0] / 1e-3, 1, places=6)
+        self.assertAlmostEqual(model.conversions[('Dense-NumPy', 'Sparse-SciPy')][1] / 1e-8, 1, places=6)
+        self.assertEqual(model.kernels['Sparse-SciPy'], CostModel().kernels['Sparse-SciPy'])
+
+
+if __name__ == '__main__':
+    unittest.main()